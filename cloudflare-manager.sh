@@ -783,27 +783,42 @@ detailed_status() {
     # Check connectivity
     if check_unified_status; then
         echo "=== Connectivity Test ==="
-        echo -n "  Local endpoint (http://localhost:8000/health): "
-        if curl -s -o /dev/null -w "%{http_code}" http://localhost:8000/health | grep -q "200"; then
-            echo "${GREEN}OK${NC}"
-        else
-            echo "${RED}FAILED${NC}"
-        fi
 
         # Quick Tunnel URL test if running
+        URL=""
         QUICK_PID_FILE="/tmp/quick_tunnel.pid"
         if [ -f "$QUICK_PID_FILE" ] && ps -p "$(cat $QUICK_PID_FILE)" > /dev/null 2>&1; then
             QUICK_LOG_FILE="$LOG_DIR/quick_tunnel.log"
             URL=$(grep -o "https://.*\.trycloudflare\.com" "$QUICK_LOG_FILE" 2>/dev/null | tail -1)
-            if [ -n "$URL" ]; then
-                echo -n "  Tunnel endpoint ($URL/health): "
-                if curl -s -o /dev/null -w "%{http_code}" "$URL/health" | grep -q "200"; then
-                    echo "${GREEN}OK${NC}"
-                else
-                    echo "${YELLOW}PENDING${NC} (터널이 아직 준비 중일 수 있습니다)"
-                fi
+        fi
+
+        # 로컬/터널 헬스 체크를 동시에 요청 (터널 왕복 시간만큼만 대기)
+        LOCAL_CODE_FILE=$(mktemp)
+        TUNNEL_CODE_FILE=$(mktemp)
+        curl -s -o /dev/null -w "%{http_code}" http://localhost:8000/health > "$LOCAL_CODE_FILE" &
+        CHECK_PIDS=$!
+        if [ -n "$URL" ]; then
+            curl -s -o /dev/null -w "%{http_code}" "$URL/health" > "$TUNNEL_CODE_FILE" &
+            CHECK_PIDS="$CHECK_PIDS $!"
+        fi
+        wait $CHECK_PIDS
+
+        echo -n "  Local endpoint (http://localhost:8000/health): "
+        if grep -q "200" "$LOCAL_CODE_FILE"; then
+            echo "${GREEN}OK${NC}"
+        else
+            echo "${RED}FAILED${NC}"
+        fi
+
+        if [ -n "$URL" ]; then
+            echo -n "  Tunnel endpoint ($URL/health): "
+            if grep -q "200" "$TUNNEL_CODE_FILE"; then
+                echo "${GREEN}OK${NC}"
+            else
+                echo "${YELLOW}PENDING${NC} (터널이 아직 준비 중일 수 있습니다)"
             fi
         fi
+        rm -f "$LOCAL_CODE_FILE" "$TUNNEL_CODE_FILE"
     fi
 }
 
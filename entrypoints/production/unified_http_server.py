@@ -12,6 +12,7 @@ import json
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import uvicorn
@@ -986,10 +987,17 @@ class UnifiedMCPServer:
                     dcr_service._execute_query(
                         """
                         INSERT INTO dcr_tokens (
-                            dcr_token_value, dcr_client_id, dcr_token_type, azure_object_id, expires_at, dcr_status
-                        ) VALUES (?, ?, 'Bearer', ?, ?, 'active')
+                            dcr_token_value, dcr_client_id, dcr_token_type, azure_object_id, expires_at, dcr_status,
+                            dcr_token_hash
+                        ) VALUES (?, ?, 'Bearer', ?, ?, 'active', ?)
                         """,
-                        (crypto.account_encrypt_sensitive_data(new_access_token), client_id, azure_object_id, token_expiry),
+                        (
+                            crypto.account_encrypt_sensitive_data(new_access_token),
+                            client_id,
+                            azure_object_id,
+                            token_expiry,
+                            dcr_service.hash_token(new_access_token),
+                        ),
                     )
 
                     # Reuse existing refresh token (이미 검증된 유효한 토큰 재사용)
@@ -1124,14 +1132,16 @@ class UnifiedMCPServer:
                     dcr_service._execute_query(
                         """
                         INSERT INTO dcr_tokens (
-                            dcr_token_value, dcr_client_id, dcr_token_type, azure_object_id, expires_at, dcr_status
-                        ) VALUES (?, ?, 'Bearer', ?, ?, 'active')
+                            dcr_token_value, dcr_client_id, dcr_token_type, azure_object_id, expires_at, dcr_status,
+                            dcr_token_hash
+                        ) VALUES (?, ?, 'Bearer', ?, ?, 'active', ?)
                         """,
                         (
                             encrypted_access_token,  # 암호화된 토큰 저장
                             client_id,
                             azure_object_id,
                             token_expiry,
+                            dcr_service.hash_token(access_token),  # 조회용 해시
                         ),
                     )
                     logger.info(f"✨ Created new Bearer token (encrypted) for client: {client_id}, user: {azure_object_id}")
@@ -1152,14 +1162,16 @@ class UnifiedMCPServer:
                 dcr_service._execute_query(
                     """
                     INSERT INTO dcr_tokens (
-                        dcr_token_value, dcr_client_id, dcr_token_type, azure_object_id, expires_at, dcr_status
-                    ) VALUES (?, ?, 'refresh', ?, ?, 'active')
+                        dcr_token_value, dcr_client_id, dcr_token_type, azure_object_id, expires_at, dcr_status,
+                        dcr_token_hash
+                    ) VALUES (?, ?, 'refresh', ?, ?, 'active', ?)
                     """,
                     (
                         crypto.account_encrypt_sensitive_data(refresh_token),  # Store encrypted for security
                         client_id,
                         azure_object_id,
                         refresh_token_expiry,
+                        dcr_service.hash_token(refresh_token),  # 조회용 해시
                     ),
                 )
 
@@ -1722,8 +1734,14 @@ Error: {error_details}</pre>
         # Add dashboard routes
         routes.extend(dashboard_routes)
 
+        # Mount된 하위 앱의 lifespan은 실행되지 않으므로 종료 정리를 여기서 호출
+        @asynccontextmanager
+        async def lifespan(app):
+            yield
+            await self.onedrive_server.handlers.aclose()
+
         # Create Starlette app
-        app = Starlette(routes=routes)
+        app = Starlette(routes=routes, lifespan=lifespan)
 
         # OAuth 인증 미들웨어 적용 (환경변수로 제어)
         enable_oauth = os.getenv("ENABLE_OAUTH_AUTH", "false").lower() == "true"
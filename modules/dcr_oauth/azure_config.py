@@ -21,6 +21,17 @@ def ensure_dcr_schema(service) -> None:
         with open(schema_path, "r") as f:
             schema_sql = f.read()
         conn.executescript(schema_sql)
+
+        # Add dcr_token_hash column if it doesn't exist (for existing databases)
+        try:
+            conn.execute("ALTER TABLE dcr_tokens ADD COLUMN dcr_token_hash TEXT")
+            logger.info("✅ Added dcr_token_hash column to dcr_tokens table")
+        except sqlite3.OperationalError as e:
+            if "duplicate column name" not in str(e).lower():
+                raise
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_dcr_tokens_hash ON dcr_tokens(dcr_token_hash)"
+        )
         conn.commit()
         conn.close()
         logger.info("✅ DCR V3 schema initialized")
@@ -896,99 +896,125 @@ class DCRService:
             "azure_object_id": azure_object_id,
         }
 
-    def verify_refresh_token(
-        self, refresh_token: str, dcr_client_id: str
-    ) -> Optional[Dict[str, Any]]:
-        """DCR Refresh 토큰 검증 (RFC 6749)
+    @staticmethod
+    def hash_token(token: str) -> str:
+        """Bearer/refresh 토큰 조회용 SHA-256 해시 (dcr_tokens.dcr_token_hash)
 
-        Args:
-            refresh_token: DCR refresh token (평문)
-            dcr_client_id: DCR 클라이언트 ID
+        토큰 값은 복호화 가능한 형태(비결정적 암호문)로 저장되므로 WHERE 절로
+        찾을 수 없어, 평문의 해시를 별도 컬럼에 두고 인덱스로 조회한다.
+        """
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
-        Returns:
-            토큰 정보 (azure_object_id, scope, user_name 포함) 또는 None
+    def _find_active_token(
+        self, token: str, token_type: str, columns: Tuple[str, ...]
+    ) -> Optional[Tuple]:
+        """dcr_token_hash 인덱스로 active 토큰을 찾아 columns 값을 반환
+
+        해시가 일치한 행도 복호화한 토큰과 다시 비교한다. 해시 컬럼 도입 전에
+        저장된 토큰(dcr_token_hash IS NULL)은 기존처럼 복호화 비교로 찾고,
+        찾으면 해시를 채워 다음부터는 인덱스로 조회되게 한다.
         """
-        # DCR refresh token은 암호화되어 저장되므로 모든 active refresh token을 조회
-        query = """
-        SELECT dcr_client_id, dcr_token_value, azure_object_id, metadata, expires_at, dcr_status
+        base_query = f"""
+        SELECT dcr_token_value, dcr_token_hash, {", ".join(columns)}
         FROM dcr_tokens
-        WHERE dcr_token_type = 'refresh'
+        WHERE dcr_token_type = ?
           AND dcr_status = 'active'
           AND expires_at > CURRENT_TIMESTAMP
         """
+        token_hash = self.hash_token(token)
 
-        results = self._fetch_all(query)
-
+        results = self._fetch_all(
+            base_query + "  AND dcr_token_hash = ?", (token_type, token_hash)
+        )
         if not results:
-            logger.warning(f"❌ No active refresh tokens found in DB")
-            return None
-
-        # 암호화된 토큰을 하나씩 복호화하여 비교
-        for row in results:
-            (
-                stored_client_id,
-                encrypted_token,
-                azure_object_id,
-                metadata_str,
-                expires_at,
-                status,
-            ) = row
+            results = self._fetch_all(
+                base_query + "  AND dcr_token_hash IS NULL", (token_type,)
+            )
 
+        for encrypted_token, stored_hash, *values in results:
             try:
-                # 복호화
                 decrypted_token = self.crypto.account_decrypt_sensitive_data(
                     encrypted_token
                 )
+            except Exception as e:
+                logger.error(f"❌ Error decrypting {token_type} token: {e}")
+                continue
 
-                # 토큰 비교
-                if not secrets.compare_digest(decrypted_token, refresh_token):
-                    continue
-
-                # 클라이언트 ID 확인
-                if stored_client_id != dcr_client_id:
-                    logger.warning(f"❌ Refresh token client ID mismatch")
-                    return None
-
-                # 메타데이터 파싱
-                metadata = json.loads(metadata_str) if metadata_str else {}
-
-                # Azure Object ID가 없으면 에러
-                if not azure_object_id:
-                    logger.warning(f"❌ Refresh token has no azure_object_id")
-                    return None
-
-                # scope 가져오기 (metadata 또는 dcr_clients 테이블에서)
-                scope = metadata.get("scope")
-                if not scope:
-                    # dcr_clients에서 scope 조회
-                    client = self.get_client(dcr_client_id)
-                    scope = client.get("dcr_requested_scope", "")
-
-                # user_name 가져오기 (dcr_azure_users 테이블에서)
-                user_query = """
-                SELECT user_name FROM dcr_azure_users WHERE object_id = ?
-                """
-                user_result = self._fetch_one(user_query, (azure_object_id,))
-                user_name = user_result[0] if user_result else None
+            if not secrets.compare_digest(decrypted_token, token):
+                continue
 
-                logger.info(
-                    f"✅ Refresh token verified for client: {dcr_client_id}, user: {azure_object_id}"
+            if stored_hash is None:
+                self._execute_query(
+                    "UPDATE dcr_tokens SET dcr_token_hash = ? WHERE dcr_token_value = ?",
+                    (token_hash, encrypted_token),
                 )
+            return tuple(values)
 
-                return {
-                    "azure_object_id": azure_object_id,
-                    "scope": scope,
-                    "user_name": user_name,
-                }
+        return None
 
-            except Exception as e:
-                logger.error(f"❌ Error decrypting refresh token: {e}")
-                continue
+    def verify_refresh_token(
+        self, refresh_token: str, dcr_client_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """DCR Refresh 토큰 검증 (RFC 6749)
+
+        Args:
+            refresh_token: DCR refresh token (평문)
+            dcr_client_id: DCR 클라이언트 ID
 
-        logger.warning(
-            f"❌ No matching refresh token found for client: {dcr_client_id}"
+        Returns:
+            토큰 정보 (azure_object_id, scope, user_name 포함) 또는 None
+        """
+        row = self._find_active_token(
+            refresh_token, "refresh", ("dcr_client_id", "azure_object_id", "metadata")
         )
-        return None
+        if not row:
+            logger.warning(
+                f"❌ No matching refresh token found for client: {dcr_client_id}"
+            )
+            return None
+
+        stored_client_id, azure_object_id, metadata_str = row
+
+        # 클라이언트 ID 확인
+        if stored_client_id != dcr_client_id:
+            logger.warning(f"❌ Refresh token client ID mismatch")
+            return None
+
+        # 메타데이터 파싱
+        metadata = json.loads(metadata_str) if metadata_str else {}
+
+        # Azure Object ID가 없으면 에러
+        if not azure_object_id:
+            logger.warning(f"❌ Refresh token has no azure_object_id")
+            return None
+
+        try:
+            # scope 가져오기 (metadata 또는 dcr_clients 테이블에서)
+            scope = metadata.get("scope")
+            if not scope:
+                # dcr_clients에서 scope 조회
+                client = self.get_client(dcr_client_id)
+                scope = client.get("dcr_requested_scope", "")
+
+            # user_name 가져오기 (dcr_azure_users 테이블에서)
+            user_query = """
+            SELECT user_name FROM dcr_azure_users WHERE object_id = ?
+            """
+            user_result = self._fetch_one(user_query, (azure_object_id,))
+            user_name = user_result[0] if user_result else None
+        except Exception as e:
+            logger.error(f"❌ Error loading refresh token details: {e}")
+            return None
+
+        logger.info(
+            f"✅ Refresh token verified for client: {dcr_client_id}, user: {azure_object_id}"
+        )
+
+        return {
+            "azure_object_id": azure_object_id,
+            "scope": scope,
+            "user_name": user_name,
+        }
 
     def store_tokens(
         self,
@@ -1079,8 +1105,9 @@ class DCRService:
         # 3) dcr_tokens에 새 DCR access token 저장
         dcr_query = """
         INSERT INTO dcr_tokens (
-            dcr_token_value, dcr_client_id, dcr_token_type, azure_object_id, expires_at, dcr_status
-        ) VALUES (?, ?, 'Bearer', ?, ?, 'active')
+            dcr_token_value, dcr_client_id, dcr_token_type, azure_object_id, expires_at, dcr_status,
+            dcr_token_hash
+        ) VALUES (?, ?, 'Bearer', ?, ?, 'active', ?)
         """
 
         self._execute_query(
@@ -1090,6 +1117,7 @@ class DCRService:
                 dcr_client_id,
                 azure_object_id,
                 dcr_expires_at,
+                self.hash_token(dcr_access_token),
             ),
         )
 
@@ -1113,8 +1141,9 @@ class DCRService:
             refresh_expires = datetime.now(timezone.utc) + timedelta(days=30)
             refresh_query = """
             INSERT INTO dcr_tokens (
-                dcr_token_value, dcr_client_id, dcr_token_type, azure_object_id, expires_at, dcr_status
-            ) VALUES (?, ?, 'refresh', ?, ?, 'active')
+                dcr_token_value, dcr_client_id, dcr_token_type, azure_object_id, expires_at, dcr_status,
+                dcr_token_hash
+            ) VALUES (?, ?, 'refresh', ?, ?, 'active', ?)
             """
             self._execute_query(
                 refresh_query,
@@ -1123,6 +1152,7 @@ class DCRService:
                     dcr_client_id,
                     azure_object_id,
                     refresh_expires,
+                    self.hash_token(dcr_refresh_token),
                 ),
             )
 
@@ -1130,64 +1160,19 @@ class DCRService:
         """DCR Bearer 토큰 검증
 
         Note: dcr_token_value는 암호화되어 저장됨 (store_tokens 참조)
-        클라이언트가 보낸 Bearer 토큰을 복호화 후 비교
+        dcr_token_hash 인덱스로 후보 행을 찾은 뒤 복호화하여 비교
         """
-        query = """
-        SELECT dcr_client_id, dcr_token_value, azure_object_id
-        FROM dcr_tokens
-        WHERE dcr_token_type = 'Bearer'
-          AND dcr_status = 'active'
-          AND expires_at > CURRENT_TIMESTAMP
-        """
-
-        results = self._fetch_all(query)
-
-        logger.info(
-            f"🔍 [verify_bearer_token] Found {len(results) if results else 0} active tokens in DB"
-        )
-
-        if not results:
-            logger.warning(
-                f"⚠️ [verify_bearer_token] No active Bearer tokens found in DB"
-            )
+        row = self._find_active_token(token, "Bearer", ("dcr_client_id", "azure_object_id"))
+        if not row:
+            logger.warning(f"⚠️ [verify_bearer_token] No matching active Bearer token found")
             return None
 
-        for i, row in enumerate(results):
-            dcr_client_id, encrypted_token, azure_object_id = row
-            logger.info(
-                f"🔍 [verify_bearer_token] Checking token {i+1}/{len(results)} for client: {dcr_client_id}"
-            )
-
-            try:
-                # 암호화된 토큰 복호화
-                decrypted_token = self.crypto.account_decrypt_sensitive_data(
-                    encrypted_token
-                )
-
-                # 토큰 비교
-                if secrets.compare_digest(decrypted_token, token):
-                    logger.info(
-                        f"✅ [verify_bearer_token] Token matched for client: {dcr_client_id}"
-                    )
-                    return {
-                        "dcr_client_id": dcr_client_id,
-                        "azure_object_id": azure_object_id,
-                    }
-                else:
-                    logger.info(
-                        f"❌ [verify_bearer_token] Token did NOT match for client: {dcr_client_id}"
-                    )
-            except Exception as e:
-                logger.error(
-                    f"❌ [verify_bearer_token] Token comparison error for client {dcr_client_id}: {e}",
-                    exc_info=True,
-                )
-                continue
-
-        logger.warning(
-            f"⚠️ [verify_bearer_token] No matching token found after checking all {len(results)} tokens"
-        )
-        return None
+        dcr_client_id, azure_object_id = row
+        logger.info(f"✅ [verify_bearer_token] Token matched for client: {dcr_client_id}")
+        return {
+            "dcr_client_id": dcr_client_id,
+            "azure_object_id": azure_object_id,
+        }
 
     def get_azure_tokens_by_object_id(
         self, azure_object_id: str
@@ -64,6 +64,7 @@ CREATE TABLE IF NOT EXISTS dcr_tokens (
     expires_at DATETIME NOT NULL,
     issued_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     metadata TEXT,                        -- JSON (PKCE, redirect_uri, state 등)
+    dcr_token_hash TEXT,                  -- 평문 토큰의 SHA-256 (Bearer/refresh 조회용, 인덱스는 ensure_dcr_schema에서 생성)
     FOREIGN KEY (dcr_client_id) REFERENCES dcr_clients(dcr_client_id) ON DELETE CASCADE,
     FOREIGN KEY (azure_object_id) REFERENCES dcr_azure_users(object_id) ON DELETE SET NULL
 );
@@ -5,14 +5,26 @@ PKCE helper for DCR OAuth module.
 import base64
 import hashlib
 import secrets
+from typing import Tuple
+
+
+def _s256_challenge(code_verifier: bytes) -> bytes:
+    # 해시 → base64url 까지 bytes로 처리하고 패딩만 제거
+    return base64.urlsafe_b64encode(hashlib.sha256(code_verifier).digest()).rstrip(b"=")
+
+
+def generate_pkce() -> Tuple[str, str]:
+    """Create an S256 (code_verifier, code_challenge) pair"""
+    # token_urlsafe는 이미 패딩 없는 base64url 문자열 (32바이트 → 43자)
+    code_verifier = secrets.token_urlsafe(32)
+    code_challenge = _s256_challenge(code_verifier.encode("ascii")).decode("ascii")
+    return code_verifier, code_challenge
 
 
 def verify_pkce(code_verifier: str, code_challenge: str, method: str = "plain") -> bool:
     if method == "plain":
         return secrets.compare_digest(code_verifier, code_challenge)
     if method == "S256":
-        digest = hashlib.sha256(code_verifier.encode("utf-8")).digest()
-        calculated_challenge = base64.urlsafe_b64encode(digest).decode("utf-8").rstrip("=")
-        return secrets.compare_digest(calculated_challenge, code_challenge)
+        calculated_challenge = _s256_challenge(code_verifier.encode("utf-8"))
+        return secrets.compare_digest(calculated_challenge, code_challenge.encode("utf-8"))
     return False
-
@@ -65,6 +65,7 @@ from .account import (
     AccountCryptoHelpers,
     AccountFileHelpers,
     AccountAuditHelpers,
+    YamlSafeLoader,
 )
 
 # MCP Server
@@ -129,6 +130,7 @@ __all__ = [
     "AccountCryptoHelpers",
     "AccountFileHelpers",
     "AccountAuditHelpers",
+    "YamlSafeLoader",
     # MCP Server
     "AuthAccountHandlers",
     "HTTPStreamingAuthServer",
@@ -4,6 +4,7 @@ from ._account_helpers import (
     AccountAuditHelpers,
     AccountCryptoHelpers,
     AccountFileHelpers,
+    YamlSafeLoader,
 )
 from .account_orchestrator import AccountOrchestrator
 from .account_repository import AccountRepository
@@ -45,4 +46,5 @@ __all__ = [
     "AccountCryptoHelpers",
     "AccountFileHelpers",
     "AccountAuditHelpers",
+    "YamlSafeLoader",
 ]
@@ -4,21 +4,32 @@ Account 모듈의 헬퍼 클래스들
 350줄 제한 규칙 준수를 위해 분리된 유틸리티 클래스들을 정의합니다.
 """
 
+import copy
 import hashlib
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 from cryptography.fernet import Fernet
 
+# libyaml C 파서가 설치되어 있으면 사용하고, 없으면 순수 Python SafeLoader로 대체
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
 from infra.core.config import get_config
 from infra.core.logger import get_logger
 
 logger = get_logger(__name__)
 config = get_config()
 
+# 파일별 마지막 파싱 결과 {file_path: ((mtime_ns, size), sha256, data)}
+# - mtime/크기가 같으면 파일을 다시 읽지 않고, 내용(해시)이 같으면 재파싱 생략
+_enrollment_parse_cache: Dict[str, Tuple[Tuple[int, int], str, Dict[str, Any]]] = {}
+
 
 class AccountFileHelpers:
     """파일 관련 헬퍼 클래스"""
@@ -34,15 +45,53 @@ class AccountFileHelpers:
         Returns:
             Dict[str, Any]: 파일 내용
 
+        Raises:
+            FileNotFoundError: 파일이 없는 경우
+            yaml.YAMLError: YAML 파싱 오류
+        """
+        data, _ = AccountFileHelpers.account_read_enrollment_file_with_hash(file_path)
+        return data
+
+    @staticmethod
+    def account_read_enrollment_file_with_hash(
+        file_path: str,
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Enrollment YAML 파일을 한 번만 읽어 내용과 SHA256 해시를 함께 반환
+
+        mtime/크기가 이전과 같으면 파일을 읽지 않고, 해시가 이전과 같으면 YAML을 다시
+        파싱하지 않고 캐시된 결과(복사본)를 반환합니다.
+
+        Args:
+            file_path: YAML 파일 경로
+
+        Returns:
+            Tuple[Dict[str, Any], str]: (파일 내용, SHA256 해시값)
+
         Raises:
             FileNotFoundError: 파일이 없는 경우
             yaml.YAMLError: YAML 파싱 오류
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                data = yaml.safe_load(file)
+            path = Path(file_path)
+            stat = path.stat()
+            file_state = (stat.st_mtime_ns, stat.st_size)
+
+            cached = _enrollment_parse_cache.get(str(file_path))
+            if cached and cached[0] == file_state:
+                logger.debug(f"enrollment 파일 변경 없음, 캐시 사용: {file_path}")
+                return copy.deepcopy(cached[2]), cached[1]
+
+            raw = path.read_bytes()
+            file_hash = hashlib.sha256(raw).hexdigest()
+
+            if cached and cached[1] == file_hash:
+                data = cached[2]
+            else:
+                data = yaml.load(raw, Loader=YamlSafeLoader)
                 logger.debug(f"enrollment 파일 읽기 성공: {file_path}")
-                return data
+            _enrollment_parse_cache[str(file_path)] = (file_state, file_hash, data)
+            return copy.deepcopy(data), file_hash
         except FileNotFoundError:
             logger.error(f"enrollment 파일을 찾을 수 없습니다: {file_path}")
             raise
@@ -510,11 +510,12 @@ class AccountOrchestrator:
                     # YAML 파일도 업데이트 (검증된 scope만 사용)
                     import yaml
                     import traceback
+                    from ._account_helpers import YamlSafeLoader
                     yaml_path = existing_account.enrollment_file_path
                     if yaml_path and yaml_path != "<ENV_AUTO_REGISTERED>":
                         try:
                             with open(yaml_path, 'r') as f:
-                                yaml_data = yaml.safe_load(f)
+                                yaml_data = yaml.load(f, Loader=YamlSafeLoader)
 
                             # 변경된 내용 업데이트 (검증된 권한만 저장)
                             yaml_data['oauth']['redirect_uri'] = account_data.oauth_redirect_uri
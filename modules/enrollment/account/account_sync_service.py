@@ -126,8 +126,10 @@ class AccountSyncService:
             Dict: 동기화 결과 {'success': bool, 'action': str, 'user_id': str, 'error': str}
         """
         try:
-            # 파일 읽기 및 검증
-            file_data = self.file_helper.account_read_enrollment_file(file_path)
+            # 파일 읽기 및 검증 (내용과 해시를 한 번의 읽기로 얻음)
+            file_data, file_hash = (
+                self.file_helper.account_read_enrollment_file_with_hash(file_path)
+            )
 
             if not self.file_helper.account_validate_enrollment_structure(file_data):
                 return {
@@ -137,9 +139,6 @@ class AccountSyncService:
                     "user_id": None,
                 }
 
-            # 파일 해시 계산
-            file_hash = self.file_helper.account_calculate_file_hash(file_path)
-
             # EnrollmentFileData 객체 생성
             enrollment_data = self._account_parse_enrollment_file(
                 file_data, file_path, file_hash
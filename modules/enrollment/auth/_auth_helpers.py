@@ -14,12 +14,15 @@ import subprocess
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qsl, urlparse
 
 from infra.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# UUID 포맷 (8-4-4-4-12 형식) - 검증 호출마다 다시 컴파일하지 않도록 모듈 로드 시 한 번만 컴파일
+_UUID_PATTERN = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+
 
 def auth_generate_session_id(user_id: str) -> str:
     """
@@ -131,14 +134,10 @@ def auth_parse_callback_params(callback_url: str) -> Dict[str, str]:
         파싱된 매개변수 딕셔너리
     """
     try:
-        parsed_url = urlparse(callback_url)
-        params = parse_qs(parsed_url.query)
-
-        # 단일 값으로 변환
+        # 단일 값으로 변환 (중복 키는 첫 번째 값 사용)
         result = {}
-        for key, value_list in params.items():
-            if value_list:
-                result[key] = value_list[0]
+        for key, value in parse_qsl(urlparse(callback_url).query):
+            result.setdefault(key, value)
 
         logger.debug(f"콜백 매개변수 파싱: {list(result.keys())}")
         return result
@@ -600,14 +599,11 @@ def auth_validate_oauth_credentials(
     Returns:
         (검증 성공 여부, 에러 메시지) 튜플
     """
-    # UUID 포맷 (8-4-4-4-12 형식)
-    uuid_pattern = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
-
     # 1. Client ID 검증 (UUID 포맷)
     if not client_id:
         return False, "❌ client_id가 비어있습니다"
 
-    if not uuid_pattern.match(client_id):
+    if not _UUID_PATTERN.match(client_id):
         return False, f"❌ client_id 포맷이 올바르지 않습니다: {client_id[:20]}...\n   예상 포맷: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx (UUID)"
 
     # 2. Client Secret 검증
@@ -616,7 +612,7 @@ def auth_validate_oauth_credentials(
         return False, "❌ client_secret이 비어있습니다"
 
     # ⚠️ client_secret에 UUID를 입력한 경우 (client_id와 혼동)
-    if uuid_pattern.match(client_secret):
+    if _UUID_PATTERN.match(client_secret):
         return False, (
             f"❌ client_secret에 UUID가 입력되었습니다\n"
             f"   입력값: {client_secret}\n"
@@ -628,7 +624,7 @@ def auth_validate_oauth_credentials(
     if not tenant_id:
         return False, "❌ tenant_id가 비어있습니다"
 
-    if not uuid_pattern.match(tenant_id):
+    if not _UUID_PATTERN.match(tenant_id):
         return False, f"❌ tenant_id 포맷이 올바르지 않습니다: {tenant_id[:20]}...\n   예상 포맷: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx (UUID)"
 
     # 모든 검증 통과
@@ -14,7 +14,7 @@ import threading
 from datetime import datetime, timezone
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import Any, Callable, Dict, Optional
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qsl, urlparse
 
 from infra.core.logger import get_logger
 
@@ -33,7 +33,7 @@ class CallbackHandler(BaseHTTPRequestHandler):
         if parsed_path.path == "/health":
             self._handle_health_check()
         elif parsed_path.path in ["/auth/callback", "/enrollment/callback"]:
-            self._handle_oauth_callback()
+            self._handle_oauth_callback(parsed_path.query)
         else:
             self.send_response(404)
             self.end_headers()
@@ -51,15 +51,12 @@ class CallbackHandler(BaseHTTPRequestHandler):
         }
         self.wfile.write(json.dumps(response).encode())
 
-    def _handle_oauth_callback(self):
-        """OAuth 콜백 처리"""
-        parsed_url = urlparse(self.path)
-        query_params = parse_qs(parsed_url.query)
-
-        # 쿼리 파라미터를 단일 값으로 변환
+    def _handle_oauth_callback(self, query: str):
+        """OAuth 콜백 처리 (do_GET에서 파싱한 쿼리 문자열 사용)"""
+        # 쿼리 파라미터를 단일 값으로 변환 (중복 키는 첫 번째 값 사용)
         params = {}
-        for key, values in query_params.items():
-            params[key] = values[0] if values else ""
+        for key, value in parse_qsl(query):
+            params.setdefault(key, value)
 
         logger.debug(f"OAuth 콜백 수신: {list(params.keys())}")
 
@@ -11,6 +11,7 @@ from infra.core.database import get_database_manager
 from infra.core.logger import get_logger
 from modules.enrollment import AccountOrchestrator
 from modules.enrollment import get_auth_orchestrator, AuthStartRequest
+from modules.enrollment import YamlSafeLoader
 from .account_validator import AccountValidator
 
 logger = get_logger(__name__)
@@ -295,7 +296,7 @@ start_authentication 툴로 OAuth 인증을 진행하세요."""
             for yaml_file in sorted(yaml_files):
                 try:
                     with open(yaml_file, 'r', encoding='utf-8') as f:
-                        data = yaml.safe_load(f)
+                        data = yaml.load(f, Loader=YamlSafeLoader)
 
                     # Handle both old and new structure
                     if 'account' in data:
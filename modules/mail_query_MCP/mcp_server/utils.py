@@ -1,8 +1,28 @@
 """Utility functions for MCP Server"""
 
+import functools
 import json
 from typing import Any, Dict
 
+# String spellings of booleans; exact-case hits skip the lower() call
+_TRUE_STRINGS = frozenset({"true", "True", "TRUE", "yes", "Yes", "YES", "y", "Y", "1"})
+_FALSE_STRINGS = frozenset({"false", "False", "FALSE", "no", "No", "NO", "n", "N", "0"})
+# Longest truthy spelling ("true"); anything longer can never match
+_MAX_TRUE_LEN = 4
+
+# Tool arguments that are coerced from string flags to bool
+_BOOL_FIELDS = frozenset(
+    {
+        "include_body",
+        "download_attachments",
+        "has_attachments_filter",
+        "execute",
+        "use_defaults",
+        "save_emails",
+        "save_csv",
+    }
+)
+
 
 def clean_backslashes(obj):
     """Clean backslashes from all string values recursively"""
@@ -15,10 +35,28 @@ def clean_backslashes(obj):
     return obj
 
 
+@functools.lru_cache(maxsize=256)
+def _str_to_bool(value: str) -> bool:
+    """Interpret a string flag: true/yes/y/1 in any case is True, anything else False"""
+    if value in _TRUE_STRINGS:
+        return True
+    # Empty string is falsy: a plain truth test, no set lookup
+    if not value or value in _FALSE_STRINGS:
+        return False
+    # Only short ASCII strings can case-fold to a truthy spelling; reject the rest without lower()
+    if len(value) > _MAX_TRUE_LEN or not value.isascii():
+        return False
+    return value.lower() in _TRUE_STRINGS
+
+
 def preprocess_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
-    """Preprocess arguments from Claude Desktop"""
+    """Preprocess arguments from Claude Desktop
+
+    Returns a new dict; the caller's ``arguments`` is never mutated, so no
+    defensive copy is needed before calling.
+    """
 
-    # Clean backslashes from all string values
+    # Clean backslashes from all string values (builds the new top-level dict)
     arguments = clean_backslashes(arguments)
 
     # Special handling for integer fields
@@ -56,21 +94,10 @@ def preprocess_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
         if key in arguments and arguments[key] == "null":
             arguments[key] = None
 
-    # Handle boolean fields
-    bool_fields = [
-        "include_body",
-        "download_attachments",
-        "has_attachments_filter",
-        "execute",
-        "use_defaults",
-        "save_emails",
-        "save_csv",
-    ]
-    for field in bool_fields:
-        if field in arguments:
-            if isinstance(arguments[field], str):
-                lower_value = arguments[field].lower()
-                arguments[field] = lower_value in ("true", "yes", "y", "1")
+    # Handle boolean fields (only the ones actually present in arguments)
+    for field in arguments.keys() & _BOOL_FIELDS:
+        if isinstance(arguments[field], str):
+            arguments[field] = _str_to_bool(arguments[field])
 
     # Set default query_context if not provided
     if "query_context" not in arguments:
@@ -72,8 +72,10 @@ async def main():
                 ),
             )
     except Exception as e:
-        logger.error(f"서버 실행 오류: {str(e)}")
+        logger.error(f"서버 실행 오류: {e}")
         raise
+    finally:
+        await handlers.aclose()
 
 
 if __name__ == "__main__":
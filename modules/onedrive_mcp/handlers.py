@@ -31,6 +31,10 @@ class OneDriveHandlers:
         self.onedrive_handler = OneDriveHandler()
         logger.info("✅ OneDriveHandlers initialized")
 
+    async def aclose(self):
+        """Close the shared Graph API HTTP client (server shutdown)"""
+        await self.onedrive_handler.close()
+
     # ========================================================================
     # MCP Protocol: list_tools
     # ========================================================================
@@ -243,8 +247,8 @@ class OneDriveHandlers:
                 ]
 
         except Exception as e:
-            logger.error(f"❌ Tool 실행 오류: {name}, {str(e)}", exc_info=True)
-            error_response = {"success": False, "message": f"오류 발생: {str(e)}"}
+            logger.error(f"❌ Tool 실행 오류: {name}, {e}", exc_info=True)
+            error_response = {"success": False, "message": f"오류 발생: {e}"}
             return [
                 TextContent(type="text", text=json.dumps(error_response, indent=2))
             ]
@@ -299,5 +303,5 @@ class OneDriveHandlers:
                 raise ValueError(f"알 수 없는 도구: {name}")
 
         except Exception as e:
-            logger.error(f"❌ Tool 실행 오류: {name}, {str(e)}", exc_info=True)
+            logger.error(f"❌ Tool 실행 오류: {name}, {e}", exc_info=True)
             raise
@@ -4,9 +4,11 @@ Simple and clean implementation using only FastAPI.
 """
 
 import secrets
-from typing import Any, Dict, Optional, List
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional, List, Tuple
 from datetime import datetime
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.responses import JSONResponse
@@ -46,6 +48,36 @@ class ToolCallParams(BaseModel):
     arguments: Dict[str, Any] = Field(default_factory=dict)
 
 
+class MCPJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson
+
+    Tool results can carry whole (base64) files, where orjson is several times faster.
+    Output matches JSONResponse: non-str dict keys are allowed and unknown types
+    raise instead of being stringified.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Static parts of the initialize result; only protocolVersion varies per session
+_INITIALIZE_RESULT: Dict[str, Any] = {
+    "capabilities": {
+        "logging": {},
+        "resources": {"listChanged": False},
+        "tools": {"listChanged": True},
+        "prompts": {"listChanged": False},
+    },
+    "serverInfo": {
+        "name": "onedrive-server",
+        "title": "📁 OneDrive MCP Server",
+        "version": "1.0.0",
+        "description": "MCP server for OneDrive file management",
+    },
+    "instructions": "OneDrive 파일 읽기/쓰기/관리를 위한 MCP 서버입니다.",
+}
+
+
 # ============================================================================
 # FastAPI MCP Server
 # ============================================================================
@@ -63,6 +95,9 @@ class FastAPIOneDriveServer:
         # Active sessions (in-memory storage)
         self.sessions: Dict[str, Dict[str, Any]] = {}
 
+        # tools/list payload (tool definitions are static, built on first request)
+        self._tools_data: Optional[List[Dict[str, Any]]] = None
+
         # Create FastAPI app
         self.app = self._create_app()
 
@@ -71,6 +106,12 @@ class FastAPIOneDriveServer:
     def _create_app(self) -> FastAPI:
         """Create FastAPI application"""
 
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            yield
+            # 종료 시 Graph API keep-alive 연결 정리
+            await self.handlers.aclose()
+
         app = FastAPI(
             title="📁 OneDrive MCP Server",
             description="""
@@ -105,6 +146,7 @@ All MCP requests should be sent as POST to the root endpoint `/`.
             version="1.0.0",
             docs_url="/docs",
             redoc_url="/redoc",
+            lifespan=lifespan,
         )
 
         # CORS middleware
@@ -132,12 +174,14 @@ All MCP requests should be sent as POST to the root endpoint `/`.
             - tools/call
             - prompts/list
             - resources/list
+
+            A JSON array body is handled as a JSON-RPC batch.
             """
             # Parse request
             try:
                 body = await request.body()
                 if not body:
-                    return JSONResponse(
+                    return MCPJSONResponse(
                         {
                             "jsonrpc": "2.0",
                             "error": {"code": -32700, "message": "Empty request body"},
@@ -145,68 +189,43 @@ All MCP requests should be sent as POST to the root endpoint `/`.
                         status_code=400,
                     )
 
-                rpc_request = MCPRequest.parse_raw(body)
+                payload = orjson.loads(body)
             except Exception as e:
-                return JSONResponse(
+                return MCPJSONResponse(
                     {
                         "jsonrpc": "2.0",
-                        "error": {"code": -32700, "message": f"Parse error: {str(e)}"},
+                        "error": {"code": -32700, "message": f"Parse error: {e}"},
                     },
                     status_code=400,
                 )
 
-            # Extract request details
-            method = rpc_request.method
-            params = rpc_request.params or {}
-            request_id = rpc_request.id
-
-            logger.info(f"📨 MCP Request: {method} (id={request_id})")
-
-            # Handle notification (no id) - return 202 Accepted
-            if request_id is None:
-                logger.info(f"📤 Notification: {method}")
-                return JSONResponse({}, status_code=202)
-
-            # Route to method handlers
-            try:
-                if method == "initialize":
-                    result = await self._handle_initialize(params, request)
-                elif method == "tools/list":
-                    result = await self._handle_tools_list()
-                elif method == "tools/call":
-                    result = await self._handle_tools_call(request, params)
-                elif method == "prompts/list":
-                    result = {"prompts": []}
-                elif method == "resources/list":
-                    result = {"resources": []}
-                else:
-                    return JSONResponse(
+            # JSON-RPC 2.0 batch: initialize + tools/list 등을 한 번의 왕복으로 처리
+            if isinstance(payload, list):
+                if not payload:
+                    return MCPJSONResponse(
                         {
                             "jsonrpc": "2.0",
-                            "id": request_id,
-                            "error": {"code": -32601, "message": f"Method not found: {method}"},
+                            "id": None,
+                            "error": {"code": -32600, "message": "Invalid Request: empty batch"},
                         },
-                        status_code=404,
+                        status_code=400,
                     )
 
-                return JSONResponse(
-                    {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": result,
-                    }
-                )
+                # 순서 의존성(initialize → tools/list)이 있으므로 순차 처리
+                responses = []
+                for item in payload:
+                    response, _ = await self._dispatch_rpc(item, request)
+                    if response is not None:
+                        responses.append(response)
 
-            except Exception as e:
-                logger.error(f"❌ Error handling {method}: {e}", exc_info=True)
-                return JSONResponse(
-                    {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "error": {"code": -32603, "message": f"Internal error: {str(e)}"},
-                    },
-                    status_code=500,
-                )
+                if not responses:
+                    return MCPJSONResponse({}, status_code=202)
+                return MCPJSONResponse(responses)
+
+            response, status_code = await self._dispatch_rpc(payload, request)
+            if response is None:
+                return MCPJSONResponse({}, status_code=202)
+            return MCPJSONResponse(response, status_code=status_code)
 
         # ====================================================================
         # Health & Info Endpoints
@@ -236,7 +255,7 @@ All MCP requests should be sent as POST to the root endpoint `/`.
             else:
                 request_id = request.headers.get("x-request-id", "ping")
 
-            return JSONResponse({
+            return MCPJSONResponse({
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "result": {}
@@ -287,6 +306,64 @@ All MCP requests should be sent as POST to the root endpoint `/`.
     # MCP Method Handlers
     # ========================================================================
 
+    async def _dispatch_rpc(
+        self, payload: Any, request: Request
+    ) -> Tuple[Optional[Dict[str, Any]], int]:
+        """Route a single JSON-RPC request
+
+        Returns:
+            (response, status_code) - response is None for notifications
+        """
+        try:
+            rpc_request = MCPRequest.model_validate(payload)
+        except Exception as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32600, "message": f"Invalid Request: {e}"},
+            }, 400
+
+        # Extract request details
+        method = rpc_request.method
+        params = rpc_request.params or {}
+        request_id = rpc_request.id
+
+        logger.info(f"📨 MCP Request: {method} (id={request_id})")
+
+        # Handle notification (no id) - no response body
+        if request_id is None:
+            logger.info(f"📤 Notification: {method}")
+            return None, 202
+
+        # Route to method handlers
+        try:
+            if method == "initialize":
+                result = await self._handle_initialize(params, request)
+            elif method == "tools/list":
+                result = await self._handle_tools_list()
+            elif method == "tools/call":
+                result = await self._handle_tools_call(request, params)
+            elif method == "prompts/list":
+                result = {"prompts": []}
+            elif method == "resources/list":
+                result = {"resources": []}
+            else:
+                return {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "error": {"code": -32601, "message": f"Method not found: {method}"},
+                }, 404
+
+            return {"jsonrpc": "2.0", "id": request_id, "result": result}, 200
+
+        except Exception as e:
+            logger.error(f"❌ Error handling {method}: {e}", exc_info=True)
+            return {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": -32603, "message": f"Internal error: {e}"},
+            }, 500
+
     async def _handle_initialize(self, params: Dict[str, Any], request: Request) -> Dict[str, Any]:
         """Handle initialize method"""
         # Create new session
@@ -302,41 +379,22 @@ All MCP requests should be sent as POST to the root endpoint `/`.
 
         logger.info(f"✅ Session created: {session_id}")
 
-        # Build capabilities
-        capabilities = {
-            "logging": {},
-            "resources": {"listChanged": False},
-            "tools": {"listChanged": True},
-            "prompts": {"listChanged": False},
-        }
-
-        return {
-            "protocolVersion": protocol_version,
-            "capabilities": capabilities,
-            "serverInfo": {
-                "name": "onedrive-server",
-                "title": "📁 OneDrive MCP Server",
-                "version": "1.0.0",
-                "description": "MCP server for OneDrive file management",
-            },
-            "instructions": "OneDrive 파일 읽기/쓰기/관리를 위한 MCP 서버입니다.",
-        }
+        return {"protocolVersion": protocol_version, **_INITIALIZE_RESULT}
 
     async def _handle_tools_list(self) -> Dict[str, Any]:
         """Handle tools/list method"""
-        tools = await self.handlers.handle_list_tools()
+        if self._tools_data is None:
+            tools = await self.handlers.handle_list_tools()
 
-        # Convert Tool objects to dict
-        tools_data = []
-        for tool in tools:
-            tool_dict = tool.model_dump()
-            # Remove None values
-            cleaned_tool = {k: v for k, v in tool_dict.items() if v is not None}
-            tools_data.append(cleaned_tool)
+            # Convert Tool objects to dict (Remove None values)
+            self._tools_data = [
+                {k: v for k, v in tool.model_dump().items() if v is not None}
+                for tool in tools
+            ]
 
-        logger.info(f"📋 Returning {len(tools_data)} tools")
+        logger.info(f"📋 Returning {len(self._tools_data)} tools")
 
-        return {"tools": tools_data}
+        return {"tools": self._tools_data}
 
     async def _handle_tools_call(self, request, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tools/call method"""
@@ -3,6 +3,7 @@ OneDrive Graph API Handler
 Microsoft Graph API를 사용한 OneDrive 작업 처리
 """
 
+import asyncio
 import httpx
 import base64
 from typing import Optional, List, Dict, Any
@@ -20,6 +21,37 @@ class OneDriveHandler:
         self.db = get_database_manager()
         self.token_service = TokenService()
         self.graph_base_url = "https://graph.microsoft.com/v1.0"
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock: Optional[asyncio.Lock] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """HTTP 클라이언트 생성 또는 반환 (keep-alive 연결 재사용)
+
+        연결 풀은 클라이언트를 만든 이벤트 루프에 묶이므로, 다른 루프에서
+        호출되면(예: asyncio.run을 여러 번 실행) 새 클라이언트를 만든다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not loop:
+            self._client = None
+            self._client_lock = asyncio.Lock()
+            self._client_loop = loop
+
+        if self._client is None or self._client.is_closed:
+            async with self._client_lock:
+                if self._client is None or self._client.is_closed:
+                    self._client = httpx.AsyncClient(
+                        limits=httpx.Limits(max_keepalive_connections=4),
+                    )
+                    logger.debug("새로운 httpx 클라이언트 생성됨")
+        return self._client
+
+    async def close(self):
+        """HTTP 클라이언트 정리"""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+            logger.debug("httpx 클라이언트 정리됨")
+        self._client = None
 
     async def _get_access_token(self, user_id: str) -> Optional[str]:
         """
@@ -35,7 +67,7 @@ class OneDriveHandler:
             # TokenService를 사용하여 토큰 유효성 확인 및 자동 갱신
             return await self.token_service.get_valid_access_token(user_id)
         except Exception as e:
-            logger.error(f"❌ 토큰 조회 실패: {str(e)}")
+            logger.error(f"❌ 토큰 조회 실패: {e}")
             return None
 
     async def list_files(
@@ -73,21 +105,21 @@ class OneDriveHandler:
                 # 루트 폴더
                 url = f"{self.graph_base_url}/me/drive/root/children"
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers, timeout=30.0)
+            client = await self._get_client()
+            response = await client.get(url, headers=headers, timeout=30.0)
 
-                if response.status_code == 200:
-                    data = response.json()
-                    files = data.get("value", [])
-                    logger.info(f"✅ 파일 {len(files)}개 조회 성공")
-                    return {"success": True, "files": files}
-                else:
-                    error_msg = f"파일 목록 조회 실패: {response.status_code} - {response.text}"
-                    logger.error(error_msg)
-                    return {"success": False, "message": error_msg}
+            if response.status_code == 200:
+                data = response.json()
+                files = data.get("value", [])
+                logger.info(f"✅ 파일 {len(files)}개 조회 성공")
+                return {"success": True, "files": files}
+            else:
+                error_msg = f"파일 목록 조회 실패: {response.status_code} - {response.text}"
+                logger.error(error_msg)
+                return {"success": False, "message": error_msg}
 
         except Exception as e:
-            error_msg = f"파일 목록 조회 오류: {str(e)}"
+            error_msg = f"파일 목록 조회 오류: {e}"
             logger.error(error_msg)
             return {"success": False, "message": error_msg}
 
@@ -121,50 +153,50 @@ class OneDriveHandler:
                 download_url = f"{self.graph_base_url}/me/drive/items/{file_path}/content"
                 metadata_url = f"{self.graph_base_url}/me/drive/items/{file_path}"
 
-            async with httpx.AsyncClient() as client:
-                # 메타데이터 조회
-                meta_response = await client.get(metadata_url, headers=headers, timeout=30.0)
-                if meta_response.status_code != 200:
-                    error_msg = f"파일 메타데이터 조회 실패: {meta_response.status_code}"
-                    logger.error(error_msg)
-                    return {"success": False, "message": error_msg}
-
-                meta_data = meta_response.json()
-                file_name = meta_data.get("name", "unknown")
-                file_size = meta_data.get("size", 0)
-                mime_type = meta_data.get("file", {}).get("mimeType", "application/octet-stream")
-
-                # 파일 다운로드
-                content_response = await client.get(download_url, headers=headers, timeout=60.0)
-
-                if content_response.status_code == 200:
-                    # 텍스트 파일인 경우
-                    if mime_type.startswith("text/") or mime_type in [
-                        "application/json",
-                        "application/xml",
-                        "application/javascript",
-                    ]:
-                        content = content_response.text
-                    else:
-                        # 바이너리 파일은 base64 인코딩
-                        content = base64.b64encode(content_response.content).decode("utf-8")
-                        content = f"[Base64 Encoded]\n{content}"
-
-                    logger.info(f"✅ 파일 읽기 성공: {file_name}")
-                    return {
-                        "success": True,
-                        "content": content,
-                        "file_name": file_name,
-                        "file_size": file_size,
-                        "mime_type": mime_type,
-                    }
+            client = await self._get_client()
+            # 메타데이터 조회
+            meta_response = await client.get(metadata_url, headers=headers, timeout=30.0)
+            if meta_response.status_code != 200:
+                error_msg = f"파일 메타데이터 조회 실패: {meta_response.status_code}"
+                logger.error(error_msg)
+                return {"success": False, "message": error_msg}
+
+            meta_data = meta_response.json()
+            file_name = meta_data.get("name", "unknown")
+            file_size = meta_data.get("size", 0)
+            mime_type = meta_data.get("file", {}).get("mimeType", "application/octet-stream")
+
+            # 파일 다운로드
+            content_response = await client.get(download_url, headers=headers, timeout=60.0)
+
+            if content_response.status_code == 200:
+                # 텍스트 파일인 경우
+                if mime_type.startswith("text/") or mime_type in [
+                    "application/json",
+                    "application/xml",
+                    "application/javascript",
+                ]:
+                    content = content_response.text
                 else:
-                    error_msg = f"파일 다운로드 실패: {content_response.status_code}"
-                    logger.error(error_msg)
-                    return {"success": False, "message": error_msg}
+                    # 바이너리 파일은 base64 인코딩
+                    content = base64.b64encode(content_response.content).decode("utf-8")
+                    content = f"[Base64 Encoded]\n{content}"
+
+                logger.info(f"✅ 파일 읽기 성공: {file_name}")
+                return {
+                    "success": True,
+                    "content": content,
+                    "file_name": file_name,
+                    "file_size": file_size,
+                    "mime_type": mime_type,
+                }
+            else:
+                error_msg = f"파일 다운로드 실패: {content_response.status_code}"
+                logger.error(error_msg)
+                return {"success": False, "message": error_msg}
 
         except Exception as e:
-            error_msg = f"파일 읽기 오류: {str(e)}"
+            error_msg = f"파일 읽기 오류: {e}"
             logger.error(error_msg)
             return {"success": False, "message": error_msg}
 
@@ -221,31 +253,31 @@ class OneDriveHandler:
             if not overwrite:
                 url += "?@microsoft.graph.conflictBehavior=fail"
 
-            async with httpx.AsyncClient() as client:
-                response = await client.put(
-                    url, headers=headers, content=file_content, timeout=120.0
-                )
-
-                if response.status_code in [200, 201]:
-                    data = response.json()
-                    file_id = data.get("id")
-                    file_name = data.get("name")
-                    web_url = data.get("webUrl")
-                    logger.info(f"✅ 파일 쓰기 성공: {file_name} ({content_type})")
-                    return {
-                        "success": True,
-                        "file_id": file_id,
-                        "file_name": file_name,
-                        "web_url": web_url,
-                        "size": len(file_content)
-                    }
-                else:
-                    error_msg = f"파일 쓰기 실패: {response.status_code} - {response.text}"
-                    logger.error(error_msg)
-                    return {"success": False, "message": error_msg}
+            client = await self._get_client()
+            response = await client.put(
+                url, headers=headers, content=file_content, timeout=120.0
+            )
+
+            if response.status_code in [200, 201]:
+                data = response.json()
+                file_id = data.get("id")
+                file_name = data.get("name")
+                web_url = data.get("webUrl")
+                logger.info(f"✅ 파일 쓰기 성공: {file_name} ({content_type})")
+                return {
+                    "success": True,
+                    "file_id": file_id,
+                    "file_name": file_name,
+                    "web_url": web_url,
+                    "size": len(file_content)
+                }
+            else:
+                error_msg = f"파일 쓰기 실패: {response.status_code} - {response.text}"
+                logger.error(error_msg)
+                return {"success": False, "message": error_msg}
 
         except Exception as e:
-            error_msg = f"파일 쓰기 오류: {str(e)}"
+            error_msg = f"파일 쓰기 오류: {e}"
             logger.error(error_msg)
             return {"success": False, "message": error_msg}
 
@@ -277,19 +309,19 @@ class OneDriveHandler:
                 # ID
                 url = f"{self.graph_base_url}/me/drive/items/{file_path}"
 
-            async with httpx.AsyncClient() as client:
-                response = await client.delete(url, headers=headers, timeout=30.0)
+            client = await self._get_client()
+            response = await client.delete(url, headers=headers, timeout=30.0)
 
-                if response.status_code == 204:
-                    logger.info(f"✅ 파일 삭제 성공: {file_path}")
-                    return {"success": True, "message": "파일이 성공적으로 삭제되었습니다"}
-                else:
-                    error_msg = f"파일 삭제 실패: {response.status_code} - {response.text}"
-                    logger.error(error_msg)
-                    return {"success": False, "message": error_msg}
+            if response.status_code == 204:
+                logger.info(f"✅ 파일 삭제 성공: {file_path}")
+                return {"success": True, "message": "파일이 성공적으로 삭제되었습니다"}
+            else:
+                error_msg = f"파일 삭제 실패: {response.status_code} - {response.text}"
+                logger.error(error_msg)
+                return {"success": False, "message": error_msg}
 
         except Exception as e:
-            error_msg = f"파일 삭제 오류: {str(e)}"
+            error_msg = f"파일 삭제 오류: {e}"
             logger.error(error_msg)
             return {"success": False, "message": error_msg}
 
@@ -325,21 +357,21 @@ class OneDriveHandler:
 
             body = {"name": folder_path, "folder": {}, "@microsoft.graph.conflictBehavior": "fail"}
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, headers=headers, json=body, timeout=30.0)
+            client = await self._get_client()
+            response = await client.post(url, headers=headers, json=body, timeout=30.0)
 
-                if response.status_code == 201:
-                    data = response.json()
-                    folder_id = data.get("id")
-                    folder_name = data.get("name")
-                    logger.info(f"✅ 폴더 생성 성공: {folder_name}")
-                    return {"success": True, "folder_id": folder_id, "folder_name": folder_name}
-                else:
-                    error_msg = f"폴더 생성 실패: {response.status_code} - {response.text}"
-                    logger.error(error_msg)
-                    return {"success": False, "message": error_msg}
+            if response.status_code == 201:
+                data = response.json()
+                folder_id = data.get("id")
+                folder_name = data.get("name")
+                logger.info(f"✅ 폴더 생성 성공: {folder_name}")
+                return {"success": True, "folder_id": folder_id, "folder_name": folder_name}
+            else:
+                error_msg = f"폴더 생성 실패: {response.status_code} - {response.text}"
+                logger.error(error_msg)
+                return {"success": False, "message": error_msg}
 
         except Exception as e:
-            error_msg = f"폴더 생성 오류: {str(e)}"
+            error_msg = f"폴더 생성 오류: {e}"
             logger.error(error_msg)
             return {"success": False, "message": error_msg}
@@ -1,14 +1,22 @@
 """Web Dashboard for MailQueryWithMCP Management"""
 
-import json
+import asyncio
+import functools
+import gzip
+import hashlib
 import os
+import re
 import sqlite3
 import subprocess
 import secrets
+import threading
+import time
+from email.utils import formatdate
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from starlette.responses import HTMLResponse, JSONResponse, Response, RedirectResponse
+import orjson
+from starlette.responses import HTMLResponse, JSONResponse, Response, RedirectResponse, StreamingResponse
 from starlette.routing import Route
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -26,6 +34,77 @@ LOG_DIR = PROJECT_ROOT / "logs"
 ENV_FILE = PROJECT_ROOT / ".env"
 UNIFIED_PID_FILE = Path("/tmp/unified_server.pid")
 QUICK_TUNNEL_PID_FILE = Path("/tmp/quick_tunnel.pid")
+STATIC_DIR = Path(__file__).parent / "static"
+
+# Quick Tunnel URL patterns, compiled once and shared by every status poll
+TUNNEL_URL_PATTERN = re.compile(r'https://[a-z0-9-]+\.trycloudflare\.com')
+TUNNEL_ENV_URL_PATTERN = re.compile(
+    r'(?:DCR_OAUTH_REDIRECT_URI|AUTO_REGISTER_OAUTH_REDIRECT_URI)=(https://[a-z0-9-]+\.trycloudflare\.com)'
+)
+
+# One KEY=VALUE assignment per line; blank and '#' comment lines never match.
+# Key and value are trimmed, and the value may itself contain '='
+ENV_LINE_PATTERN = re.compile(
+    r'^(?![ \t\r]*#)[ \t\r]*([^=\n]*?)[ \t\r]*=[ \t\r]*(.*?)[ \t\r]*$', re.MULTILINE
+)
+
+# Row cap applied to SELECT queries that do not request an explicit limit
+DEFAULT_QUERY_LIMIT = 1000
+
+# Blocking sqlite calls (including open NDJSON streams) allowed at the same time
+DB_CONCURRENCY = 4
+
+# Short-lived cache for database listings (in-memory)
+DB_CACHE_TTL_SECONDS = 10
+_db_cache = {}  # {cache_key: (expires_at, value)}
+
+# Processes spawned by this dashboard, reaped by a waiter thread each
+_child_processes = {}  # {pid: Popen}
+
+# Parsed .env contents, reused until the file changes
+_env_cache = {}  # {path: (mtime_ns, size, env_vars)}
+
+
+def _json_default(obj):
+    """Encode the values orjson has no native type for; anything else is a bug"""
+    # sqlite BLOB columns come back as bytes
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return bytes(obj).hex()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dump_json(payload, sort_keys: bool = False) -> bytes:
+    """Serialize compact UTF-8 JSON with orjson"""
+    return orjson.dumps(payload, default=_json_default, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered through dump_json"""
+
+    def render(self, content) -> bytes:
+        return dump_json(content)
+
+
+class StaticContent:
+    """Pre-encoded response body with a gzip variant and ETag"""
+
+    def __init__(self, content: str, media_type: str):
+        self.media_type = media_type
+        self.body = content.encode("utf-8")
+        self.gzip_body = gzip.compress(self.body, compresslevel=9)
+        self.digest = hashlib.sha256(self.body).hexdigest()
+        self.etag = f'"{self.digest}"'
+
+    def response(self, request, cache_control: str) -> Response:
+        """Build a response honoring If-None-Match and Accept-Encoding"""
+        headers = {"ETag": self.etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+        if request.headers.get("if-none-match") == self.etag:
+            return Response(status_code=304, headers=headers)
+
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            return Response(self.gzip_body, media_type=self.media_type, headers=headers)
+        return Response(self.body, media_type=self.media_type, headers=headers)
 
 
 class DashboardAuth:
@@ -85,14 +164,77 @@ class DashboardAuth:
 class DashboardService:
     """Service for managing dashboard operations"""
 
+    @staticmethod
+    def _get_cached(key):
+        """Return cached value if it has not expired yet"""
+        entry = _db_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    @staticmethod
+    def _set_cached(key, value):
+        """Store value in the database listing cache"""
+        _db_cache[key] = (time.monotonic() + DB_CACHE_TTL_SECONDS, value)
+
+    @staticmethod
+    def invalidate_db_cache():
+        """Drop cached database listings (after schema or file changes)"""
+        _db_cache.clear()
+
+    @staticmethod
+    def _is_process_alive(pid: int) -> bool:
+        """Check whether a process exists (signal 0 probe, no ps fork)"""
+        # Our own children are reaped on exit, so their returncode is authoritative
+        child = _child_processes.get(pid)
+        if child is not None:
+            return child.returncode is None
+
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            # The process exists but belongs to another user
+            return True
+        return True
+
+    @staticmethod
+    def _watch_child(process: subprocess.Popen) -> None:
+        """Wait for a spawned process in the background so its exit is noticed
+
+        Without this an exited child stays a zombie, which still answers
+        signal 0 and would be reported as running.
+        """
+        _child_processes[process.pid] = process
+        threading.Thread(target=process.wait, name=f"reap-{process.pid}", daemon=True).start()
+
+    @staticmethod
+    def _process_name(pid: int) -> Optional[str]:
+        """Get a process command name, or None if it is not running"""
+        try:
+            return Path(f"/proc/{pid}/comm").read_text().strip()
+        except FileNotFoundError:
+            if Path("/proc/self").exists():
+                return None
+        except OSError:
+            pass
+
+        # No procfs (e.g. macOS): fall back to ps
+        result = subprocess.run(
+            ["ps", "-p", str(pid), "-o", "comm="],
+            capture_output=True,
+            text=True
+        )
+        return result.stdout.strip() if result.returncode == 0 else None
+
     @staticmethod
     def start_server() -> Dict:
         """Start unified MCP server"""
         try:
             if UNIFIED_PID_FILE.exists():
-                pid = int(UNIFIED_PID_FILE.read_text().strip())
-                result = subprocess.run(["ps", "-p", str(pid)], capture_output=True)
-                if result.returncode == 0:
+                pid = int(UNIFIED_PID_FILE.read_bytes())
+                if DashboardService._is_process_alive(pid):
                     return {"success": False, "error": "Server is already running", "pid": pid}
 
             # Start server
@@ -119,7 +261,9 @@ class DashboardService:
             )
 
             # Save PID
+            DashboardService._watch_child(process)
             UNIFIED_PID_FILE.write_text(str(process.pid))
+            DashboardService.invalidate_db_cache()
             logger.info(f"Started unified server with PID: {process.pid}")
 
             return {"success": True, "pid": process.pid}
@@ -134,7 +278,7 @@ class DashboardService:
             if not UNIFIED_PID_FILE.exists():
                 return {"success": False, "error": "Server is not running"}
 
-            pid = int(UNIFIED_PID_FILE.read_text().strip())
+            pid = int(UNIFIED_PID_FILE.read_bytes())
 
             # Kill process
             try:
@@ -143,11 +287,11 @@ class DashboardService:
                 time.sleep(2)
 
                 # Force kill if still running
-                result = subprocess.run(["ps", "-p", str(pid)], capture_output=True)
-                if result.returncode == 0:
+                if DashboardService._is_process_alive(pid):
                     subprocess.run(["kill", "-9", str(pid)])
 
                 UNIFIED_PID_FILE.unlink()
+                DashboardService.invalidate_db_cache()
                 logger.info(f"Stopped unified server (PID: {pid})")
                 return {"success": True, "pid": pid}
             except subprocess.CalledProcessError as e:
@@ -162,9 +306,8 @@ class DashboardService:
         try:
             # Check if already running
             if QUICK_TUNNEL_PID_FILE.exists():
-                pid = int(QUICK_TUNNEL_PID_FILE.read_text().strip())
-                result = subprocess.run(["ps", "-p", str(pid)], capture_output=True)
-                if result.returncode == 0:
+                pid = int(QUICK_TUNNEL_PID_FILE.read_bytes())
+                if DashboardService._is_process_alive(pid):
                     return {"success": False, "error": "Tunnel is already running", "pid": pid}
 
             # Check if cloudflared exists
@@ -184,18 +327,18 @@ class DashboardService:
             )
 
             # Save PID
+            DashboardService._watch_child(process)
             QUICK_TUNNEL_PID_FILE.write_text(str(process.pid))
             logger.info(f"Started Cloudflare tunnel with PID: {process.pid}")
 
             # Wait for URL to appear in log (max 20 seconds)
             import time
-            import re
             tunnel_url = None
             for i in range(10):
                 time.sleep(2)
                 if log_file.exists():
                     log_content = log_file.read_text()
-                    match = re.search(r'https://[a-z0-9-]+\.trycloudflare\.com', log_content)
+                    match = TUNNEL_URL_PATTERN.search(log_content)
                     if match:
                         tunnel_url = match.group(0)
                         # Save to .env
@@ -220,7 +363,7 @@ class DashboardService:
         try:
             # First try PID file
             if QUICK_TUNNEL_PID_FILE.exists():
-                pid = int(QUICK_TUNNEL_PID_FILE.read_text().strip())
+                pid = int(QUICK_TUNNEL_PID_FILE.read_bytes())
             else:
                 # Try to find cloudflared process
                 result = subprocess.run(
@@ -239,8 +382,7 @@ class DashboardService:
                 time.sleep(2)
 
                 # Force kill if still running
-                result = subprocess.run(["ps", "-p", str(pid)], capture_output=True)
-                if result.returncode == 0:
+                if DashboardService._is_process_alive(pid):
                     subprocess.run(["kill", "-9", str(pid)])
 
                 if QUICK_TUNNEL_PID_FILE.exists():
@@ -259,14 +401,10 @@ class DashboardService:
         """Get unified server status"""
         try:
             if UNIFIED_PID_FILE.exists():
-                pid = int(UNIFIED_PID_FILE.read_text().strip())
+                pid = int(UNIFIED_PID_FILE.read_bytes())
                 # Check if process is running
-                result = subprocess.run(
-                    ["ps", "-p", str(pid), "-o", "comm="],
-                    capture_output=True,
-                    text=True
-                )
-                if result.returncode == 0 and "python" in result.stdout:
+                if (DashboardService._is_process_alive(pid)
+                        and "python" in (DashboardService._process_name(pid) or "")):
                     return {
                         "status": "running",
                         "pid": pid,
@@ -286,12 +424,8 @@ class DashboardService:
 
             # Check PID file
             if QUICK_TUNNEL_PID_FILE.exists():
-                pid = int(QUICK_TUNNEL_PID_FILE.read_text().strip())
-                result = subprocess.run(
-                    ["ps", "-p", str(pid)],
-                    capture_output=True
-                )
-                if result.returncode != 0:
+                pid = int(QUICK_TUNNEL_PID_FILE.read_bytes())
+                if not DashboardService._is_process_alive(pid):
                     pid = None
 
             # If no PID, try to find cloudflared process
@@ -309,17 +443,15 @@ class DashboardService:
                 log_file = LOG_DIR / "quick_tunnel.log"
                 if log_file.exists():
                     log_content = log_file.read_text()
-                    import re
-                    match = re.search(r'https://[a-z0-9-]+\.trycloudflare\.com', log_content)
+                    match = TUNNEL_URL_PATTERN.search(log_content)
                     if match:
                         tunnel_url = match.group(0)
 
                 # Method 2: Try to get URL from .env file (DCR_OAUTH_REDIRECT_URI)
                 if not tunnel_url and ENV_FILE.exists():
                     env_content = ENV_FILE.read_text()
-                    import re
                     # Look for DCR_OAUTH_REDIRECT_URI or AUTO_REGISTER_OAUTH_REDIRECT_URI
-                    match = re.search(r'(?:DCR_OAUTH_REDIRECT_URI|AUTO_REGISTER_OAUTH_REDIRECT_URI)=(https://[a-z0-9-]+\.trycloudflare\.com)', env_content)
+                    match = TUNNEL_ENV_URL_PATTERN.search(env_content)
                     if match:
                         tunnel_url = match.group(1)
 
@@ -330,7 +462,7 @@ class DashboardService:
                         import requests
                         response = requests.get("http://127.0.0.1:60123/metrics", timeout=1)
                         if response.status_code == 200:
-                            match = re.search(r'https://[a-z0-9-]+\.trycloudflare\.com', response.text)
+                            match = TUNNEL_URL_PATTERN.search(response.text)
                             if match:
                                 tunnel_url = match.group(0)
                     except:
@@ -353,12 +485,15 @@ class DashboardService:
         env_vars = {}
         try:
             if ENV_FILE.exists():
-                content = ENV_FILE.read_text()
-                for line in content.split('\n'):
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        env_vars[key.strip()] = value.strip()
+                # Only re-parse when the file's mtime or size has changed
+                stat = ENV_FILE.stat()
+                cached = _env_cache.get(ENV_FILE)
+                if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                    return dict(cached[2])
+
+                # Let the regex engine scan all lines in one pass
+                env_vars = dict(ENV_LINE_PATTERN.findall(ENV_FILE.read_text()))
+                _env_cache[ENV_FILE] = (stat.st_mtime_ns, stat.st_size, dict(env_vars))
         except Exception as e:
             logger.error(f"Error reading .env file: {e}")
         return env_vars
@@ -370,7 +505,34 @@ class DashboardService:
             if not ENV_FILE.exists():
                 ENV_FILE.touch()
 
-            content = ENV_FILE.read_text()
+            content = ENV_FILE.read_text(encoding='utf-8')
+
+            # Existing key: an unchanged value needs no write, and a same-size value
+            # is patched in place instead of rewriting the whole file
+            for match in ENV_LINE_PATTERN.finditer(content):
+                if match.group(1) != key:
+                    continue
+                old_value = match.group(2)
+                if old_value == value:
+                    logger.info(f"Env variable unchanged: {key}")
+                    return True
+                old_bytes = old_value.encode('utf-8')
+                new_bytes = value.encode('utf-8')
+                if '\n' not in value and len(new_bytes) == len(old_bytes):
+                    # read_text() folds CRLF, so confirm the offset against the raw bytes
+                    offset = len(content[:match.start(2)].encode('utf-8'))
+                    with open(ENV_FILE, 'r+b') as f:
+                        f.seek(offset)
+                        patched = f.read(len(old_bytes)) == old_bytes
+                        if patched:
+                            f.seek(offset)
+                            f.write(new_bytes)
+                    if patched:
+                        _env_cache.pop(ENV_FILE, None)
+                        logger.info(f"Updated env variable in place: {key}")
+                        return True
+                break
+
             lines = content.split('\n')
             updated = False
 
@@ -388,7 +550,8 @@ class DashboardService:
             if not updated:
                 lines.append(f"{key}={value}")
 
-            ENV_FILE.write_text('\n'.join(lines))
+            ENV_FILE.write_text('\n'.join(lines), encoding='utf-8')
+            _env_cache.pop(ENV_FILE, None)
             logger.info(f"Updated env variable: {key}")
             return True
         except Exception as e:
@@ -421,20 +584,71 @@ class DashboardService:
             if not log_file.exists():
                 return f"Log file not found: {log_name}"
 
-            # Use tail command for efficiency
-            result = subprocess.run(
-                ["tail", "-n", str(lines), str(log_file)],
-                capture_output=True,
-                text=True
-            )
-            return result.stdout
+            content = b''.join(DashboardService.iter_log_tail(log_name, lines))
+            return content.decode('utf-8', 'replace')
         except Exception as e:
             logger.error(f"Error reading log file: {e}")
             return f"Error: {str(e)}"
 
     @staticmethod
+    def _find_tail_offset(f, lines: int) -> int:
+        """Return the byte offset where the last N lines of a binary file begin"""
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        if end == 0:
+            return 0
+
+        # A trailing newline ends the last line rather than starting a new one
+        f.seek(end - 1)
+        if f.read(1) == b'\n':
+            end -= 1
+
+        # Read backwards from the end in blocks until N line breaks are seen
+        position = end
+        newlines = 0
+        while position > 0:
+            step = min(65536, position)
+            position -= step
+            f.seek(position)
+            block = f.read(step)
+            index = len(block)
+            while True:
+                index = block.rfind(b'\n', 0, index)
+                if index < 0:
+                    break
+                newlines += 1
+                if newlines == lines:
+                    return position + index + 1
+        return 0
+
+    @staticmethod
+    def iter_log_tail(log_name: str, lines: int = 100, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Yield the last N lines of a log file as raw byte chunks
+
+        Only the tail is read, in ``chunk_size`` pieces, up to the file size seen
+        when reading started, so memory use stays flat however large the log is.
+        """
+        if lines <= 0:
+            return
+
+        with open(LOG_DIR / log_name, 'rb') as f:
+            offset = DashboardService._find_tail_offset(f, lines)
+            remaining = f.seek(0, os.SEEK_END) - offset
+            f.seek(offset)
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
     def get_endpoints_info(tunnel_url: Optional[str] = None) -> Dict:
-        """Get information about all endpoints"""
+        """Get information about all endpoints
+
+        Memoized per tunnel URL; the returned dict is shared and must not be mutated.
+        """
         base_url = tunnel_url or "http://localhost:8000"
 
         return {
@@ -484,6 +698,10 @@ class DashboardService:
     @staticmethod
     def get_database_list() -> List[Dict]:
         """Get list of available databases"""
+        cached = DashboardService._get_cached("database_list")
+        if cached is not None:
+            return cached
+
         databases = []
 
         # Main database
@@ -570,24 +788,104 @@ class DashboardService:
             }
         })
 
+        DashboardService._set_cached("database_list", databases)
         return databases
 
     @staticmethod
     def get_database_tables(db_path: str) -> List[str]:
         """Get list of tables in database"""
+        cache_key = ("tables", db_path)
+        cached = DashboardService._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             conn = sqlite3.connect(db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
             tables = [row[0] for row in cursor.fetchall()]
             conn.close()
+            DashboardService._set_cached(cache_key, tables)
             return tables
         except Exception as e:
             logger.error(f"Error getting database tables: {e}")
             return []
 
     @staticmethod
-    def query_database(db_path: str, query: str, limit: Optional[int] = None) -> Dict:
+    def _is_select(query: str) -> bool:
+        """Whether the query is a SELECT (or WITH ... SELECT) that can be paged"""
+        return query.lstrip().upper().startswith(('SELECT', 'WITH'))
+
+    @staticmethod
+    def _apply_limit(
+        query: str, limit: Optional[int], offset: int = 0
+    ) -> Tuple[str, Tuple[int, ...], bool]:
+        """Page a SELECT query by wrapping it in a LIMIT/OFFSET subquery if requested
+
+        The user's own LIMIT/ORDER BY stay inside the subquery. Returns the query,
+        its bound parameters and whether a limit was applied.
+        """
+        if limit and DashboardService._is_select(query):
+            query = f"SELECT * FROM (\n{query.strip().rstrip(';')}\n) LIMIT ? OFFSET ?"
+            return query, (limit, offset), True
+        return query, (), False
+
+    @staticmethod
+    def iter_query_rows(
+        db_path: str, query: str, limit: Optional[int] = None, offset: int = 0
+    ) -> Iterator[bytes]:
+        """Execute SQL query and yield NDJSON lines
+
+        Emits a ``{"type": "columns"}`` header, one JSON array per row (in column
+        order), and a final ``{"type": "end"}`` or ``{"type": "error"}`` line.
+        """
+        conn = None
+        try:
+            db_path_obj = Path(db_path)
+            if not db_path_obj.exists():
+                logger.warning(f"Database not exists, creating: {db_path}")
+                db_path_obj.parent.mkdir(parents=True, exist_ok=True)
+
+            # Rows are fetched lazily, possibly from different worker threads
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            cursor = conn.cursor()
+
+            # One extra row is fetched to tell whether another page exists
+            query, params, limited = DashboardService._apply_limit(query, limit and limit + 1, offset)
+            cursor.execute(query, params)
+
+            if not DashboardService._is_select(query):
+                DashboardService.invalidate_db_cache()
+
+            columns = [description[0] for description in cursor.description] if cursor.description else []
+            yield dump_json({"type": "columns", "columns": columns}) + b"\n"
+
+            row_count = 0
+            has_more = False
+            while True:
+                batch = cursor.fetchmany(500)
+                if not batch:
+                    break
+                if limited and row_count + len(batch) > limit:
+                    batch = batch[:limit - row_count]
+                    has_more = True
+                row_count += len(batch)
+                yield b"".join(dump_json(list(row)) + b"\n" for row in batch)
+                if has_more:
+                    break
+
+            yield dump_json({"type": "end", "row_count": row_count, "has_more": has_more}) + b"\n"
+        except Exception as e:
+            logger.error(f"Error querying database: {e}")
+            yield dump_json({"type": "error", "error": str(e)}) + b"\n"
+        finally:
+            if conn:
+                conn.close()
+
+    @staticmethod
+    def query_database(
+        db_path: str, query: str, limit: Optional[int] = None, offset: int = 0
+    ) -> Dict:
         """Execute SQL query on database"""
         try:
             # 데이터베이스 파일이 없으면 생성
@@ -600,11 +898,13 @@ class DashboardService:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
-            # Add LIMIT only if explicitly requested
-            if limit and query.strip().upper().startswith('SELECT') and 'LIMIT' not in query.upper():
-                query = f"{query.strip().rstrip(';')} LIMIT {limit}"
+            # One extra row is fetched to tell whether another page exists
+            query, params, limited = DashboardService._apply_limit(query, limit and limit + 1, offset)
+            cursor.execute(query, params)
 
-            cursor.execute(query)
+            # Statements other than SELECT may create/drop tables or database files
+            if not DashboardService._is_select(query):
+                DashboardService.invalidate_db_cache()
 
             # Get column names
             columns = [description[0] for description in cursor.description] if cursor.description else []
@@ -616,11 +916,16 @@ class DashboardService:
 
             conn.close()
 
+            has_more = limited and len(rows) > limit
+            if has_more:
+                rows = rows[:limit]
+
             return {
                 "success": True,
                 "columns": columns,
                 "rows": rows,
-                "row_count": len(rows)
+                "row_count": len(rows),
+                "has_more": has_more
             }
         except Exception as e:
             logger.error(f"Error querying database: {e}")
@@ -805,6 +1110,7 @@ class DashboardService:
 
             # Vacuum to clean up the database
             cursor.execute("VACUUM")
+            DashboardService.invalidate_db_cache()
 
             # Re-enable foreign key constraints
             cursor.execute("PRAGMA foreign_keys = ON")
@@ -1079,7 +1385,7 @@ def create_dashboard_routes() -> List[Route]:
                 session_token = auth.create_session(username)
 
                 # Set cookie
-                response = JSONResponse({"success": True})
+                response = ORJSONResponse({"success": True})
                 response.set_cookie(
                     key="dashboard_session",
                     value=session_token,
@@ -1090,13 +1396,13 @@ def create_dashboard_routes() -> List[Route]:
                 return response
             else:
                 logger.warning(f"Failed login attempt for username: {username}")
-                return JSONResponse(
+                return ORJSONResponse(
                     {"success": False, "error": "Invalid username or password"},
                     status_code=401
                 )
         except Exception as e:
             logger.error(f"Login error: {e}")
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Login failed"},
                 status_code=500
             )
@@ -1118,262 +1424,73 @@ def create_dashboard_routes() -> List[Route]:
         session_token = request.cookies.get("dashboard_session")
         return auth.verify_session(session_token)
 
-    # Main dashboard page
-    async def dashboard_page(request):
-        """Main dashboard HTML page"""
-        # Check authentication
-        if not check_session(request):
-            return RedirectResponse(url="/dashboard/login", status_code=302)
+    # sqlite/file I/O runs in worker threads so it never blocks the event loop
+    db_semaphore = asyncio.Semaphore(DB_CONCURRENCY)
 
-        html = """
+    async def run_db(func, *args):
+        """Run a blocking sqlite call in a worker thread (at most DB_CONCURRENCY at a time)"""
+        async with db_semaphore:
+            return await asyncio.to_thread(func, *args)
+
+    async def stream_db(func, *args):
+        """Drain a blocking sqlite row iterator in worker threads
+
+        The semaphore slot is held until the stream ends or the client disconnects.
+        """
+        done = object()
+        async with db_semaphore:
+            rows = func(*args)
+            try:
+                while True:
+                    chunk = await asyncio.to_thread(next, rows, done)
+                    if chunk is done:
+                        break
+                    yield chunk
+            finally:
+                # Closing the generator runs its finally block, releasing the sqlite connection
+                rows.close()
+
+    async def collect_status():
+        """Probe server and tunnel status concurrently in worker threads"""
+        return await asyncio.gather(
+            asyncio.to_thread(service.get_server_status),
+            asyncio.to_thread(service.get_tunnel_status),
+        )
+
+    # Conditional JSON response helper
+    def etag_json_response(request, payload) -> Response:
+        """Return JSON with an ETag, or 304 if the client already has this payload"""
+        # Serialize once (sorted, so equal payloads hash equally) and send those bytes
+        body = dump_json(payload, sort_keys=True)
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(
+            body, media_type="application/json", headers={"ETag": etag, "Cache-Control": "no-cache"}
+        )
+
+    # Static assets, versioned by content hash so browsers can cache them indefinitely
+    static_assets = {}
+    asset_urls = {}
+    for filename, media_type in (
+        ("dashboard.js", "application/javascript"),
+        ("dashboard.css", "text/css"),
+    ):
+        asset = StaticContent((STATIC_DIR / filename).read_text(encoding="utf-8"), media_type=media_type)
+        stem, ext = filename.rsplit(".", 1)
+        versioned_name = f"{stem}-{asset.digest[:12]}.{ext}"
+        static_assets[versioned_name] = asset
+        asset_urls[filename] = f"/dashboard/static/{versioned_name}"
+
+    # Main dashboard page (encoded and gzip-compressed once)
+    dashboard_template = """
 <!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>MailQueryWithMCP - Management Dashboard</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-        }
-        .header {
-            background: white;
-            border-radius: 12px;
-            padding: 30px;
-            margin-bottom: 20px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }
-        .header h1 {
-            color: #333;
-            font-size: 32px;
-            margin-bottom: 10px;
-        }
-        .header p {
-            color: #666;
-            font-size: 14px;
-        }
-        .grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
-            gap: 20px;
-            margin-bottom: 20px;
-        }
-        .card {
-            background: white;
-            border-radius: 12px;
-            padding: 25px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }
-        .card h2 {
-            color: #333;
-            font-size: 20px;
-            margin-bottom: 15px;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }
-        .status-badge {
-            display: inline-block;
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 12px;
-            font-weight: 600;
-        }
-        .status-running {
-            background: #10b981;
-            color: white;
-        }
-        .status-stopped {
-            background: #ef4444;
-            color: white;
-        }
-        .info-row {
-            display: flex;
-            justify-content: space-between;
-            padding: 10px 0;
-            border-bottom: 1px solid #eee;
-        }
-        .info-row:last-child {
-            border-bottom: none;
-        }
-        .info-label {
-            color: #666;
-            font-size: 14px;
-        }
-        .info-value {
-            color: #333;
-            font-weight: 500;
-            font-size: 14px;
-            max-width: 60%;
-            text-align: right;
-            word-break: break-all;
-        }
-        .url-copy {
-            cursor: pointer;
-            color: #667eea;
-            text-decoration: none;
-        }
-        .url-copy:hover {
-            text-decoration: underline;
-        }
-        .btn {
-            display: inline-block;
-            padding: 10px 20px;
-            border: none;
-            border-radius: 6px;
-            font-size: 14px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s;
-            text-decoration: none;
-            color: white;
-        }
-        .btn-primary {
-            background: #667eea;
-        }
-        .btn-primary:hover {
-            background: #5568d3;
-        }
-        .btn-danger {
-            background: #ef4444;
-        }
-        .btn-danger:hover {
-            background: #dc2626;
-        }
-        .log-viewer {
-            background: #1e1e1e;
-            color: #d4d4d4;
-            border-radius: 8px;
-            padding: 20px;
-            font-family: 'Courier New', monospace;
-            font-size: 12px;
-            max-height: 400px;
-            overflow-y: auto;
-            white-space: pre-wrap;
-            word-wrap: break-word;
-        }
-        .env-editor {
-            margin-top: 15px;
-        }
-        .env-input {
-            width: 100%;
-            padding: 10px;
-            margin: 5px 0;
-            border: 1px solid #ddd;
-            border-radius: 6px;
-            font-size: 14px;
-        }
-        .env-item {
-            display: flex;
-            gap: 10px;
-            align-items: center;
-            margin-bottom: 10px;
-            padding: 10px;
-            background: #f9f9f9;
-            border-radius: 6px;
-            transition: background 0.3s;
-        }
-        .env-item:hover {
-            background: #f0f0f0;
-        }
-        .env-key {
-            font-weight: 600;
-            color: #667eea;
-            min-width: 200px;
-            word-break: break-all;
-        }
-        .env-value {
-            flex: 1;
-            color: #333;
-            font-family: monospace;
-            font-size: 12px;
-            word-break: break-all;
-            padding: 5px 10px;
-            background: white;
-            border-radius: 4px;
-            border: 1px solid #e0e0e0;
-        }
-        .log-selector {
-            margin-bottom: 15px;
-        }
-        .log-selector select {
-            width: 100%;
-            padding: 10px;
-            border: 1px solid #ddd;
-            border-radius: 6px;
-            font-size: 14px;
-        }
-        .refresh-btn {
-            margin-top: 10px;
-        }
-        .full-width {
-            grid-column: 1 / -1;
-        }
-        .toast {
-            position: fixed;
-            top: 20px;
-            right: 20px;
-            background: #10b981;
-            color: white;
-            padding: 15px 25px;
-            border-radius: 8px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.2);
-            z-index: 1000;
-            animation: slideIn 0.3s ease-out;
-        }
-        @keyframes slideIn {
-            from {
-                transform: translateX(400px);
-                opacity: 0;
-            }
-            to {
-                transform: translateX(0);
-                opacity: 1;
-            }
-        }
-        .tabs {
-            display: flex;
-            gap: 10px;
-            margin-bottom: 20px;
-            border-bottom: 2px solid #e5e7eb;
-        }
-        .tab {
-            padding: 12px 24px;
-            background: transparent;
-            border: none;
-            border-bottom: 3px solid transparent;
-            cursor: pointer;
-            font-size: 16px;
-            font-weight: 600;
-            color: #6b7280;
-            transition: all 0.3s;
-        }
-        .tab:hover {
-            color: #667eea;
-        }
-        .tab.active {
-            color: #667eea;
-            border-bottom-color: #667eea;
-        }
-        .tab-content {
-            display: none;
-        }
-        .tab-content.active {
-            display: block;
-        }
-    </style>
+    <link rel="stylesheet" href="__DASHBOARD_CSS_URL__">
 </head>
 <body>
     <div class="container">
@@ -1537,760 +1654,40 @@ def create_dashboard_routes() -> List[Route]:
         </div>
     </div>
 
-    <script>
-        // Tab switching
-        function switchTab(tabName) {
-            // Hide all tab contents
-            document.querySelectorAll('.tab-content').forEach(content => {
-                content.classList.remove('active');
-            });
-
-            // Remove active class from all tabs
-            document.querySelectorAll('.tab').forEach(tab => {
-                tab.classList.remove('active');
-            });
-
-            // Show selected tab content
-            document.getElementById(tabName + '-tab').classList.add('active');
-
-            // Add active class to clicked tab
-            event.target.classList.add('active');
-        }
-
-        // Copy to clipboard helper
-        function copyToClipboard(text) {
-            navigator.clipboard.writeText(text).then(() => {
-                showToast('Copied to clipboard!');
-            });
-        }
-
-        // Show toast notification
-        function showToast(message) {
-            const toast = document.createElement('div');
-            toast.className = 'toast';
-            toast.textContent = message;
-            document.body.appendChild(toast);
-            setTimeout(() => toast.remove(), 3000);
-        }
-
-        // Load server status
-        async function loadServerStatus() {
-            try {
-                const response = await fetch('/dashboard/api/status');
-                const data = await response.json();
-
-                const serverHtml = data.server.status === 'running' ? `
-                    <span class="status-badge status-running">RUNNING</span>
-                    <div class="info-row">
-                        <span class="info-label">PID:</span>
-                        <span class="info-value">${data.server.pid}</span>
-                    </div>
-                    <div class="info-row">
-                        <span class="info-label">Endpoint:</span>
-                        <span class="info-value">
-                            <a href="${data.server.endpoint}/health" target="_blank" class="url-copy">
-                                ${data.server.endpoint}
-                            </a>
-                        </span>
-                    </div>
-                ` : `<span class="status-badge status-stopped">STOPPED</span>`;
-
-                const tunnelHtml = data.tunnel.status === 'running' ? `
-                    <span class="status-badge status-running">RUNNING</span>
-                    <div class="info-row">
-                        <span class="info-label">PID:</span>
-                        <span class="info-value">${data.tunnel.pid}</span>
-                    </div>
-                    ${data.tunnel.url ? `
-                    <div class="info-row">
-                        <span class="info-label">Public URL:</span>
-                        <span class="info-value">
-                            <a href="${data.tunnel.url}" target="_blank" class="url-copy" onclick="copyToClipboard('${data.tunnel.url}'); event.preventDefault();">
-                                ${data.tunnel.url}
-                            </a>
-                        </span>
-                    </div>
-                    ` : ''}
-                ` : `<span class="status-badge status-stopped">STOPPED</span>`;
-
-                document.getElementById('server-status').innerHTML = serverHtml;
-                document.getElementById('tunnel-status').innerHTML = tunnelHtml;
-
-                // Load endpoints with tunnel URL
-                loadEndpoints(data.tunnel.url);
-            } catch (error) {
-                console.error('Error loading status:', error);
-            }
-        }
-
-        // Load endpoints
-        async function loadEndpoints(tunnelUrl) {
-            try {
-                const url = tunnelUrl ? `/dashboard/api/endpoints?tunnel_url=${encodeURIComponent(tunnelUrl)}` : '/dashboard/api/endpoints';
-                const response = await fetch(url);
-                const data = await response.json();
-
-                let html = '';
-
-                // Redirect URIs for Azure AD App Registration - FIRST
-                if (data.redirect_uris) {
-                    html += '<div style="padding: 15px; background: #fff3cd; border-radius: 8px; border: 1px solid #ffc107;">';
-                    html += '<h3 style="margin-bottom: 10px; color: #856404;">🔐 OAuth Redirect URIs (Azure AD App Registration)</h3>';
-                    html += '<p style="font-size: 11px; color: #856404; margin-bottom: 15px;">Click to copy these URIs for Azure AD App Registration</p>';
-                    html += '<div style="font-size: 12px;">';
-                    for (const [key, value] of Object.entries(data.redirect_uris)) {
-                        html += `
-                            <div style="margin: 10px 0; padding: 10px; background: white; border-radius: 5px; cursor: pointer; transition: all 0.3s;"
-                                 onmouseover="this.style.background='#f8f9fa'"
-                                 onmouseout="this.style.background='white'"
-                                 onclick="copyToClipboard('${value}'); event.preventDefault();">
-                                <div style="font-weight: bold; color: #495057; margin-bottom: 5px;">${key}:</div>
-                                <div style="font-family: monospace; color: #007bff; word-break: break-all;">
-                                    ${value}
-                                </div>
-                                <div style="font-size: 10px; color: #6c757d; margin-top: 5px;">📋 Click to copy</div>
-                            </div>
-                        `;
-                    }
-                    html += '</div></div>';
-                }
-
-                // OAuth endpoints - SECOND
-                html += '<div style="margin-top: 20px; padding: 15px; background: #f0f9ff; border-radius: 8px;">';
-                html += '<h3 style="margin-bottom: 10px; color: #667eea;">OAuth Endpoints</h3>';
-                html += '<div style="font-size: 12px;">';
-                for (const [key, value] of Object.entries(data.oauth)) {
-                    html += `
-                        <div style="margin: 5px 0;">
-                            <strong>${key}:</strong>
-                            <a href="${value}" class="url-copy" onclick="copyToClipboard('${value}'); event.preventDefault();">${value}</a>
-                        </div>
-                    `;
-                }
-                html += '</div></div>';
-
-                // Services - THIRD
-                html += '<div style="margin-top: 20px; display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 15px;">';
-                data.services.forEach(service => {
-                    html += `
-                        <div style="padding: 15px; background: #f9f9f9; border-radius: 8px;">
-                            <h3 style="margin-bottom: 10px; color: #667eea;">${service.name}</h3>
-                            <div style="font-size: 12px;">
-                                <div style="margin: 5px 0;">
-                                    <a href="${service.url}" target="_blank" class="url-copy" onclick="copyToClipboard('${service.url}'); event.preventDefault();">
-                                        ${service.url}
-                                    </a>
-                                </div>
-                            </div>
-                        </div>
-                    `;
-                });
-                html += '</div>';
-
-                document.getElementById('endpoints-info').innerHTML = html;
-            } catch (error) {
-                console.error('Error loading endpoints:', error);
-            }
-        }
-
-        // Load environment variables
-        async function loadEnvVariables() {
-            try {
-                const response = await fetch('/dashboard/api/env');
-                const data = await response.json();
-
-                // Update dropdown
-                const select = document.getElementById('env-select');
-                select.innerHTML = '<option value="">Select a variable to edit or enter new...</option>';
-
-                let html = '';
-                for (const [key, value] of Object.entries(data)) {
-                    // Add to dropdown
-                    const option = document.createElement('option');
-                    option.value = key;
-                    option.textContent = key;
-                    option.setAttribute('data-value', value);
-                    select.appendChild(option);
-
-                    // Add to display list with edit button
-                    html += `
-                        <div class="env-item">
-                            <span class="env-key">${key}</span>
-                            <span class="env-value">${value}</span>
-                            <button class="btn btn-primary" style="margin-left: auto; padding: 5px 10px; font-size: 12px;"
-                                    onclick="editEnvVariable('${key}', '${value.replace(/'/g, "\\'")}')">✏️ Edit</button>
-                        </div>
-                    `;
-                }
-                document.getElementById('env-variables').innerHTML = html || '<p style="color: #666;">No environment variables found</p>';
-            } catch (error) {
-                console.error('Error loading env variables:', error);
-            }
-        }
-
-        // Handle environment variable selection
-        function onEnvSelect() {
-            const select = document.getElementById('env-select');
-            const selectedOption = select.options[select.selectedIndex];
-
-            if (selectedOption.value) {
-                const value = selectedOption.getAttribute('data-value');
-                document.getElementById('new-env-key').value = selectedOption.value;
-                document.getElementById('new-env-value').value = value;
-            }
-        }
-
-        // Edit environment variable
-        function editEnvVariable(key, value) {
-            document.getElementById('new-env-key').value = key;
-            document.getElementById('new-env-value').value = value;
-
-            // Update dropdown selection
-            const select = document.getElementById('env-select');
-            select.value = key;
-
-            // Scroll to editor
-            document.getElementById('env-tab').scrollIntoView({ behavior: 'smooth' });
-        }
-
-        // Clear environment form
-        function clearEnvForm() {
-            document.getElementById('new-env-key').value = '';
-            document.getElementById('new-env-value').value = '';
-            document.getElementById('env-select').value = '';
-        }
-
-        // Add environment variable
-        async function addEnvVariable() {
-            const key = document.getElementById('new-env-key').value.trim();
-            const value = document.getElementById('new-env-value').value.trim();
-
-            if (!key) {
-                showToast('Please enter a variable name');
-                return;
-            }
-
-            try {
-                const response = await fetch('/dashboard/api/env', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({key, value})
-                });
-
-                if (response.ok) {
-                    showToast('Environment variable updated!');
-                    document.getElementById('new-env-key').value = '';
-                    document.getElementById('new-env-value').value = '';
-                    loadEnvVariables();
-                } else {
-                    showToast('Failed to update variable');
-                }
-            } catch (error) {
-                console.error('Error updating env variable:', error);
-                showToast('Error updating variable');
-            }
-        }
-
-        // Load log files list
-        async function loadLogFiles() {
-            try {
-                const response = await fetch('/dashboard/api/logs');
-                const data = await response.json();
-
-                const select = document.getElementById('log-select');
-                select.innerHTML = '<option value="">Select a log file...</option>';
-
-                data.forEach(log => {
-                    const option = document.createElement('option');
-                    option.value = log.name;
-                    option.textContent = `${log.name} (${log.size_mb} MB)`;
-                    select.appendChild(option);
-                });
-            } catch (error) {
-                console.error('Error loading log files:', error);
-            }
-        }
-
-        // Load selected log
-        async function loadLog() {
-            const logName = document.getElementById('log-select').value;
-            if (!logName) return;
-
-            try {
-                const response = await fetch(`/dashboard/api/logs/${logName}?lines=200`);
-                const text = await response.text();
-                document.getElementById('log-content').textContent = text || 'Log file is empty';
-            } catch (error) {
-                console.error('Error loading log:', error);
-                document.getElementById('log-content').textContent = 'Error loading log file';
-            }
-        }
-
-        // Start server
-        async function startServer() {
-            try {
-                const response = await fetch('/dashboard/api/server/start', {method: 'POST'});
-                const data = await response.json();
-
-                if (data.success) {
-                    showToast('Server started successfully!');
-                    setTimeout(() => loadServerStatus(), 2000);
-                } else {
-                    showToast('Failed to start server: ' + data.error);
-                }
-            } catch (error) {
-                console.error('Error starting server:', error);
-                showToast('Error starting server');
-            }
-        }
-
-        // Stop server
-        async function stopServer() {
-            if (!confirm('Are you sure you want to stop the server?')) return;
-
-            try {
-                const response = await fetch('/dashboard/api/server/stop', {method: 'POST'});
-                const data = await response.json();
-
-                if (data.success) {
-                    showToast('Server stopped successfully!');
-                    setTimeout(() => loadServerStatus(), 2000);
-                } else {
-                    showToast('Failed to stop server: ' + data.error);
-                }
-            } catch (error) {
-                console.error('Error stopping server:', error);
-                showToast('Error stopping server');
-            }
-        }
-
-        // Start tunnel
-        async function startTunnel() {
-            try {
-                showToast('Starting tunnel... This may take up to 20 seconds.');
-                const response = await fetch('/dashboard/api/tunnel/start', {method: 'POST'});
-                const data = await response.json();
-
-                if (data.success) {
-                    showToast(data.message || 'Tunnel started successfully!');
-                    setTimeout(() => loadServerStatus(), 3000);
-                } else {
-                    showToast('Failed to start tunnel: ' + data.error);
-                }
-            } catch (error) {
-                console.error('Error starting tunnel:', error);
-                showToast('Error starting tunnel');
-            }
-        }
-
-        // Stop tunnel
-        async function stopTunnel() {
-            if (!confirm('Are you sure you want to stop the tunnel?')) return;
-
-            try {
-                const response = await fetch('/dashboard/api/tunnel/stop', {method: 'POST'});
-                const data = await response.json();
-
-                if (data.success) {
-                    showToast('Tunnel stopped successfully!');
-                    setTimeout(() => loadServerStatus(), 2000);
-                } else {
-                    showToast('Failed to stop tunnel: ' + data.error);
-                }
-            } catch (error) {
-                console.error('Error stopping tunnel:', error);
-                showToast('Error stopping tunnel');
-            }
-        }
-
-        // Load databases list
-        async function loadDatabases() {
-            try {
-                const response = await fetch('/dashboard/api/databases');
-                const data = await response.json();
-
-                const select = document.getElementById('db-select');
-                select.innerHTML = '<option value="">Select database...</option>';
-
-                let dcrDbPath = null;
-                data.forEach(db => {
-                    const option = document.createElement('option');
-                    option.value = db.path;
-                    option.textContent = `${db.name} (${db.size_mb} MB)`;
-                    select.appendChild(option);
-
-                    // Find DCR database path
-                    if (db.name.includes('DCR Database') || db.path.includes('dcr.db')) {
-                        dcrDbPath = db.path;
-                    }
-                });
-
-                // Auto-select DCR database and load tables
-                if (dcrDbPath) {
-                    select.value = dcrDbPath;
-                    await loadDatabaseTables();
-
-                    // Load DCR config when DCR database is selected
-                    loadDcrConfig();
-
-                    // After tables are loaded, select dcr_azure_app if it exists
-                    setTimeout(async () => {
-                        const tableSelect = document.getElementById('table-select');
-                        if (tableSelect) {
-                            // Look for dcr_azure_app option
-                            for (let option of tableSelect.options) {
-                                if (option.value === 'dcr_azure_app') {
-                                    tableSelect.value = 'dcr_azure_app';
-                                    // Automatically load the data
-                                    await selectAllFromTable();
-                                    break;
-                                }
-                            }
-                        }
-                    }, 100);
-                }
-            } catch (error) {
-                console.error('Error loading databases:', error);
-            }
-        }
-
-        // Load tables for selected database
-        async function loadDatabaseTables() {
-            const dbPath = document.getElementById('db-select').value;
-            if (!dbPath) return;
-
-            try {
-                const response = await fetch(`/dashboard/api/db/tables?db_path=${encodeURIComponent(dbPath)}`);
-                const data = await response.json();
-
-                const select = document.getElementById('table-select');
-                select.innerHTML = '<option value="">Select table...</option>';
-
-                data.tables.forEach(table => {
-                    const option = document.createElement('option');
-                    option.value = table;
-                    option.textContent = table;
-                    select.appendChild(option);
-                });
-
-                // Check if DCR database is selected
-                if (dbPath.includes('dcr.db')) {
-                    // Show DCR config section
-                    document.getElementById('dcr-config-section').style.display = 'block';
-                    loadDcrConfig();
-                } else {
-                    // Hide DCR config section
-                    document.getElementById('dcr-config-section').style.display = 'none';
-                }
-
-                // Clear results
-                document.getElementById('results-content').innerHTML = 'Select a table to see data';
-            } catch (error) {
-                console.error('Error loading tables:', error);
-            }
-        }
-
-        // Called when table is selected
-        async function onTableSelect() {
-            const tableName = document.getElementById('table-select').value;
-            if (tableName) {
-                // Automatically load data when table is selected
-                await selectAllFromTable();
-            }
-        }
-
-        // Clear current log
-        async function clearCurrentLog() {
-            const logName = document.getElementById('log-select').value;
-            if (!logName) {
-                showToast('Please select a log file first');
-                return;
-            }
-
-            if (!confirm(`Are you sure you want to clear the log file "${logName}"?`)) return;
-
-            try {
-                const response = await fetch(`/dashboard/api/logs/${logName}/clear`, {method: 'POST'});
-                const data = await response.json();
-
-                if (data.success) {
-                    showToast(data.message || `Cleared ${logName}`);
-                    loadLog(); // Reload the log to show it's empty
-                } else {
-                    showToast('Failed to clear log: ' + data.error);
-                }
-            } catch (error) {
-                console.error('Error clearing log:', error);
-                showToast('Error clearing log');
-            }
-        }
-
-        // Clear all logs
-        async function clearAllLogs() {
-            if (!confirm('Are you sure you want to clear ALL log files? This action cannot be undone!')) return;
-
-            try {
-                const response = await fetch('/dashboard/api/logs/clear-all', {method: 'POST'});
-                const data = await response.json();
-
-                if (data.success) {
-                    showToast(data.message || 'All logs cleared');
-                    loadLog(); // Reload current log
-                    loadLogFiles(); // Refresh log list
-                } else {
-                    showToast('Failed to clear logs: ' + data.error);
-                }
-            } catch (error) {
-                console.error('Error clearing all logs:', error);
-                showToast('Error clearing all logs');
-            }
-        }
-
-        // Clear database (delete data)
-        async function clearDatabase() {
-            const dbPath = document.getElementById('db-select').value;
-            if (!dbPath) {
-                showToast('Please select a database first');
-                return;
-            }
-
-            const dbName = document.getElementById('db-select').options[document.getElementById('db-select').selectedIndex].text;
-            if (!confirm(`Are you sure you want to DELETE ALL DATA from "${dbName}"? This will remove all records but keep the table structure.`)) return;
-
-            try {
-                const response = await fetch('/dashboard/api/db/clear', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({db_path: dbPath})
-                });
-
-                const data = await response.json();
-
-                if (data.success) {
-                    showToast(data.message || 'Database cleared');
-                    // Clear the results view
-                    document.getElementById('results-content').innerHTML = '<p style="color: #666;">Database cleared. Select a table to see empty structure.</p>';
-                    // Reload current table if selected
-                    const tableName = document.getElementById('table-select').value;
-                    if (tableName) {
-                        selectAllFromTable();
-                    }
-                } else {
-                    showToast('Failed to clear database: ' + data.error);
-                }
-            } catch (error) {
-                console.error('Error clearing database:', error);
-                showToast('Error clearing database');
-            }
-        }
-
-        // Reset database (drop tables)
-        async function resetDatabase() {
-            const dbPath = document.getElementById('db-select').value;
-            if (!dbPath) {
-                showToast('Please select a database first');
-                return;
-            }
-
-            const dbName = document.getElementById('db-select').options[document.getElementById('db-select').selectedIndex].text;
-            if (!confirm(`⚠️ WARNING: Are you sure you want to COMPLETELY RESET "${dbName}"? This will DROP ALL TABLES and cannot be undone!`)) return;
-            if (!confirm(`This is your final warning! All tables and data in "${dbName}" will be permanently deleted. Continue?`)) return;
-
-            try {
-                const response = await fetch('/dashboard/api/db/reset', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({db_path: dbPath})
-                });
-
-                const data = await response.json();
-
-                if (data.success) {
-                    showToast(data.message || 'Database reset');
-                    // Clear everything
-                    document.getElementById('table-select').innerHTML = '<option value="">Select table...</option>';
-                    document.getElementById('results-content').innerHTML = '<p style="color: #666;">Database has been reset. All tables have been dropped.</p>';
-                    // Reload tables (should be empty)
-                    loadDatabaseTables();
-                } else {
-                    showToast('Failed to reset database: ' + data.error);
-                }
-            } catch (error) {
-                console.error('Error resetting database:', error);
-                showToast('Error resetting database');
-            }
-        }
-
-        // Load DCR configuration
-        async function loadDcrConfig() {
-            try {
-                const response = await fetch('/dashboard/api/dcr/config');
-                const data = await response.json();
-
-                if (data.success) {
-                    document.getElementById('dcr-app-id').textContent = data.application_id || 'Not configured';
-                    document.getElementById('dcr-tenant-id').textContent = data.tenant_id || 'common';
-                    document.getElementById('dcr-redirect-uri').value = data.redirect_uri || '';
-
-                    // Show environment value
-                    if (data.env_redirect_uri) {
-                        document.getElementById('dcr-env-value').textContent = data.env_redirect_uri;
-                        document.getElementById('dcr-env-value').style.color = '#28a745';
-                    } else {
-                        document.getElementById('dcr-env-value').textContent = 'Not set in .env';
-                        document.getElementById('dcr-env-value').style.color = '#dc3545';
-                    }
-                } else {
-                    document.getElementById('dcr-app-id').textContent = 'Not configured';
-                    document.getElementById('dcr-tenant-id').textContent = 'Not configured';
-                    document.getElementById('dcr-redirect-uri').value = '';
-                    document.getElementById('dcr-env-value').textContent = data.error || 'Configuration not found';
-                }
-            } catch (error) {
-                console.error('Error loading DCR config:', error);
-                document.getElementById('dcr-app-id').textContent = 'Error loading';
-                document.getElementById('dcr-tenant-id').textContent = 'Error loading';
-            }
-        }
-
-        // Update DCR redirect URI
-        async function updateDcrRedirectUri() {
-            const newUri = document.getElementById('dcr-redirect-uri').value.trim();
-
-            if (!newUri) {
-                showToast('Please enter a redirect URI');
-                return;
-            }
-
-            if (!newUri.startsWith('http://') && !newUri.startsWith('https://')) {
-                showToast('Redirect URI must start with http:// or https://');
-                return;
-            }
-
-            if (!confirm(`Update DCR redirect URI to:\n${newUri}\n\nThis will update both the database and .env file.`)) {
-                return;
-            }
-
-            try {
-                const response = await fetch('/dashboard/api/dcr/redirect-uri', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({redirect_uri: newUri})
-                });
-
-                const data = await response.json();
-
-                if (data.success) {
-                    showToast(data.message || 'DCR redirect URI updated');
-                    // Reload the configuration
-                    loadDcrConfig();
-                    // Also reload env variables
-                    loadEnvVariables();
-                } else {
-                    showToast('Failed to update: ' + data.error);
-                }
-            } catch (error) {
-                console.error('Error updating DCR redirect URI:', error);
-                showToast('Error updating DCR redirect URI');
-            }
-        }
-
-        // Select all from current table
-        async function selectAllFromTable() {
-            const dbPath = document.getElementById('db-select').value;
-            const tableName = document.getElementById('table-select').value;
-
-            if (!dbPath) {
-                showToast('Please select a database');
-                return;
-            }
-
-            if (!tableName) {
-                showToast('Please select a table first');
-                return;
-            }
-
-            const query = `SELECT * FROM ${tableName}`;
-
-            try {
-                const response = await fetch('/dashboard/api/db/query', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({db_path: dbPath, query: query})
-                });
-
-                const data = await response.json();
-
-                if (!data.success) {
-                    document.getElementById('results-content').innerHTML = `<span style="color: red;">Error: ${data.error}</span>`;
-                    return;
-                }
-
-                if (data.rows.length === 0) {
-                    document.getElementById('results-content').innerHTML = '<p style="color: #666;">No results found</p>';
-                    return;
-                }
-
-                let html = `<p style="margin-bottom: 10px;"><strong>${data.row_count} rows</strong></p>`;
-                // Add scrollable container for large datasets
-                html += '<div style="max-height: 600px; overflow: auto; border: 1px solid #ddd; border-radius: 4px; position: relative;">';
-                html += '<table style="width: 100%; border-collapse: collapse; font-size: 11px;">';
-                html += '<thead style="position: sticky; top: 0; z-index: 10;"><tr style="background: #667eea; color: white;">';
-
-                data.columns.forEach(col => {
-                    html += `<th style="padding: 6px; text-align: left; white-space: nowrap;">${col}</th>`;
-                });
-
-                html += '</tr></thead><tbody>';
-
-                data.rows.forEach((row, idx) => {
-                    html += `<tr style="border-bottom: 1px solid #ddd; ${idx % 2 === 0 ? 'background: #f9f9f9;' : ''}">`;
-                    data.columns.forEach(col => {
-                        const value = row[col];
-                        const displayValue = value === null ? '<em style="color: #999;">NULL</em>' : String(value);
-                        html += `<td style="padding: 6px; max-width: 300px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;" title="${String(value)}">${displayValue}</td>`;
-                    });
-                    html += '</tr>';
-                });
-
-                html += '</tbody></table></div>';
-
-                document.getElementById('results-content').innerHTML = html;
-
-                // Add info if there are many rows
-                if (data.row_count > 100) {
-                    showToast(`Showing all ${data.row_count} rows. Scroll to view more.`, 3000);
-                }
-            } catch (error) {
-                console.error('Error executing query:', error);
-                document.getElementById('results-content').innerHTML = `<span style="color: red;">Error: ${error.message}</span>`;
-            }
-        }
-
-        // Auto-refresh every 5 seconds
-        setInterval(() => {
-            loadServerStatus();
-            const logName = document.getElementById('log-select').value;
-            if (logName) loadLog();
-        }, 5000);
-
-        // Initial load
-        loadServerStatus();
-        loadEnvVariables();
-        loadLogFiles();
-        loadDatabases();
-    </script>
+    <script src="__DASHBOARD_JS_URL__" defer></script>
 </body>
 </html>
 """
-        return HTMLResponse(html)
+    dashboard_html = StaticContent(
+        dashboard_template
+        .replace("__DASHBOARD_CSS_URL__", asset_urls["dashboard.css"])
+        .replace("__DASHBOARD_JS_URL__", asset_urls["dashboard.js"]),
+        media_type="text/html",
+    )
+
+    async def dashboard_page(request):
+        """Main dashboard HTML page"""
+        # Check authentication
+        if not check_session(request):
+            return RedirectResponse(url="/dashboard/login", status_code=302)
+
+        # Revalidate on every visit so the session check above is never bypassed
+        return dashboard_html.response(request, cache_control="private, no-cache")
+
+    # Dashboard static assets
+    async def dashboard_static(request):
+        """Serve versioned dashboard JS/CSS"""
+        asset = static_assets.get(request.path_params["asset"])
+        if asset is None:
+            return Response("Not found", status_code=404, media_type="text/plain")
+        return asset.response(request, cache_control="public, max-age=31536000, immutable")
 
     # Require authentication wrapper
     def require_auth(handler):
         """Decorator to require authentication for API endpoints"""
         async def wrapper(request):
             if not check_session(request):
-                return JSONResponse(
+                return ORJSONResponse(
                     {"error": "Authentication required"},
                     status_code=401
                 )
@@ -2301,51 +1698,67 @@ def create_dashboard_routes() -> List[Route]:
     async def api_status(request):
         """Get server and tunnel status"""
         if not check_session(request):
-            return JSONResponse({"error": "Authentication required"}, status_code=401)
+            return ORJSONResponse({"error": "Authentication required"}, status_code=401)
 
-        server_status = service.get_server_status()
-        tunnel_status = service.get_tunnel_status()
-        return JSONResponse({
+        server_status, tunnel_status = await collect_status()
+        return ORJSONResponse({
             "server": server_status,
             "tunnel": tunnel_status
         })
 
+    # API: Get status and endpoints in a single round-trip
+    async def api_status_full(request):
+        """Get server and tunnel status together with endpoints information"""
+        if not check_session(request):
+            return ORJSONResponse({"error": "Authentication required"}, status_code=401)
+
+        server_status, tunnel_status = await collect_status()
+        endpoints = service.get_endpoints_info(tunnel_status.get("url"))
+        return etag_json_response(request, {
+            "server": server_status,
+            "tunnel": tunnel_status,
+            "endpoints": endpoints
+        })
+
+    # Start/stop wait on subprocesses (kill + sleep), so they run in worker threads
+    # and the event loop keeps serving other dashboard requests meanwhile
+
     # API: Start server
     async def api_start_server(request):
         """Start unified server"""
-        result = service.start_server()
-        return JSONResponse(result)
+        result = await asyncio.to_thread(service.start_server)
+        return ORJSONResponse(result)
 
     # API: Stop server
     async def api_stop_server(request):
         """Stop unified server"""
-        result = service.stop_server()
-        return JSONResponse(result)
+        result = await asyncio.to_thread(service.stop_server)
+        return ORJSONResponse(result)
 
     # API: Start tunnel
     async def api_start_tunnel(request):
         """Start Cloudflare tunnel"""
-        result = service.start_tunnel()
-        return JSONResponse(result)
+        result = await asyncio.to_thread(service.start_tunnel)
+        return ORJSONResponse(result)
 
     # API: Stop tunnel
     async def api_stop_tunnel(request):
         """Stop Cloudflare tunnel"""
-        result = service.stop_tunnel()
-        return JSONResponse(result)
+        result = await asyncio.to_thread(service.stop_tunnel)
+        return ORJSONResponse(result)
 
     # API: Get endpoints
     async def api_endpoints(request):
         """Get endpoints information"""
         tunnel_url = request.query_params.get('tunnel_url')
         endpoints = service.get_endpoints_info(tunnel_url)
-        return JSONResponse(endpoints)
+        return etag_json_response(request, endpoints)
 
     # API: Get environment variables
     async def api_get_env(request):
         """Get environment variables"""
         env_vars = service.get_env_variables()
-        return JSONResponse(env_vars)
+        return etag_json_response(request, env_vars)
 
     # API: Update environment variable
     async def api_update_env(request):
@@ -2356,45 +1769,66 @@ def create_dashboard_routes() -> List[Route]:
             value = data.get('value', '')
 
             if not key:
-                return JSONResponse({"error": "Key is required"}, status_code=400)
+                return ORJSONResponse({"error": "Key is required"}, status_code=400)
 
             success = service.update_env_variable(key, value)
             if success:
-                return JSONResponse({"success": True})
+                return ORJSONResponse({"success": True})
             else:
-                return JSONResponse({"error": "Failed to update"}, status_code=500)
+                return ORJSONResponse({"error": "Failed to update"}, status_code=500)
         except Exception as e:
             logger.error(f"Error updating env: {e}")
-            return JSONResponse({"error": str(e)}, status_code=500)
+            return ORJSONResponse({"error": str(e)}, status_code=500)
 
     # API: Get log files
     async def api_logs(request):
         """Get list of log files"""
-        logs = service.get_log_files()
-        return JSONResponse(logs)
+        logs = await asyncio.to_thread(service.get_log_files)
+        return ORJSONResponse(logs)
 
     # API: Get log content
     async def api_log_content(request):
         """Get log file content"""
         log_name = request.path_params['log_name']
         lines = int(request.query_params.get('lines', 100))
-        content = service.get_log_content(log_name, lines)
-        return Response(content, media_type="text/plain")
+
+        # Validator from mtime/size lets idle logs be answered with 304
+        try:
+            stat = (LOG_DIR / log_name).stat()
+        except OSError:
+            content = await asyncio.to_thread(service.get_log_content, log_name, lines)
+            return Response(content, media_type="text/plain")
+
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}-{lines}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        headers = {
+            "ETag": etag,
+            "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+            "Cache-Control": "no-cache"
+        }
+
+        # Stream the tail in chunks (the sync iterator runs in a worker thread)
+        return StreamingResponse(
+            service.iter_log_tail(log_name, lines),
+            media_type="text/plain; charset=utf-8",
+            headers=headers
+        )
 
     # API: Get database list
     async def api_databases(request):
         """Get list of databases"""
-        databases = service.get_database_list()
-        return JSONResponse(databases)
+        databases = await run_db(service.get_database_list)
+        return ORJSONResponse(databases)
 
     # API: Get database tables
     async def api_db_tables(request):
         """Get tables in a database"""
         db_path = request.query_params.get('db_path')
         if not db_path:
-            return JSONResponse({"error": "db_path required"}, status_code=400)
-        tables = service.get_database_tables(db_path)
-        return JSONResponse({"tables": tables})
+            return ORJSONResponse({"error": "db_path required"}, status_code=400)
+        tables = await run_db(service.get_database_tables, db_path)
+        return ORJSONResponse({"tables": tables})
 
     # API: Get table schema
     async def api_table_schema(request):
@@ -2402,9 +1836,9 @@ def create_dashboard_routes() -> List[Route]:
         db_path = request.query_params.get('db_path')
         table_name = request.query_params.get('table')
         if not db_path or not table_name:
-            return JSONResponse({"error": "db_path and table required"}, status_code=400)
-        schema = service.get_table_schema(db_path, table_name)
-        return JSONResponse({"schema": schema})
+            return ORJSONResponse({"error": "db_path and table required"}, status_code=400)
+        schema = await run_db(service.get_table_schema, db_path, table_name)
+        return ORJSONResponse({"schema": schema})
 
     # API: Query database
     async def api_query_db(request):
@@ -2413,29 +1847,49 @@ def create_dashboard_routes() -> List[Route]:
             data = await request.json()
             db_path = data.get('db_path')
             query = data.get('query')
-            limit = data.get('limit', None)  # Make limit optional
+            limit = data.get('limit', None)
+            offset = data.get('offset', 0)
 
             if not db_path or not query:
-                return JSONResponse({"error": "db_path and query required"}, status_code=400)
+                return ORJSONResponse({"error": "db_path and query required"}, status_code=400)
+
+            try:
+                limit = None if limit is None else int(limit)
+                offset = int(offset or 0)
+            except (TypeError, ValueError):
+                return ORJSONResponse({"error": "limit and offset must be integers"}, status_code=400)
+            if (limit is not None and limit < 1) or offset < 0:
+                return ORJSONResponse({"error": "limit must be positive and offset non-negative"}, status_code=400)
+
+            # SELECTs are always paged so a table dump never pulls every row at once
+            if limit is None and service._is_select(query):
+                limit = DEFAULT_QUERY_LIMIT
+
+            # Stream rows as NDJSON when requested, so large results are never fully buffered
+            if data.get('stream'):
+                return StreamingResponse(
+                    stream_db(service.iter_query_rows, db_path, query, limit, offset),
+                    media_type="application/x-ndjson"
+                )
 
-            result = service.query_database(db_path, query, limit)
-            return JSONResponse(result)
+            result = await run_db(service.query_database, db_path, query, limit, offset)
+            return ORJSONResponse(result)
         except Exception as e:
             logger.error(f"Error in query API: {e}")
-            return JSONResponse({"error": str(e)}, status_code=500)
+            return ORJSONResponse({"error": str(e)}, status_code=500)
 
     # API: Clear log file
     async def api_clear_log(request):
         """Clear a specific log file"""
         log_name = request.path_params['log_name']
         result = service.clear_log_file(log_name)
-        return JSONResponse(result)
+        return ORJSONResponse(result)
 
     # API: Clear all logs
     async def api_clear_all_logs(request):
         """Clear all log files"""
         result = service.clear_all_logs()
-        return JSONResponse(result)
+        return ORJSONResponse(result)
 
     # API: Clear database
     async def api_clear_database(request):
@@ -2444,12 +1898,12 @@ def create_dashboard_routes() -> List[Route]:
             data = await request.json()
             db_path = data.get('db_path')
             if not db_path:
-                return JSONResponse({"error": "db_path required"}, status_code=400)
-            result = service.clear_database(db_path)
-            return JSONResponse(result)
+                return ORJSONResponse({"error": "db_path required"}, status_code=400)
+            result = await run_db(service.clear_database, db_path)
+            return ORJSONResponse(result)
         except Exception as e:
             logger.error(f"Error clearing database: {e}")
-            return JSONResponse({"error": str(e)}, status_code=500)
+            return ORJSONResponse({"error": str(e)}, status_code=500)
 
     # API: Reset database
     async def api_reset_database(request):
@@ -2458,18 +1912,18 @@ def create_dashboard_routes() -> List[Route]:
             data = await request.json()
             db_path = data.get('db_path')
             if not db_path:
-                return JSONResponse({"error": "db_path required"}, status_code=400)
-            result = service.reset_database(db_path)
-            return JSONResponse(result)
+                return ORJSONResponse({"error": "db_path required"}, status_code=400)
+            result = await run_db(service.reset_database, db_path)
+            return ORJSONResponse(result)
         except Exception as e:
             logger.error(f"Error resetting database: {e}")
-            return JSONResponse({"error": str(e)}, status_code=500)
+            return ORJSONResponse({"error": str(e)}, status_code=500)
 
     # API: Get DCR configuration
     async def api_get_dcr_config(request):
         """Get current DCR configuration"""
         result = service.get_dcr_config()
-        return JSONResponse(result)
+        return ORJSONResponse(result)
 
     # API: Get DCR database logs
     async def api_get_dcr_logs(request):
@@ -2485,7 +1939,7 @@ def create_dashboard_routes() -> List[Route]:
 
             logs = dcr_logger.get_recent_logs(limit, operation)
 
-            return JSONResponse({
+            return ORJSONResponse({
                 "success": True,
                 "count": len(logs),
                 "logs": logs
@@ -2493,7 +1947,7 @@ def create_dashboard_routes() -> List[Route]:
 
         except Exception as e:
             logger.error(f"Error getting DCR logs: {e}")
-            return JSONResponse({"success": False, "error": str(e)})
+            return ORJSONResponse({"success": False, "error": str(e)})
 
     # API: Get DCR database log statistics
     async def api_get_dcr_log_stats(request):
@@ -2504,14 +1958,14 @@ def create_dashboard_routes() -> List[Route]:
             dcr_logger = get_dcr_db_logger()
             stats = dcr_logger.get_statistics()
 
-            return JSONResponse({
+            return ORJSONResponse({
                 "success": True,
                 "statistics": stats
             })
 
         except Exception as e:
             logger.error(f"Error getting DCR log stats: {e}")
-            return JSONResponse({"success": False, "error": str(e)})
+            return ORJSONResponse({"success": False, "error": str(e)})
 
     # API: Update DCR redirect URI
     async def api_update_dcr_redirect_uri(request):
@@ -2520,12 +1974,12 @@ def create_dashboard_routes() -> List[Route]:
             data = await request.json()
             new_redirect_uri = data.get('redirect_uri')
             if not new_redirect_uri:
-                return JSONResponse({"error": "redirect_uri required"}, status_code=400)
+                return ORJSONResponse({"error": "redirect_uri required"}, status_code=400)
             result = service.update_dcr_redirect_uri(new_redirect_uri)
-            return JSONResponse(result)
+            return ORJSONResponse(result)
         except Exception as e:
             logger.error(f"Error updating DCR redirect URI: {e}")
-            return JSONResponse({"error": str(e)}, status_code=500)
+            return ORJSONResponse({"error": str(e)}, status_code=500)
 
     return [
         # Authentication routes (no auth required)
@@ -2534,7 +1988,9 @@ def create_dashboard_routes() -> List[Route]:
         Route("/dashboard/logout", endpoint=api_logout, methods=["GET"]),
         # Dashboard routes (auth required)
         Route("/dashboard", endpoint=dashboard_page, methods=["GET"]),
+        Route("/dashboard/static/{asset}", endpoint=dashboard_static, methods=["GET"]),
         Route("/dashboard/api/status", endpoint=api_status, methods=["GET"]),
+        Route("/dashboard/api/status_full", endpoint=api_status_full, methods=["GET"]),
         Route("/dashboard/api/server/start", endpoint=api_start_server, methods=["POST"]),
         Route("/dashboard/api/server/stop", endpoint=api_stop_server, methods=["POST"]),
         Route("/dashboard/api/tunnel/start", endpoint=api_start_tunnel, methods=["POST"]),
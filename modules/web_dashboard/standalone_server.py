@@ -6,6 +6,7 @@ a web interface for managing the system.
 """
 
 import argparse
+import importlib.util
 import os
 import sys
 from pathlib import Path
@@ -23,6 +24,14 @@ from infra.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Import string for uvicorn, so worker processes can build their own app
+APP_FACTORY = "modules.web_dashboard.standalone_server:create_standalone_app"
+
+# Command-line defaults, read from the environment once at import
+_DEFAULT_PORT = int(os.environ.get("DASHBOARD_PORT", "9000"))
+_DEFAULT_HOST = os.environ.get("DASHBOARD_HOST", "0.0.0.0")
+_DEFAULT_WORKERS = int(os.environ.get("DASHBOARD_WORKERS", "1"))
+
 
 def create_standalone_app():
     """Create standalone dashboard application"""
@@ -35,19 +44,42 @@ def create_standalone_app():
     return app
 
 
+def _server_implementations():
+    """Pick the uvloop event loop and httptools parser when installed
+
+    Both come with ``uvicorn[standard]``; uvloop is unavailable on Windows,
+    where the stock asyncio loop and h11 parser are used instead.
+    """
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    return loop, http
+
+
 def main():
     """Main entry point for standalone dashboard server"""
     parser = argparse.ArgumentParser(description="Standalone Web Dashboard Server")
     parser.add_argument(
         "--port",
         type=int,
-        default=int(os.getenv("DASHBOARD_PORT", "9000")),
-        help="Port for dashboard server (default: 9000)",
+        default=_DEFAULT_PORT,
+        help=f"Port for dashboard server (default: {_DEFAULT_PORT})",
     )
     parser.add_argument(
         "--host",
-        default=os.getenv("DASHBOARD_HOST", "0.0.0.0"),
-        help="Host for dashboard server (default: 0.0.0.0)",
+        default=_DEFAULT_HOST,
+        help=f"Host for dashboard server (default: {_DEFAULT_HOST})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=_DEFAULT_WORKERS,
+        help="Number of worker processes (default: 1). Login sessions are kept "
+        "in memory per process, so more than one worker needs sticky routing",
+    )
+    parser.add_argument(
+        "--access-log",
+        action="store_true",
+        help="Log every HTTP request (default: off; dashboard polling makes it noisy)",
     )
 
     args = parser.parse_args()
@@ -56,13 +88,28 @@ def main():
     logger.info(f"🚀 Starting Standalone Web Dashboard Server")
     logger.info(f"📁 Project root: {PROJECT_ROOT}")
     logger.info(f"🌐 Server will listen on http://{args.host}:{args.port}")
+    loop, http = _server_implementations()
+    logger.info(f"⚙️ Event loop: {loop}, HTTP parser: {http}, workers: {args.workers}")
+    if args.workers > 1:
+        logger.warning("⚠️ Dashboard sessions are not shared between workers")
     logger.info("=" * 80)
     logger.info(f"📊 Dashboard: http://{args.host}:{args.port}/dashboard")
     logger.info("=" * 80)
 
-    # Create and run app
-    app = create_standalone_app()
-    uvicorn.run(app, host=args.host, port=args.port, log_level="info")
+    # Pass the factory by import string; uvicorn cannot fork workers from a live app
+    uvicorn.run(
+        APP_FACTORY,
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        # uvicorn.access logs at INFO, so the level only drops when it is off
+        log_level="info" if args.access_log else "warning",
+        access_log=args.access_log,
+        loop=loop,
+        http=http,
+        proxy_headers=True,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,1015 @@
+// Auto-refresh interval: ?refresh=<seconds> overrides and is remembered
+const REFRESH_DEFAULT_SEC = 30;
+const refreshMs = (() => {
+    const fromQuery = parseInt(new URLSearchParams(location.search).get('refresh'), 10);
+    if (fromQuery > 0) {
+        localStorage.setItem('dashboardRefreshSec', String(fromQuery));
+    }
+    const seconds = fromQuery > 0
+        ? fromQuery
+        : (parseInt(localStorage.getItem('dashboardRefreshSec'), 10) || REFRESH_DEFAULT_SEC);
+    return Math.max(1000, seconds * 1000);
+})();
+
+// Number of result rows mounted per scroll step in the Database tab
+const RESULTS_PAGE_SIZE = 100;
+
+// Number of rows requested from the server per table query page
+const QUERY_PAGE_SIZE = 1000;
+
+// Tab switching
+function switchTab(tabName) {
+    // Hide all tab contents
+    document.querySelectorAll('.tab-content').forEach(content => {
+        content.classList.remove('active');
+    });
+
+    // Remove active class from all tabs
+    document.querySelectorAll('.tab').forEach(tab => {
+        tab.classList.remove('active');
+    });
+
+    // Show selected tab content
+    document.getElementById(tabName + '-tab').classList.add('active');
+
+    // Add active class to clicked tab
+    event.target.classList.add('active');
+}
+
+// Copy to clipboard helper
+function copyToClipboard(text) {
+    navigator.clipboard.writeText(text).then(() => {
+        showToast('Copied to clipboard!');
+    });
+}
+
+// Share one in-flight call per key, so overlapping refreshes reuse the same request
+function dedupe(fn, keyFn = () => '') {
+    const inFlight = new Map();
+    return (...args) => {
+        const key = keyFn(...args);
+        if (!inFlight.has(key)) {
+            inFlight.set(key, fn(...args).finally(() => inFlight.delete(key)));
+        }
+        return inFlight.get(key);
+    };
+}
+
+// Conditional GET: resolves to null when the server replies 304 Not Modified
+const _etags = {};
+async function fetchIfChanged(url) {
+    const headers = _etags[url] ? {'If-None-Match': _etags[url]} : {};
+    const response = await fetch(url, {headers});
+    if (response.status === 304) return null;
+    const etag = response.headers.get('ETag');
+    if (etag) _etags[url] = etag;
+    return response;
+}
+
+async function fetchJsonIfChanged(url) {
+    const response = await fetchIfChanged(url);
+    return response ? response.json() : null;
+}
+
+// Remember the last rendered payload per element to skip identical DOM writes
+const _lastHash = {};
+function payloadChanged(key, data) {
+    const hash = JSON.stringify(data);
+    if (_lastHash[key] === hash) return false;
+    _lastHash[key] = hash;
+    return true;
+}
+
+// Show toast notification
+function showToast(message) {
+    const toast = document.createElement('div');
+    toast.className = 'toast';
+    toast.textContent = message;
+    document.body.appendChild(toast);
+    setTimeout(() => toast.remove(), 3000);
+}
+
+// Load server status
+async function fetchServerStatus() {
+    try {
+        const data = await fetchJsonIfChanged('/dashboard/api/status_full');
+        if (!data) return;
+
+        const serverHtml = data.server.status === 'running' ? `
+            <span class="status-badge status-running">RUNNING</span>
+            <div class="info-row">
+                <span class="info-label">PID:</span>
+                <span class="info-value">${data.server.pid}</span>
+            </div>
+            <div class="info-row">
+                <span class="info-label">Endpoint:</span>
+                <span class="info-value">
+                    <a href="${data.server.endpoint}/health" target="_blank" class="url-copy">
+                        ${data.server.endpoint}
+                    </a>
+                </span>
+            </div>
+        ` : `<span class="status-badge status-stopped">STOPPED</span>`;
+
+        const tunnelHtml = data.tunnel.status === 'running' ? `
+            <span class="status-badge status-running">RUNNING</span>
+            <div class="info-row">
+                <span class="info-label">PID:</span>
+                <span class="info-value">${data.tunnel.pid}</span>
+            </div>
+            ${data.tunnel.url ? `
+            <div class="info-row">
+                <span class="info-label">Public URL:</span>
+                <span class="info-value">
+                    <a href="${data.tunnel.url}" target="_blank" class="url-copy" onclick="copyToClipboard('${data.tunnel.url}'); event.preventDefault();">
+                        ${data.tunnel.url}
+                    </a>
+                </span>
+            </div>
+            ` : ''}
+        ` : `<span class="status-badge status-stopped">STOPPED</span>`;
+
+        if (payloadChanged('server-status', data.server)) {
+            document.getElementById('server-status').innerHTML = serverHtml;
+        }
+        if (payloadChanged('tunnel-status', data.tunnel)) {
+            document.getElementById('tunnel-status').innerHTML = tunnelHtml;
+        }
+
+        // Endpoints are resolved server-side against the tunnel URL
+        if (payloadChanged('endpoints-info', data.endpoints)) {
+            renderEndpoints(data.endpoints);
+        }
+    } catch (error) {
+        console.error('Error loading status:', error);
+    }
+}
+const loadServerStatus = dedupe(fetchServerStatus);
+
+// Render endpoints
+function renderEndpoints(data) {
+    try {
+        const parts = [];
+
+        // Redirect URIs for Azure AD App Registration - FIRST
+        if (data.redirect_uris) {
+            parts.push('<div style="padding: 15px; background: #fff3cd; border-radius: 8px; border: 1px solid #ffc107;">');
+            parts.push('<h3 style="margin-bottom: 10px; color: #856404;">🔐 OAuth Redirect URIs (Azure AD App Registration)</h3>');
+            parts.push('<p style="font-size: 11px; color: #856404; margin-bottom: 15px;">Click to copy these URIs for Azure AD App Registration</p>');
+            parts.push('<div style="font-size: 12px;">');
+            for (const [key, value] of Object.entries(data.redirect_uris)) {
+                parts.push(`
+                    <div style="margin: 10px 0; padding: 10px; background: white; border-radius: 5px; cursor: pointer; transition: all 0.3s;"
+                         onmouseover="this.style.background='#f8f9fa'"
+                         onmouseout="this.style.background='white'"
+                         onclick="copyToClipboard('${value}'); event.preventDefault();">
+                        <div style="font-weight: bold; color: #495057; margin-bottom: 5px;">${key}:</div>
+                        <div style="font-family: monospace; color: #007bff; word-break: break-all;">
+                            ${value}
+                        </div>
+                        <div style="font-size: 10px; color: #6c757d; margin-top: 5px;">📋 Click to copy</div>
+                    </div>
+                `);
+            }
+            parts.push('</div></div>');
+        }
+
+        // OAuth endpoints - SECOND
+        parts.push('<div style="margin-top: 20px; padding: 15px; background: #f0f9ff; border-radius: 8px;">');
+        parts.push('<h3 style="margin-bottom: 10px; color: #667eea;">OAuth Endpoints</h3>');
+        parts.push('<div style="font-size: 12px;">');
+        for (const [key, value] of Object.entries(data.oauth)) {
+            parts.push(`
+                <div style="margin: 5px 0;">
+                    <strong>${key}:</strong>
+                    <a href="${value}" class="url-copy" onclick="copyToClipboard('${value}'); event.preventDefault();">${value}</a>
+                </div>
+            `);
+        }
+        parts.push('</div></div>');
+
+        // Services - THIRD
+        parts.push('<div style="margin-top: 20px; display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 15px;">');
+        data.services.forEach(service => {
+            parts.push(`
+                <div style="padding: 15px; background: #f9f9f9; border-radius: 8px;">
+                    <h3 style="margin-bottom: 10px; color: #667eea;">${service.name}</h3>
+                    <div style="font-size: 12px;">
+                        <div style="margin: 5px 0;">
+                            <a href="${service.url}" target="_blank" class="url-copy" onclick="copyToClipboard('${service.url}'); event.preventDefault();">
+                                ${service.url}
+                            </a>
+                        </div>
+                    </div>
+                </div>
+            `);
+        });
+        parts.push('</div>');
+
+        document.getElementById('endpoints-info').innerHTML = parts.join('');
+    } catch (error) {
+        console.error('Error rendering endpoints:', error);
+    }
+}
+
+// Load environment variables
+async function loadEnvVariables() {
+    try {
+        const data = await fetchJsonIfChanged('/dashboard/api/env');
+        if (!data || !payloadChanged('env-variables', data)) return;
+
+        // Update dropdown
+        const select = document.getElementById('env-select');
+        const options = document.createDocumentFragment();
+        options.appendChild(new Option('Select a variable to edit or enter new...', ''));
+
+        const frag = document.createDocumentFragment();
+        for (const [key, value] of Object.entries(data)) {
+            // Add to dropdown
+            const option = new Option(key, key);
+            option.setAttribute('data-value', value);
+            options.appendChild(option);
+
+            // Add to display list with edit button
+            const item = document.createElement('div');
+            item.className = 'env-item';
+            const keyEl = document.createElement('span');
+            keyEl.className = 'env-key';
+            keyEl.textContent = key;
+            const valueEl = document.createElement('span');
+            valueEl.className = 'env-value';
+            valueEl.textContent = value;
+            const editBtn = document.createElement('button');
+            editBtn.className = 'btn btn-primary';
+            editBtn.style.cssText = 'margin-left: auto; padding: 5px 10px; font-size: 12px;';
+            editBtn.textContent = '✏️ Edit';
+            editBtn.addEventListener('click', () => editEnvVariable(key, value));
+            item.append(keyEl, valueEl, editBtn);
+            frag.appendChild(item);
+        }
+        select.replaceChildren(options);
+
+        const envList = document.getElementById('env-variables');
+        if (frag.childNodes.length) {
+            envList.replaceChildren(frag);
+        } else {
+            envList.innerHTML = '<p style="color: #666;">No environment variables found</p>';
+        }
+    } catch (error) {
+        console.error('Error loading env variables:', error);
+    }
+}
+
+// Handle environment variable selection
+function onEnvSelect() {
+    const select = document.getElementById('env-select');
+    const selectedOption = select.options[select.selectedIndex];
+
+    if (selectedOption.value) {
+        const value = selectedOption.getAttribute('data-value');
+        document.getElementById('new-env-key').value = selectedOption.value;
+        document.getElementById('new-env-value').value = value;
+    }
+}
+
+// Edit environment variable
+function editEnvVariable(key, value) {
+    document.getElementById('new-env-key').value = key;
+    document.getElementById('new-env-value').value = value;
+
+    // Update dropdown selection
+    const select = document.getElementById('env-select');
+    select.value = key;
+
+    // Scroll to editor
+    document.getElementById('env-tab').scrollIntoView({ behavior: 'smooth' });
+}
+
+// Clear environment form
+function clearEnvForm() {
+    document.getElementById('new-env-key').value = '';
+    document.getElementById('new-env-value').value = '';
+    document.getElementById('env-select').value = '';
+}
+
+// Add environment variable
+async function addEnvVariable() {
+    const key = document.getElementById('new-env-key').value.trim();
+    const value = document.getElementById('new-env-value').value.trim();
+
+    if (!key) {
+        showToast('Please enter a variable name');
+        return;
+    }
+
+    try {
+        const response = await fetch('/dashboard/api/env', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({key, value})
+        });
+
+        if (response.ok) {
+            showToast('Environment variable updated!');
+            document.getElementById('new-env-key').value = '';
+            document.getElementById('new-env-value').value = '';
+            loadEnvVariables();
+        } else {
+            showToast('Failed to update variable');
+        }
+    } catch (error) {
+        console.error('Error updating env variable:', error);
+        showToast('Error updating variable');
+    }
+}
+
+// Load log files list
+async function loadLogFiles() {
+    try {
+        const response = await fetch('/dashboard/api/logs');
+        const data = await response.json();
+
+        // Build the options off-document and swap them in with a single reflow
+        const select = document.getElementById('log-select');
+        const frag = document.createDocumentFragment();
+        frag.appendChild(new Option('Select a log file...', ''));
+        data.forEach(log => {
+            frag.appendChild(new Option(`${log.name} (${log.size_mb} MB)`, log.name));
+        });
+        select.replaceChildren(frag);
+    } catch (error) {
+        console.error('Error loading log files:', error);
+    }
+}
+
+// Load selected log
+let displayedLogName = null;
+async function fetchLog() {
+    const logName = document.getElementById('log-select').value;
+    if (!logName) return;
+
+    try {
+        // A 304 only means "unchanged" if this log is the one currently displayed
+        const url = `/dashboard/api/logs/${logName}?lines=200`;
+        if (logName !== displayedLogName) delete _etags[url];
+
+        const response = await fetchIfChanged(url);
+        if (!response) return;
+        const text = await response.text();
+        document.getElementById('log-content').textContent = text || 'Log file is empty';
+        displayedLogName = logName;
+    } catch (error) {
+        console.error('Error loading log:', error);
+        document.getElementById('log-content').textContent = 'Error loading log file';
+    }
+}
+const loadLog = dedupe(fetchLog, () => document.getElementById('log-select').value);
+
+// Start server
+async function startServer() {
+    try {
+        const response = await fetch('/dashboard/api/server/start', {method: 'POST'});
+        const data = await response.json();
+
+        if (data.success) {
+            showToast('Server started successfully!');
+            setTimeout(() => loadServerStatus(), 2000);
+        } else {
+            showToast('Failed to start server: ' + data.error);
+        }
+    } catch (error) {
+        console.error('Error starting server:', error);
+        showToast('Error starting server');
+    }
+}
+
+// Stop server
+async function stopServer() {
+    if (!confirm('Are you sure you want to stop the server?')) return;
+
+    try {
+        const response = await fetch('/dashboard/api/server/stop', {method: 'POST'});
+        const data = await response.json();
+
+        if (data.success) {
+            showToast('Server stopped successfully!');
+            setTimeout(() => loadServerStatus(), 2000);
+        } else {
+            showToast('Failed to stop server: ' + data.error);
+        }
+    } catch (error) {
+        console.error('Error stopping server:', error);
+        showToast('Error stopping server');
+    }
+}
+
+// Start tunnel
+async function startTunnel() {
+    try {
+        showToast('Starting tunnel... This may take up to 20 seconds.');
+        const response = await fetch('/dashboard/api/tunnel/start', {method: 'POST'});
+        const data = await response.json();
+
+        if (data.success) {
+            showToast(data.message || 'Tunnel started successfully!');
+            setTimeout(() => loadServerStatus(), 3000);
+        } else {
+            showToast('Failed to start tunnel: ' + data.error);
+        }
+    } catch (error) {
+        console.error('Error starting tunnel:', error);
+        showToast('Error starting tunnel');
+    }
+}
+
+// Stop tunnel
+async function stopTunnel() {
+    if (!confirm('Are you sure you want to stop the tunnel?')) return;
+
+    try {
+        const response = await fetch('/dashboard/api/tunnel/stop', {method: 'POST'});
+        const data = await response.json();
+
+        if (data.success) {
+            showToast('Tunnel stopped successfully!');
+            setTimeout(() => loadServerStatus(), 2000);
+        } else {
+            showToast('Failed to stop tunnel: ' + data.error);
+        }
+    } catch (error) {
+        console.error('Error stopping tunnel:', error);
+        showToast('Error stopping tunnel');
+    }
+}
+
+// Load databases list
+async function loadDatabases() {
+    try {
+        const response = await fetch('/dashboard/api/databases');
+        const data = await response.json();
+
+        // Build the options off-document and swap them in with a single reflow
+        const select = document.getElementById('db-select');
+        const frag = document.createDocumentFragment();
+        frag.appendChild(new Option('Select database...', ''));
+
+        let dcrDbPath = null;
+        data.forEach(db => {
+            frag.appendChild(new Option(`${db.name} (${db.size_mb} MB)`, db.path));
+
+            // Find DCR database path
+            if (db.name.includes('DCR Database') || db.path.includes('dcr.db')) {
+                dcrDbPath = db.path;
+            }
+        });
+        select.replaceChildren(frag);
+
+        // Auto-select DCR database and load tables
+        if (dcrDbPath) {
+            select.value = dcrDbPath;
+            await loadDatabaseTables();
+
+            // Load DCR config when DCR database is selected
+            loadDcrConfig();
+
+            // Tables are populated once loadDatabaseTables resolves, so select
+            // dcr_azure_app right away if it exists
+            const tableSelect = document.getElementById('table-select');
+            if (tableSelect) {
+                // Look for dcr_azure_app option
+                for (let option of tableSelect.options) {
+                    if (option.value === 'dcr_azure_app') {
+                        tableSelect.value = 'dcr_azure_app';
+                        // Automatically load the data
+                        await selectAllFromTable();
+                        break;
+                    }
+                }
+            }
+        }
+    } catch (error) {
+        console.error('Error loading databases:', error);
+    }
+}
+
+// Load tables for selected database
+async function loadDatabaseTables() {
+    const dbPath = document.getElementById('db-select').value;
+    if (!dbPath) return;
+
+    try {
+        const response = await fetch(`/dashboard/api/db/tables?db_path=${encodeURIComponent(dbPath)}`);
+        const data = await response.json();
+
+        // Build the options off-document and swap them in with a single reflow
+        const select = document.getElementById('table-select');
+        const frag = document.createDocumentFragment();
+        frag.appendChild(new Option('Select table...', ''));
+        data.tables.forEach(table => {
+            frag.appendChild(new Option(table, table));
+        });
+        select.replaceChildren(frag);
+
+        // Check if DCR database is selected
+        if (dbPath.includes('dcr.db')) {
+            // Show DCR config section
+            document.getElementById('dcr-config-section').style.display = 'block';
+            loadDcrConfig();
+        } else {
+            // Hide DCR config section
+            document.getElementById('dcr-config-section').style.display = 'none';
+        }
+
+        // Clear results
+        document.getElementById('results-content').innerHTML = 'Select a table to see data';
+    } catch (error) {
+        console.error('Error loading tables:', error);
+    }
+}
+
+// Called when table is selected (debounced so arrow-key browsing runs one query)
+let _tableSelectDebounce = null;
+function onTableSelect() {
+    clearTimeout(_tableSelectDebounce);
+    const tableName = document.getElementById('table-select').value;
+    if (tableName) {
+        // Automatically load data when table is selected
+        _tableSelectDebounce = setTimeout(selectAllFromTable, 200);
+    }
+}
+
+// Clear current log
+async function clearCurrentLog() {
+    const logName = document.getElementById('log-select').value;
+    if (!logName) {
+        showToast('Please select a log file first');
+        return;
+    }
+
+    if (!confirm(`Are you sure you want to clear the log file "${logName}"?`)) return;
+
+    try {
+        const response = await fetch(`/dashboard/api/logs/${logName}/clear`, {method: 'POST'});
+        const data = await response.json();
+
+        if (data.success) {
+            showToast(data.message || `Cleared ${logName}`);
+            loadLog(); // Reload the log to show it's empty
+        } else {
+            showToast('Failed to clear log: ' + data.error);
+        }
+    } catch (error) {
+        console.error('Error clearing log:', error);
+        showToast('Error clearing log');
+    }
+}
+
+// Clear all logs
+async function clearAllLogs() {
+    if (!confirm('Are you sure you want to clear ALL log files? This action cannot be undone!')) return;
+
+    try {
+        const response = await fetch('/dashboard/api/logs/clear-all', {method: 'POST'});
+        const data = await response.json();
+
+        if (data.success) {
+            showToast(data.message || 'All logs cleared');
+            loadLog(); // Reload current log
+            loadLogFiles(); // Refresh log list
+        } else {
+            showToast('Failed to clear logs: ' + data.error);
+        }
+    } catch (error) {
+        console.error('Error clearing all logs:', error);
+        showToast('Error clearing all logs');
+    }
+}
+
+// Clear database (delete data)
+async function clearDatabase() {
+    const dbPath = document.getElementById('db-select').value;
+    if (!dbPath) {
+        showToast('Please select a database first');
+        return;
+    }
+
+    const dbName = document.getElementById('db-select').options[document.getElementById('db-select').selectedIndex].text;
+    if (!confirm(`Are you sure you want to DELETE ALL DATA from "${dbName}"? This will remove all records but keep the table structure.`)) return;
+
+    try {
+        const response = await fetch('/dashboard/api/db/clear', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({db_path: dbPath})
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            showToast(data.message || 'Database cleared');
+            // Clear the results view
+            document.getElementById('results-content').innerHTML = '<p style="color: #666;">Database cleared. Select a table to see empty structure.</p>';
+            // Reload current table if selected
+            const tableName = document.getElementById('table-select').value;
+            if (tableName) {
+                selectAllFromTable();
+            }
+        } else {
+            showToast('Failed to clear database: ' + data.error);
+        }
+    } catch (error) {
+        console.error('Error clearing database:', error);
+        showToast('Error clearing database');
+    }
+}
+
+// Reset database (drop tables)
+async function resetDatabase() {
+    const dbPath = document.getElementById('db-select').value;
+    if (!dbPath) {
+        showToast('Please select a database first');
+        return;
+    }
+
+    const dbName = document.getElementById('db-select').options[document.getElementById('db-select').selectedIndex].text;
+    if (!confirm(`⚠️ WARNING: Are you sure you want to COMPLETELY RESET "${dbName}"? This will DROP ALL TABLES and cannot be undone!`)) return;
+    if (!confirm(`This is your final warning! All tables and data in "${dbName}" will be permanently deleted. Continue?`)) return;
+
+    try {
+        const response = await fetch('/dashboard/api/db/reset', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({db_path: dbPath})
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            showToast(data.message || 'Database reset');
+            // Clear everything
+            document.getElementById('table-select').innerHTML = '<option value="">Select table...</option>';
+            document.getElementById('results-content').innerHTML = '<p style="color: #666;">Database has been reset. All tables have been dropped.</p>';
+            // Reload tables (should be empty)
+            loadDatabaseTables();
+        } else {
+            showToast('Failed to reset database: ' + data.error);
+        }
+    } catch (error) {
+        console.error('Error resetting database:', error);
+        showToast('Error resetting database');
+    }
+}
+
+// Load DCR configuration
+async function loadDcrConfig() {
+    try {
+        const response = await fetch('/dashboard/api/dcr/config');
+        const data = await response.json();
+
+        if (data.success) {
+            document.getElementById('dcr-app-id').textContent = data.application_id || 'Not configured';
+            document.getElementById('dcr-tenant-id').textContent = data.tenant_id || 'common';
+            document.getElementById('dcr-redirect-uri').value = data.redirect_uri || '';
+
+            // Show environment value
+            if (data.env_redirect_uri) {
+                document.getElementById('dcr-env-value').textContent = data.env_redirect_uri;
+                document.getElementById('dcr-env-value').style.color = '#28a745';
+            } else {
+                document.getElementById('dcr-env-value').textContent = 'Not set in .env';
+                document.getElementById('dcr-env-value').style.color = '#dc3545';
+            }
+        } else {
+            document.getElementById('dcr-app-id').textContent = 'Not configured';
+            document.getElementById('dcr-tenant-id').textContent = 'Not configured';
+            document.getElementById('dcr-redirect-uri').value = '';
+            document.getElementById('dcr-env-value').textContent = data.error || 'Configuration not found';
+        }
+    } catch (error) {
+        console.error('Error loading DCR config:', error);
+        document.getElementById('dcr-app-id').textContent = 'Error loading';
+        document.getElementById('dcr-tenant-id').textContent = 'Error loading';
+    }
+}
+
+// Update DCR redirect URI
+async function updateDcrRedirectUri() {
+    const newUri = document.getElementById('dcr-redirect-uri').value.trim();
+
+    if (!newUri) {
+        showToast('Please enter a redirect URI');
+        return;
+    }
+
+    if (!newUri.startsWith('http://') && !newUri.startsWith('https://')) {
+        showToast('Redirect URI must start with http:// or https://');
+        return;
+    }
+
+    if (!confirm(`Update DCR redirect URI to:\n${newUri}\n\nThis will update both the database and .env file.`)) {
+        return;
+    }
+
+    try {
+        const response = await fetch('/dashboard/api/dcr/redirect-uri', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({redirect_uri: newUri})
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            showToast(data.message || 'DCR redirect URI updated');
+            // Reload the configuration
+            loadDcrConfig();
+            // Also reload env variables
+            loadEnvVariables();
+        } else {
+            showToast('Failed to update: ' + data.error);
+        }
+    } catch (error) {
+        console.error('Error updating DCR redirect URI:', error);
+        showToast('Error updating DCR redirect URI');
+    }
+}
+
+// Select all from current table
+let _queryAbort = null;
+async function selectAllFromTable() {
+    const dbPath = document.getElementById('db-select').value;
+    const tableName = document.getElementById('table-select').value;
+
+    if (!dbPath) {
+        showToast('Please select a database');
+        return;
+    }
+
+    if (!tableName) {
+        showToast('Please select a table first');
+        return;
+    }
+
+    const query = `SELECT * FROM ${tableName}`;
+    const resultsEl = document.getElementById('results-content');
+    const state = {columns: [], rows: [], view: null};
+
+    // Fetch the next page (offset = rows already loaded) into the same view
+    const loadPage = async () => {
+        // Cancel the previous query so its stream (and server-side cursor) is released
+        if (_queryAbort) _queryAbort.abort();
+        const abort = new AbortController();
+        _queryAbort = abort;
+
+        const firstPage = state.rows.length === 0;
+        try {
+            const end = await streamTableRows(dbPath, query, state, resultsEl, abort.signal);
+            if (!end) return;
+
+            if (state.rows.length === 0) {
+                resultsEl.innerHTML = '<p style="color: #666;">No results found</p>';
+                return;
+            }
+
+            state.view.setLoadMore(end.has_more ? loadPage : null);
+            requestAnimationFrame(() => {
+                // Add info if there are many rows
+                if (firstPage && state.rows.length > 100) {
+                    showToast(`Loaded ${state.rows.length} rows. Scroll to view more.`, 3000);
+                }
+            });
+        } catch (error) {
+            if (state.view) state.view.cancel();
+            if (error.name === 'AbortError') return;
+            console.error('Error executing query:', error);
+            renderResultsError(resultsEl, error.message);
+        } finally {
+            if (_queryAbort === abort) _queryAbort = null;
+        }
+    };
+
+    await loadPage();
+}
+
+// Stream one page of query rows into state; returns the end marker, or null on error
+async function streamTableRows(dbPath, query, state, resultsEl, signal) {
+    const response = await fetch('/dashboard/api/db/query', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({
+            db_path: dbPath,
+            query: query,
+            limit: QUERY_PAGE_SIZE,
+            offset: state.rows.length,
+            stream: true
+        }),
+        signal: signal
+    });
+
+    if (!response.ok) {
+        const data = await response.json().catch(() => ({}));
+        if (state.view) state.view.cancel();
+        renderResultsError(resultsEl, data.error || response.statusText);
+        return null;
+    }
+
+    // Rows arrive as NDJSON and are rendered while the rest is still downloading
+    let end = null;
+    for await (const batch of readNdjsonBatches(response)) {
+        for (const line of batch) {
+            if (Array.isArray(line)) {
+                state.rows.push(line);
+            } else if (line.type === 'columns') {
+                state.columns = line.columns;
+            } else if (line.type === 'end') {
+                end = line;
+            } else if (line.type === 'error') {
+                if (state.view) state.view.cancel();
+                renderResultsError(resultsEl, line.error);
+                return null;
+            }
+        }
+        if (state.rows.length) {
+            state.view = state.view || createResultsView(resultsEl, state.columns, state.rows);
+            state.view.update();
+        }
+    }
+    return end;
+}
+
+// Parse an NDJSON response body, yielding the lines decoded from each network chunk.
+// The body is decoded incrementally, so the full result never exists as one string.
+async function* readNdjsonBatches(response) {
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffered = '';
+    while (true) {
+        const {value, done} = await reader.read();
+        if (done) break;
+        buffered += value;
+        // A long row can span many chunks; only rescan once it is complete
+        if (!value.includes('\n')) continue;
+        const lines = buffered.split('\n');
+        buffered = lines.pop();
+        const parsed = lines.filter(line => line).map(line => JSON.parse(line));
+        if (parsed.length) yield parsed;
+    }
+    if (buffered.trim()) yield [JSON.parse(buffered)];
+}
+
+// Results table that fills itself from a (still growing) rows array
+function createResultsView(resultsEl, columns, rows) {
+    // Build the table with DOM nodes so cell values are never parsed as HTML
+    const summary = document.createElement('p');
+    summary.style.marginBottom = '10px';
+    const summaryCount = document.createElement('strong');
+    summary.appendChild(summaryCount);
+
+    // Add scrollable container for large datasets
+    const scrollEl = document.createElement('div');
+    scrollEl.className = 'results-scroll';
+    const table = document.createElement('table');
+    table.className = 'results-table';
+    const headRow = table.createTHead().insertRow();
+    for (const col of columns) {
+        const th = document.createElement('th');
+        th.textContent = col;
+        headRow.appendChild(th);
+    }
+    const tbody = table.createTBody();
+    scrollEl.appendChild(table);
+
+    // Fetches the next server page when the query was capped
+    const footer = document.createElement('div');
+    footer.style.marginTop = '10px';
+    const loadMoreBtn = document.createElement('button');
+    loadMoreBtn.className = 'btn btn-primary';
+    loadMoreBtn.textContent = `Load next ${QUERY_PAGE_SIZE} rows`;
+    loadMoreBtn.hidden = true;
+    footer.appendChild(loadMoreBtn);
+
+    let onLoadMore = null;
+    loadMoreBtn.addEventListener('click', () => {
+        if (!onLoadMore) return;
+        loadMoreBtn.disabled = true;
+        onLoadMore();
+    });
+
+    let mounted = false;
+    let renderedRows = 0;
+    let frame = 0;
+
+    // Only the first page of rows is mounted; the rest is appended on scroll
+    const appendRows = (to) => {
+        const frag = document.createDocumentFragment();
+        for (const row of rows.slice(renderedRows, to)) {
+            const tr = document.createElement('tr');
+            for (const value of row) {
+                const td = document.createElement('td');
+                if (value === null) {
+                    const nullEl = document.createElement('em');
+                    nullEl.style.color = '#999';
+                    nullEl.textContent = 'NULL';
+                    td.appendChild(nullEl);
+                } else {
+                    td.textContent = String(value);
+                }
+                td.title = String(value);
+                tr.appendChild(td);
+            }
+            frag.appendChild(tr);
+        }
+        tbody.appendChild(frag);
+        renderedRows = to;
+    };
+
+    const render = () => {
+        frame = 0;
+        const target = Math.min(Math.max(renderedRows, RESULTS_PAGE_SIZE), rows.length);
+        if (renderedRows < target) appendRows(target);
+        summaryCount.textContent = `${rows.length}${onLoadMore ? '+' : ''} rows`;
+        if (!mounted) {
+            resultsEl.replaceChildren(summary, scrollEl, footer);
+            mounted = true;
+        }
+    };
+
+    scrollEl.addEventListener('scroll', () => {
+        if (renderedRows >= rows.length) return;
+        if (scrollEl.scrollTop + scrollEl.clientHeight < scrollEl.scrollHeight - 200) return;
+        appendRows(Math.min(renderedRows + RESULTS_PAGE_SIZE, rows.length));
+    });
+
+    return {
+        // Coalesce DOM writes for all batches that arrive within one frame
+        update() {
+            if (!frame) frame = requestAnimationFrame(render);
+        },
+        cancel() {
+            cancelAnimationFrame(frame);
+            frame = 0;
+        },
+        // Show the "load next page" button, or hide it when handler is null
+        setLoadMore(handler) {
+            onLoadMore = handler;
+            loadMoreBtn.hidden = !handler;
+            loadMoreBtn.disabled = false;
+            this.update();
+        },
+    };
+}
+
+// Show an error message in the results panel
+function renderResultsError(resultsEl, message) {
+    const errorEl = document.createElement('span');
+    errorEl.style.color = 'red';
+    errorEl.textContent = `Error: ${message}`;
+    resultsEl.replaceChildren(errorEl);
+}
+
+// Auto-refresh: the next poll is scheduled refreshMs after the previous
+// one completes, so a slow backend never accumulates queued requests
+let refreshTimer = null;
+let pollInFlight = false;
+let pollStopped = false;
+
+async function pollLoop() {
+    clearTimeout(refreshTimer);
+    if (pollInFlight) return;
+    pollInFlight = true;
+    try {
+        if (document.visibilityState === 'visible') {
+            await loadServerStatus();
+            const logName = document.getElementById('log-select').value;
+            if (logName) await loadLog();
+        }
+    } finally {
+        pollInFlight = false;
+        if (!pollStopped) refreshTimer = setTimeout(pollLoop, refreshMs);
+    }
+}
+refreshTimer = setTimeout(pollLoop, refreshMs);
+
+// Refresh immediately when the tab becomes visible again
+document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'visible') pollLoop();
+});
+
+// Release the timer when the page is unloaded or put into bfcache
+window.addEventListener('pagehide', () => {
+    pollStopped = true;
+    clearTimeout(refreshTimer);
+});
+window.addEventListener('pageshow', (event) => {
+    if (event.persisted) {
+        pollStopped = false;
+        pollLoop();
+    }
+});
+
+// Initial load (independent requests run concurrently)
+Promise.all([
+    loadServerStatus(),
+    loadEnvVariables(),
+    loadLogFiles(),
+    loadDatabases(),
+]).catch(console.error);
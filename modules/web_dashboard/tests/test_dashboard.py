@@ -2,6 +2,7 @@
 
 import json
 import pytest
+import pytest_asyncio
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
@@ -12,16 +13,17 @@ class TestDashboardService:
     """Test DashboardService functionality"""
 
     @patch('modules.web_dashboard.dashboard.UNIFIED_PID_FILE')
-    @patch('subprocess.run')
-    def test_get_server_status_running(self, mock_run, mock_pid_file):
+    @patch.object(DashboardService, '_process_name', return_value="python3")
+    @patch('os.kill')
+    def test_get_server_status_running(self, mock_kill, mock_name, mock_pid_file):
         """Test getting server status when running"""
         mock_pid_file.exists.return_value = True
-        mock_pid_file.read_text.return_value = "12345"
-
-        mock_run.return_value = Mock(returncode=0, stdout="python3")
+        mock_pid_file.read_bytes.return_value = b"12345\n"
 
         status = DashboardService.get_server_status()
 
+        mock_kill.assert_called_once_with(12345, 0)
+
         assert status["status"] == "running"
         assert status["pid"] == 12345
         assert "endpoint" in status
@@ -36,13 +38,11 @@ class TestDashboardService:
         assert status["status"] == "stopped"
 
     @patch('modules.web_dashboard.dashboard.QUICK_TUNNEL_PID_FILE')
-    @patch('subprocess.run')
-    def test_get_tunnel_status_running(self, mock_run, mock_pid_file):
+    @patch('os.kill')
+    def test_get_tunnel_status_running(self, mock_kill, mock_pid_file):
         """Test getting tunnel status when running"""
         mock_pid_file.exists.return_value = True
-        mock_pid_file.read_text.return_value = "54321"
-
-        mock_run.return_value = Mock(returncode=0)
+        mock_pid_file.read_bytes.return_value = b"54321\n"
 
         # Mock log file
         with patch('modules.web_dashboard.dashboard.LOG_DIR') as mock_log_dir:
@@ -56,16 +56,45 @@ class TestDashboardService:
         assert status["status"] == "running"
         assert status["pid"] == 54321
 
+    @patch('modules.web_dashboard.dashboard.UNIFIED_PID_FILE')
+    @patch('os.kill', side_effect=ProcessLookupError)
+    def test_get_server_status_stale_pid(self, mock_kill, mock_pid_file):
+        """Test that a PID file for an exited process reports stopped"""
+        mock_pid_file.exists.return_value = True
+        mock_pid_file.read_bytes.return_value = b"12345\n"
+
+        status = DashboardService.get_server_status()
+
+        assert status["status"] == "stopped"
+
+    def test_watched_child_reported_dead_after_exit(self):
+        """Test that a spawned process is reaped and no longer counted as alive"""
+        import subprocess
+        import sys
+        import time
+
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+        DashboardService._watch_child(process)
+        assert DashboardService._is_process_alive(process.pid) is True
+
+        deadline = time.monotonic() + 5
+        while DashboardService._is_process_alive(process.pid) and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert DashboardService._is_process_alive(process.pid) is False
+
     @patch('modules.web_dashboard.dashboard.ENV_FILE')
     def test_get_env_variables(self, mock_env_file):
         """Test reading environment variables"""
-        mock_env_file.exists.return_value = True
-        mock_env_file.read_text.return_value = """
+        content = """
 # Comment
 DATABASE_PATH=./data/test.db
 LOG_LEVEL=DEBUG
 ENABLE_OAUTH_AUTH=true
 """
+        mock_env_file.exists.return_value = True
+        mock_env_file.read_text.return_value = content
+        mock_env_file.stat.return_value = Mock(st_mtime_ns=1, st_size=len(content))
 
         env_vars = DashboardService.get_env_variables()
 
@@ -73,6 +102,36 @@ ENABLE_OAUTH_AUTH=true
         assert env_vars["LOG_LEVEL"] == "DEBUG"
         assert env_vars["ENABLE_OAUTH_AUTH"] == "true"
 
+    def test_get_env_variables_line_rules(self, tmp_path):
+        """Test that comments are skipped and keys/values are trimmed"""
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "  # DISABLED=1\n"
+            "\n"
+            " KEY = a=b \r\n"
+            "NO_EQUALS\n"
+            "EMPTY=\n"
+        )
+
+        with patch('modules.web_dashboard.dashboard.ENV_FILE', env_file):
+            env_vars = DashboardService.get_env_variables()
+
+        assert env_vars == {"KEY": "a=b", "EMPTY": ""}
+
+    def test_get_env_variables_cached_until_file_changes(self, tmp_path):
+        """Test that .env is only re-parsed after it changes"""
+        env_file = tmp_path / ".env"
+        env_file.write_text("LOG_LEVEL=INFO\n")
+
+        with patch('modules.web_dashboard.dashboard.ENV_FILE', env_file):
+            assert DashboardService.get_env_variables() == {"LOG_LEVEL": "INFO"}
+
+            with patch.object(Path, 'read_text', side_effect=AssertionError("re-read")):
+                assert DashboardService.get_env_variables() == {"LOG_LEVEL": "INFO"}
+
+            assert DashboardService.update_env_variable("LOG_LEVEL", "DEBUG") is True
+            assert DashboardService.get_env_variables() == {"LOG_LEVEL": "DEBUG"}
+
     @patch('modules.web_dashboard.dashboard.ENV_FILE')
     def test_update_env_variable_existing(self, mock_env_file):
         """Test updating existing environment variable"""
@@ -101,6 +160,18 @@ ENABLE_OAUTH_AUTH=true
         written_content = mock_env_file.write_text.call_args[0][0]
         assert "NEW_VAR=new_value" in written_content
 
+    def test_update_env_variable_same_length_patches_in_place(self, tmp_path):
+        """Test that same-size and unchanged values skip the full rewrite"""
+        env_file = tmp_path / ".env"
+        env_file.write_text("# comment\nLOG_LEVEL=INFO\nDATABASE_PATH=./db\n")
+
+        with patch('modules.web_dashboard.dashboard.ENV_FILE', env_file), \
+                patch.object(Path, 'write_text', side_effect=AssertionError("rewrite")):
+            assert DashboardService.update_env_variable("LOG_LEVEL", "WARN") is True
+            assert DashboardService.update_env_variable("DATABASE_PATH", "./db") is True
+
+        assert env_file.read_text() == "# comment\nLOG_LEVEL=WARN\nDATABASE_PATH=./db\n"
+
     @patch('modules.web_dashboard.dashboard.LOG_DIR')
     def test_get_log_files(self, mock_log_dir):
         """Test getting list of log files"""
@@ -123,24 +194,41 @@ ENABLE_OAUTH_AUTH=true
         assert log_files[1]["name"] == "unified_server.log"
         assert log_files[1]["size_mb"] == 2.0
 
-    @patch('subprocess.run')
-    @patch('modules.web_dashboard.dashboard.LOG_DIR')
-    def test_get_log_content(self, mock_log_dir, mock_run):
+    def test_get_log_content(self, tmp_path):
         """Test reading log file content"""
-        mock_log_file = Mock()
-        mock_log_file.exists.return_value = True
-        mock_log_dir.__truediv__ = Mock(return_value=mock_log_file)
-
-        mock_run.return_value = Mock(
-            stdout="Line 1\nLine 2\nLine 3"
-        )
+        log_file = tmp_path / "app.log"
+        log_file.write_text("Line 1\nLine 2\nLine 3\n")
 
-        content = DashboardService.get_log_content("app.log", lines=100)
+        with patch('modules.web_dashboard.dashboard.LOG_DIR', tmp_path):
+            content = DashboardService.get_log_content("app.log", lines=100)
 
         assert "Line 1" in content
         assert "Line 2" in content
         assert "Line 3" in content
 
+    def test_get_log_content_reads_only_tail(self, tmp_path):
+        """Test that only the last N lines are returned from a large log"""
+        log_file = tmp_path / "app.log"
+        log_file.write_text("".join(f"Line {i}\n" for i in range(20000)))
+
+        with patch('modules.web_dashboard.dashboard.LOG_DIR', tmp_path):
+            content = DashboardService.get_log_content("app.log", lines=3)
+
+        assert content.splitlines() == ["Line 19997", "Line 19998", "Line 19999"]
+
+    def test_iter_log_tail_chunks(self, tmp_path):
+        """Test that the log tail is yielded in bounded chunks"""
+        log_file = tmp_path / "app.log"
+        log_file.write_bytes(b"first\nsecond\nthird")
+
+        with patch('modules.web_dashboard.dashboard.LOG_DIR', tmp_path):
+            chunks = list(DashboardService.iter_log_tail("app.log", lines=2, chunk_size=4))
+            everything = b"".join(DashboardService.iter_log_tail("app.log", lines=10))
+
+        assert all(len(chunk) <= 4 for chunk in chunks)
+        assert b"".join(chunks) == b"second\nthird"
+        assert everything == b"first\nsecond\nthird"
+
     def test_get_endpoints_info_local(self):
         """Test getting endpoints info without tunnel"""
         info = DashboardService.get_endpoints_info()
@@ -157,8 +245,125 @@ ENABLE_OAUTH_AUTH=true
 
         assert info["base_url"] == tunnel_url
         assert info["services"][0]["url"] == f"{tunnel_url}/mail-query/"
+        assert DashboardService.get_endpoints_info(tunnel_url) is info
         assert info["oauth"]["authorize"] == f"{tunnel_url}/oauth/authorize"
 
+    def test_get_database_tables_is_cached(self, tmp_path):
+        """Test that table listing is served from cache until invalidated"""
+        import sqlite3
+
+        db_path = str(tmp_path / "test.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE first (id INTEGER)")
+        conn.commit()
+
+        DashboardService.invalidate_db_cache()
+        assert DashboardService.get_database_tables(db_path) == ["first"]
+
+        conn.execute("CREATE TABLE second (id INTEGER)")
+        conn.commit()
+        conn.close()
+
+        assert DashboardService.get_database_tables(db_path) == ["first"]
+
+        DashboardService.invalidate_db_cache()
+        assert DashboardService.get_database_tables(db_path) == ["first", "second"]
+
+    def test_iter_query_rows_streams_ndjson(self, tmp_path):
+        """Test that query rows are emitted as NDJSON header, rows and end marker"""
+        import sqlite3
+
+        db_path = str(tmp_path / "test.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE items (id INTEGER, name TEXT)")
+        conn.executemany("INSERT INTO items VALUES (?, ?)", [(1, "a"), (2, None)])
+        conn.commit()
+        conn.close()
+
+        lines = [
+            json.loads(line)
+            for chunk in DashboardService.iter_query_rows(db_path, "SELECT * FROM items")
+            for line in chunk.splitlines()
+        ]
+
+        assert lines[0] == {"type": "columns", "columns": ["id", "name"]}
+        assert lines[1:3] == [[1, "a"], [2, None]]
+        assert lines[3] == {"type": "end", "row_count": 2, "has_more": False}
+
+    def test_query_limit_pages_with_offset(self, tmp_path):
+        """Test that capped SELECTs report has_more and page with offset"""
+        import sqlite3
+
+        db_path = str(tmp_path / "test.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE items (id INTEGER)")
+        conn.executemany("INSERT INTO items VALUES (?)", [(i,) for i in range(5)])
+        conn.commit()
+        conn.close()
+
+        first = DashboardService.query_database(db_path, "SELECT * FROM items", limit=3)
+        assert [row["id"] for row in first["rows"]] == [0, 1, 2]
+        assert first["has_more"] is True
+
+        lines = [
+            json.loads(line)
+            for chunk in DashboardService.iter_query_rows(db_path, "SELECT * FROM items", 3, 3)
+            for line in chunk.splitlines()
+        ]
+        assert lines[1:3] == [[3], [4]]
+        assert lines[-1] == {"type": "end", "row_count": 2, "has_more": False}
+
+    def test_query_limit_wraps_with_and_limited_queries(self, tmp_path):
+        """Test that WITH queries are paged and a user LIMIT stays inside the subquery"""
+        import sqlite3
+
+        db_path = str(tmp_path / "test.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE items (id INTEGER)")
+        conn.executemany("INSERT INTO items VALUES (?)", [(i,) for i in range(5)])
+        conn.commit()
+        conn.close()
+
+        with_query = "WITH t AS (SELECT id FROM items) SELECT * FROM t ORDER BY id;"
+        paged = DashboardService.query_database(db_path, with_query, limit=2, offset=1)
+        assert [row["id"] for row in paged["rows"]] == [1, 2]
+        assert paged["has_more"] is True
+
+        limited = DashboardService.query_database(
+            db_path, "SELECT * FROM items ORDER BY id LIMIT 4 -- first four", limit=3
+        )
+        assert [row["id"] for row in limited["rows"]] == [0, 1, 2]
+        assert limited["has_more"] is True
+
+    def test_iter_query_rows_reports_errors(self, tmp_path):
+        """Test that SQL errors are reported as an error line"""
+        db_path = str(tmp_path / "test.db")
+
+        lines = list(DashboardService.iter_query_rows(db_path, "SELECT * FROM missing"))
+
+        assert json.loads(lines[-1])["type"] == "error"
+
+    def test_dump_json_encodes_blobs_and_rejects_unknown_types(self):
+        """Test that BLOB bytes are hex-encoded and other unsupported types raise"""
+        from modules.web_dashboard.dashboard import dump_json
+
+        assert json.loads(dump_json([1, b"\x00\xff", None])) == [1, "00ff", None]
+        with pytest.raises(TypeError):
+            dump_json({"value": object()})
+
+
+@pytest_asyncio.fixture
+async def client():
+    """ASGI test client for the dashboard routes"""
+    import httpx
+    from starlette.applications import Starlette
+    from modules.web_dashboard.dashboard import create_dashboard_routes
+
+    app = Starlette(routes=create_dashboard_routes())
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
 
 @pytest.mark.asyncio
 class TestDashboardAPI:
@@ -187,6 +392,7 @@ class TestDashboardAPI:
         expected_paths = [
             "/dashboard",
             "/dashboard/api/status",
+            "/dashboard/api/status_full",
             "/dashboard/api/endpoints",
             "/dashboard/api/env",
             "/dashboard/api/logs",
@@ -201,6 +407,164 @@ class TestDashboardAPI:
             assert any(expected_path in path for path in route_paths), \
                 f"Expected path {expected_path} not found in routes"
 
+    @patch('modules.web_dashboard.dashboard.DashboardAuth.verify_session', return_value=True)
+    @patch('modules.web_dashboard.dashboard.DashboardService.get_tunnel_status')
+    @patch('modules.web_dashboard.dashboard.DashboardService.get_server_status')
+    async def test_status_full_includes_endpoints(self, mock_server, mock_tunnel, mock_session, client):
+        """Test that batched status endpoint returns status and endpoints together"""
+        tunnel_url = "https://test-tunnel.trycloudflare.com"
+        mock_server.return_value = {"status": "stopped"}
+        mock_tunnel.return_value = {"status": "running", "pid": 54321, "url": tunnel_url}
+
+        response = await client.get("/dashboard/api/status_full")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["server"]["status"] == "stopped"
+        assert data["tunnel"]["url"] == tunnel_url
+        assert data["endpoints"]["base_url"] == tunnel_url
+
+    @patch('modules.web_dashboard.dashboard.DashboardService.get_env_variables')
+    async def test_env_api_returns_304_for_matching_etag(self, mock_get_env, client):
+        """Test that unchanged env payload is answered with 304 Not Modified"""
+        mock_get_env.return_value = {"LOG_LEVEL": "DEBUG"}
+
+        first = await client.get("/dashboard/api/env")
+        etag = first.headers["etag"]
+        second = await client.get("/dashboard/api/env", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert first.json() == {"LOG_LEVEL": "DEBUG"}
+        assert second.status_code == 304
+        assert second.content == b""
+
+    @patch('modules.web_dashboard.dashboard.DashboardAuth.verify_session', return_value=True)
+    async def test_dashboard_page_is_precompressed(self, mock_session, client):
+        """Test that dashboard HTML is served gzip-encoded with a revalidating ETag"""
+        first = await client.get("/dashboard", headers={"Accept-Encoding": "gzip"})
+        second = await client.get(
+            "/dashboard", headers={"If-None-Match": first.headers["etag"]}
+        )
+
+        assert first.status_code == 200
+        assert first.headers["content-encoding"] == "gzip"
+        assert "<!DOCTYPE html>" in first.text
+        assert second.status_code == 304
+
+    @patch('modules.web_dashboard.dashboard.DashboardAuth.verify_session', return_value=True)
+    async def test_static_assets_are_versioned_and_immutable(self, mock_session, client):
+        """Test that dashboard JS/CSS are linked by content hash and cached long-term"""
+        import re
+
+        page = await client.get("/dashboard")
+        asset_paths = re.findall(r'/dashboard/static/dashboard-[0-9a-f]{12}\.(?:js|css)', page.text)
+        assets = [await client.get(path) for path in asset_paths]
+        missing = await client.get("/dashboard/static/dashboard-000000000000.js")
+
+        assert len(asset_paths) == 2
+        for asset in assets:
+            assert asset.status_code == 200
+            assert "immutable" in asset.headers["cache-control"]
+        assert missing.status_code == 404
+
+    async def test_log_content_is_streamed(self, tmp_path, client):
+        """Test that the log tail endpoint streams text with a revalidating ETag"""
+        (tmp_path / "app.log").write_text("".join(f"Line {i}\n" for i in range(500)))
+
+        with patch('modules.web_dashboard.dashboard.LOG_DIR', tmp_path):
+            first = await client.get("/dashboard/api/logs/app.log?lines=2")
+            second = await client.get(
+                "/dashboard/api/logs/app.log?lines=2",
+                headers={"If-None-Match": first.headers["etag"]}
+            )
+            missing = await client.get("/dashboard/api/logs/missing.log")
+
+        assert first.status_code == 200
+        assert first.text == "Line 498\nLine 499\n"
+        assert second.status_code == 304
+        assert missing.text == "Log file not found: missing.log"
+
+    @pytest.mark.parametrize("payload", [{"limit": "abc"}, {"offset": [1]}, {"limit": 0}, {"offset": -1}])
+    async def test_query_api_rejects_bad_paging(self, tmp_path, client, payload):
+        """Test that non-integer or out-of-range limit/offset is answered with 400"""
+        body = {"db_path": str(tmp_path / "test.db"), "query": "SELECT 1", **payload}
+
+        response = await client.post("/dashboard/api/db/query", json=body)
+
+        assert response.status_code == 400
+
+    async def test_query_api_coerces_string_paging(self, tmp_path, client):
+        """Test that numeric strings for limit/offset are accepted"""
+        body = {
+            "db_path": str(tmp_path / "test.db"),
+            "query": "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 5) SELECT x FROM n",
+            "limit": "2",
+            "offset": "1",
+        }
+
+        response = await client.post("/dashboard/api/db/query", json=body)
+
+        assert response.status_code == 200
+        assert [row["x"] for row in response.json()["rows"]] == [2, 3]
+
+    async def test_query_api_streams_ndjson(self, tmp_path, client):
+        """Test that stream=true returns the NDJSON rows from the worker-thread iterator"""
+        body = {"db_path": str(tmp_path / "test.db"), "query": "SELECT 1 AS one", "stream": True}
+
+        response = await client.post("/dashboard/api/db/query", json=body)
+
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {"type": "columns", "columns": ["one"]},
+            [1],
+            {"type": "end", "row_count": 1, "has_more": False},
+        ]
+
+    @patch('modules.web_dashboard.dashboard.DashboardAuth.verify_session', return_value=True)
+    async def test_query_stream_holds_db_slot_until_done(self, mock_session, tmp_path):
+        """Test that an open NDJSON stream keeps its db semaphore slot until it ends"""
+        import asyncio
+        import threading
+        import time
+        import httpx
+        from starlette.applications import Starlette
+        from modules.web_dashboard.dashboard import create_dashboard_routes
+
+        events = []
+        started = threading.Event()
+
+        def slow_rows(*args):
+            events.append("stream-start")
+            started.set()
+            time.sleep(0.2)
+            yield b"[1]\n"
+            events.append("stream-end")
+
+        def list_databases():
+            events.append("list")
+            return []
+
+        with patch('modules.web_dashboard.dashboard.DB_CONCURRENCY', 1), \
+                patch.object(DashboardService, 'iter_query_rows', side_effect=slow_rows), \
+                patch.object(DashboardService, 'get_database_list', side_effect=list_databases):
+            app = Starlette(routes=create_dashboard_routes())
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+                async def list_while_streaming():
+                    await asyncio.to_thread(started.wait, 5)
+                    return await client.get("/dashboard/api/databases")
+
+                body = {"db_path": str(tmp_path / "test.db"), "query": "SELECT 1", "stream": True}
+                stream, listing = await asyncio.gather(
+                    client.post("/dashboard/api/db/query", json=body),
+                    list_while_streaming(),
+                )
+
+        assert stream.text == "[1]\n"
+        assert listing.status_code == 200
+        assert events == ["stream-start", "stream-end", "list"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,17 @@
+"""tests/ 공용 pytest fixture"""
+
+import pytest
+
+
+@pytest.fixture
+def dcr_service(tmp_path, monkeypatch):
+    """임시 DB를 사용하는 DCRService"""
+    monkeypatch.setenv("DCR_DATABASE_PATH", str(tmp_path / "dcr.db"))
+    monkeypatch.setenv("DCR_AZURE_CLIENT_ID", "test-application-id")
+    monkeypatch.setenv("DCR_AZURE_CLIENT_SECRET", "test-client-secret")
+    monkeypatch.setenv("DCR_AZURE_TENANT_ID", "common")
+
+    # 수집(collection) 단계에서 설정/DB 모듈을 불러오지 않도록 지연 import
+    from modules.dcr_oauth import DCRService
+
+    return DCRService()
@@ -0,0 +1,25 @@
+"""핸들러 테스트 스크립트 공용 실행 헬퍼"""
+
+import asyncio
+import io
+import sys
+from typing import Any, Awaitable, Callable, List, TextIO
+
+try:
+    from uvloop import run as run_async
+except ImportError:  # uvloop 미설치 환경(Windows 등)은 기본 이벤트 루프 사용
+    from asyncio import run as run_async
+
+__all__ = ["run_async", "gather_buffered"]
+
+
+async def gather_buffered(*calls: Callable[[TextIO], Awaitable[Any]]) -> List[Any]:
+    """calls를 동시에 실행하고 각자의 출력은 호출 순서대로 stdout에 표시
+
+    각 call은 출력 스트림(out)을 인자로 받아 print(..., file=out)로 기록합니다.
+    """
+    buffers = [io.StringIO() for _ in calls]
+    results = await asyncio.gather(*(call(out) for call, out in zip(calls, buffers)))
+    for out in buffers:
+        sys.stdout.write(out.getvalue())
+    return list(results)
@@ -14,11 +14,13 @@ JSON-RPC 테스트 케이스 파일을 읽어서 실행
 """
 
 import sys
+import io
 import json
 import asyncio
+import functools
 import re
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, Dict, List, Optional, TextIO
 from datetime import datetime, timezone
 
 # 프로젝트 루트를 Python path에 추가
@@ -32,6 +34,8 @@ from modules.teams_mcp.handlers import TeamsHandlers
 from modules.onedrive_mcp.handlers import OneDriveHandlers
 from infra.core.database import get_database_manager
 
+from tests.handlers._runtime import gather_buffered, run_async
+
 
 class TestRunner:
     """JSON-RPC 테스트 실행기"""
@@ -170,24 +174,41 @@ class TestRunner:
         module: str,
         test_case: Dict[str, Any],
         test_num: int,
-        total_tests: int
+        total_tests: int,
+        out: Optional[TextIO] = None
     ) -> bool:
-        """단일 테스트 케이스 실행"""
+        """단일 테스트 케이스 실행 (출력은 버퍼에 모아 케이스당 한 번에 out(기본 stdout)에 기록)"""
+        buffer = io.StringIO()
+        try:
+            return await self._run_single_test(module, test_case, test_num, total_tests, buffer, out)
+        finally:
+            (out or sys.stdout).write(buffer.getvalue())
+
+    async def _run_single_test(
+        self,
+        module: str,
+        test_case: Dict[str, Any],
+        test_num: int,
+        total_tests: int,
+        out: io.StringIO,
+        parent: Optional[TextIO] = None
+    ) -> bool:
+        """단일 테스트 케이스 실행 - 출력은 out 버퍼에 기록 (parent는 버퍼를 내보낼 스트림)"""
         name = test_case.get("name", "Unnamed")
         enabled = test_case.get("enabled", True)
         tool = test_case.get("tool")
         arguments = test_case.get("arguments", {})
         expect = test_case.get("expect", {})
 
-        print(f"\n{'='*80}")
-        print(f"[{test_num}/{total_tests}] {name}")
-        print(f"{'='*80}")
-        print(f"📦 모듈: {module}")
-        print(f"🔧 툴: {tool}")
-        print(f"📝 인자: {json.dumps(arguments, indent=2, ensure_ascii=False)}")
+        print(f"\n{'='*80}", file=out)
+        print(f"[{test_num}/{total_tests}] {name}", file=out)
+        print(f"{'='*80}", file=out)
+        print(f"📦 모듈: {module}", file=out)
+        print(f"🔧 툴: {tool}", file=out)
+        print(f"📝 인자: {json.dumps(arguments, indent=2, ensure_ascii=False)}", file=out)
 
         if not enabled:
-            print("⏭️  SKIPPED - 비활성화됨")
+            print("⏭️  SKIPPED - 비활성화됨", file=out)
             self.results["skipped"] += 1
             return True
 
@@ -200,12 +221,12 @@ class TestRunner:
             result_text = result[0].text if result else ""
 
             # 결과 출력
-            print()
-            print("📥 결과:")
-            print("-" * 80)
-            print(result_text[:500])
+            print(file=out)
+            print("📥 결과:", file=out)
+            print("-" * 80, file=out)
+            print(result_text[:500], file=out)
             if len(result_text) > 500:
-                print(f"... (총 {len(result_text)} 글자)")
+                print(f"... (총 {len(result_text)} 글자)", file=out)
 
             # start_authentication인 경우 OAuth 콜백 대기
             if tool == "start_authentication" and "인증 URL" in result_text:
@@ -213,19 +234,22 @@ class TestRunner:
                 user_id_match = re.search(r"사용자 ID:\s*(\S+)", result_text)
                 if user_id_match:
                     user_id = user_id_match.group(1)
-                    print()
-                    print(f"🔐 OAuth 인증 프로세스 시작")
-                    print(f"   User ID: {user_id}")
-
-                    # 콜백 대기
+                    print(file=out)
+                    print(f"🔐 OAuth 인증 프로세스 시작", file=out)
+                    print(f"   User ID: {user_id}", file=out)
+
+                    # 콜백 대기 - 대기 진행 상황보다 앞선 출력을 먼저 내보냄
+                    (parent or sys.stdout).write(out.getvalue())
+                    out.seek(0)
+                    out.truncate()
                     callback_success = await self.wait_for_oauth_callback(user_id)
 
                     if not callback_success:
-                        print("❌ FAIL - OAuth 콜백 타임아웃")
+                        print("❌ FAIL - OAuth 콜백 타임아웃", file=out)
                         self.results["failed"] += 1
                         return False
                 else:
-                    print("⚠️  경고: 결과에서 user_id를 추출할 수 없어 콜백 대기를 건너뜁니다")
+                    print("⚠️  경고: 결과에서 user_id를 추출할 수 없어 콜백 대기를 건너뜁니다", file=out)
 
             # 검증
             expected_contains = expect.get("contains", [])
@@ -241,44 +265,44 @@ class TestRunner:
                 # expect가 없으면 에러가 발생하지 않았다면 성공
                 validation_passed = True
 
-            print()
+            print(file=out)
             if validation_passed:
-                print("✅ PASS")
+                print("✅ PASS", file=out)
                 self.results["passed"] += 1
                 return True
             else:
-                print("❌ FAIL - 예상된 결과를 찾을 수 없음")
-                print(f"기대값: {expected_contains}")
+                print("❌ FAIL - 예상된 결과를 찾을 수 없음", file=out)
+                print(f"기대값: {expected_contains}", file=out)
                 self.results["failed"] += 1
                 return False
 
         except Exception as e:
-            print()
-            print(f"❌ FAIL - Exception: {type(e).__name__}: {e}")
+            print(file=out)
+            print(f"❌ FAIL - Exception: {type(e).__name__}: {e}", file=out)
             self.results["failed"] += 1
             return False
 
-    async def run_module_tests(self, module: str):
-        """특정 모듈의 모든 테스트 실행"""
-        print(f"\n{'='*80}")
-        print(f"🧪 {module.upper()} 모듈 테스트 시작")
-        print(f"{'='*80}")
+    async def run_module_tests(self, module: str, out: Optional[TextIO] = None):
+        """특정 모듈의 모든 테스트 실행 (out이 None이면 stdout)"""
+        print(f"\n{'='*80}", file=out)
+        print(f"🧪 {module.upper()} 모듈 테스트 시작", file=out)
+        print(f"{'='*80}", file=out)
 
         try:
             test_data = self.load_test_cases(module)
             test_cases = test_data.get("test_cases", [])
             description = test_data.get("description", "")
 
-            print(f"📄 {description}")
-            print(f"📊 테스트 케이스: {len(test_cases)}개")
+            print(f"📄 {description}", file=out)
+            print(f"📊 테스트 케이스: {len(test_cases)}개", file=out)
 
             # 선택된 테스트 필터링
             if self.selected_tests is not None:
-                print(f"🎯 선택된 테스트: {sorted(self.selected_tests)}")
+                print(f"🎯 선택된 테스트: {sorted(self.selected_tests)}", file=out)
 
             enabled_count = sum(1 for tc in test_cases if tc.get("enabled", True))
-            print(f"✅ 활성화: {enabled_count}개")
-            print(f"⏭️  비활성화: {len(test_cases) - enabled_count}개")
+            print(f"✅ 활성화: {enabled_count}개", file=out)
+            print(f"⏭️  비활성화: {len(test_cases) - enabled_count}개", file=out)
 
             total_tests = len(test_cases)
             for i, test_case in enumerate(test_cases, 1):
@@ -287,14 +311,25 @@ class TestRunner:
                     continue
 
                 self.results["total"] += 1
-                await self.run_single_test(module, test_case, i, total_tests)
+                await self.run_single_test(module, test_case, i, total_tests, out)
 
         except FileNotFoundError as e:
-            print(f"❌ 테스트 케이스 파일을 찾을 수 없습니다: {e}")
+            print(f"❌ 테스트 케이스 파일을 찾을 수 없습니다: {e}", file=out)
         except Exception as e:
-            print(f"❌ 테스트 실행 실패: {e}")
+            print(f"❌ 테스트 실행 실패: {e}", file=out)
             import traceback
-            traceback.print_exc()
+            traceback.print_exc(file=out or sys.stdout)
+
+    async def run_modules_concurrently(self, modules: List[str]):
+        """서로 독립적인 모듈 테스트를 동시에 실행 (출력은 모듈 순서대로 표시)"""
+
+        # 핸들러 생성(모듈 import 후 DB/클라이언트 초기화)은 동기 작업이므로
+        # 스레드에서 동시에 만들어 두어 서로의 초기화 시간이 겹치도록 함
+        await asyncio.gather(*(asyncio.to_thread(self.get_handler, module) for module in modules))
+
+        await gather_buffered(
+            *(functools.partial(self.run_module_tests, module) for module in modules)
+        )
 
     def print_summary(self):
         """테스트 결과 요약 출력"""
@@ -392,8 +427,9 @@ async def main():
     if module == "all":
         if selected_tests:
             print("⚠️  경고: 'all' 모드에서는 테스트 번호 선택이 무시됩니다.")
-        for mod in ["enrollment", "mail-query", "onenote", "teams", "onedrive"]:
-            await runner.run_module_tests(mod)
+        # enrollment(계정 등록/인증)가 끝난 뒤 나머지 모듈은 서로 독립적이므로 동시에 실행
+        await runner.run_module_tests("enrollment")
+        await runner.run_modules_concurrently(["mail-query", "onenote", "teams", "onedrive"])
     else:
         await runner.run_module_tests(module)
 
@@ -401,5 +437,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = run_async(main())
     sys.exit(exit_code)
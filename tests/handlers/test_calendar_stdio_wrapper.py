@@ -3,17 +3,36 @@ Calendar MCP stdio server wrapper 메서드 테스트
 stdio_server.py에서 호출하는 handle_list_tools/handle_call_tool wrapper 테스트
 """
 
+from unittest.mock import AsyncMock, patch
+
 import pytest
+import pytest_asyncio
 from modules.calendar_mcp.handlers import CalendarHandlers
 from mcp.types import Tool, TextContent
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+
+def unwrap(result):
+    """handle_call_tool 결과의 첫 TextContent를 JSON으로 파싱"""
+    return _json.loads(result[0].text)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def calendar_handlers():
-    """CalendarHandlers 인스턴스 생성"""
+    """CalendarHandlers 인스턴스 생성 (모듈 내 테스트가 공유)"""
     return CalendarHandlers()
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def tool_list(calendar_handlers):
+    """handle_list_tools 결과를 한 번만 만들어 공유"""
+    return await calendar_handlers.handle_list_tools()
+
+
 @pytest.mark.asyncio
 async def test_handle_list_tools_wrapper_exists(calendar_handlers):
     """handle_list_tools wrapper 메서드 존재 확인"""
@@ -29,9 +48,9 @@ async def test_handle_call_tool_wrapper_exists(calendar_handlers):
 
 
 @pytest.mark.asyncio
-async def test_handle_list_tools_returns_tools(calendar_handlers):
+async def test_handle_list_tools_returns_tools(tool_list):
     """handle_list_tools가 Tool 리스트를 반환하는지 확인"""
-    result = await calendar_handlers.handle_list_tools()
+    result = tool_list
 
     # 리스트 타입 확인
     assert isinstance(result, list)
@@ -48,11 +67,9 @@ async def test_handle_list_tools_returns_tools(calendar_handlers):
 
 
 @pytest.mark.asyncio
-async def test_handle_list_tools_returns_calendar_tools(calendar_handlers):
+async def test_handle_list_tools_returns_calendar_tools(tool_list):
     """handle_list_tools가 Calendar 도구들을 반환하는지 확인"""
-    result = await calendar_handlers.handle_list_tools()
-
-    tool_names = [tool.name for tool in result]
+    tool_names = {tool.name for tool in tool_list}
 
     # 필수 Calendar 도구들
     expected_tools = [
@@ -81,8 +98,7 @@ async def test_handle_call_tool_invalid_tool(calendar_handlers):
     assert isinstance(result[0], TextContent)
 
     # 오류 메시지 확인
-    import json
-    response = json.loads(result[0].text)
+    response = unwrap(result)
     assert response.get("success") is False
     assert "알 수 없는 도구" in response.get("message", "")
 
@@ -102,8 +118,7 @@ async def test_handle_call_tool_missing_arguments(calendar_handlers):
     assert isinstance(result[0], TextContent)
 
     # 응답에 오류가 포함되어야 함
-    import json
-    response = json.loads(result[0].text)
+    response = unwrap(result)
     # 토큰이 없거나 오류가 발생해야 함
     assert "success" in response
 
@@ -111,16 +126,15 @@ async def test_handle_call_tool_missing_arguments(calendar_handlers):
 @pytest.mark.asyncio
 async def test_wrapper_delegates_to_original_methods(calendar_handlers):
     """wrapper가 원본 메서드를 올바르게 호출하는지 확인"""
-    # handle_list_tools wrapper 테스트
-    wrapper_result = await calendar_handlers.handle_list_tools()
-    original_result = await calendar_handlers.handle_calendar_list_tools()
-
-    # 같은 결과를 반환해야 함
-    assert len(wrapper_result) == len(original_result)
-
-    wrapper_names = [t.name for t in wrapper_result]
-    original_names = [t.name for t in original_result]
-    assert wrapper_names == original_names
+    # 원본 메서드를 대체해 도구 목록을 다시 만들지 않고 위임 여부만 확인
+    tools = [Tool(name="calendar_list_events", description="", inputSchema={"type": "object"})]
+    with patch.object(
+        calendar_handlers, "handle_calendar_list_tools", AsyncMock(return_value=tools)
+    ) as original:
+        wrapper_result = await calendar_handlers.handle_list_tools()
+
+    original.assert_awaited_once_with()
+    assert wrapper_result is tools
 
 
 @pytest.mark.asyncio
@@ -7,208 +7,90 @@ edit_page 핸들러의 다양한 action 테스트
 """
 
 import sys
-import asyncio
+import functools
 from pathlib import Path
 
+import pytest
+
 # 프로젝트 루트를 Python path에 추가
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from modules.onenote_mcp.handlers import OneNoteHandlers
 
+from tests.handlers._runtime import gather_buffered, run_async
 
-def print_test_result(test_name: str, passed: bool, details: str = ""):
-    """테스트 결과 출력"""
-    status = "✅ PASS" if passed else "❌ FAIL"
-    print(f"{status} - {test_name}")
-    if details:
-        print(f"  {details}")
-
-
-async def test_edit_page_append():
-    """edit_page (append) 핸들러 테스트"""
-    print("\n📝 [1/6] edit_page (append) 핸들러 테스트...")
-
-    try:
-        handler = OneNoteHandlers()
-        result = await handler.handle_call_tool(
-            "edit_page",
-            {
-                "user_id": "kimghw",
-                "page_id": "1-test-page",
-                "action": "append",
-                "content": "<p>끝에 추가할 내용</p>"
-            }
-        )
-        result_text = result[0].text if result else ""
-
-        # 결과 검증
-        success = "success" in result_text.lower() or "액세스 토큰이 없습니다" in result_text
-        print_test_result("edit_page (append)", success, result_text[:200])
-
-        return success
-
-    except Exception as e:
-        print_test_result("edit_page (append)", False, f"Exception: {e}")
-        return False
-
-
-async def test_edit_page_prepend():
-    """edit_page (prepend) 핸들러 테스트"""
-    print("\n📝 [2/6] edit_page (prepend) 핸들러 테스트...")
-
-    try:
-        handler = OneNoteHandlers()
-        result = await handler.handle_call_tool(
-            "edit_page",
-            {
-                "user_id": "kimghw",
-                "page_id": "1-test-page",
-                "action": "prepend",
-                "content": "<p>시작에 추가할 내용</p>"
-            }
-        )
-        result_text = result[0].text if result else ""
-
-        # 결과 검증
-        success = "success" in result_text.lower() or "액세스 토큰이 없습니다" in result_text
-        print_test_result("edit_page (prepend)", success, result_text[:200])
-
-        return success
-
-    except Exception as e:
-        print_test_result("edit_page (prepend)", False, f"Exception: {e}")
-        return False
-
-
-async def test_edit_page_insert():
-    """edit_page (insert) 핸들러 테스트"""
-    print("\n📝 [3/6] edit_page (insert) 핸들러 테스트...")
-
-    try:
-        handler = OneNoteHandlers()
-        result = await handler.handle_call_tool(
-            "edit_page",
-            {
-                "user_id": "kimghw",
-                "page_id": "1-test-page",
-                "action": "insert",
-                "target": "#p:test-guid",
-                "position": "after",
-                "content": "<p>특정 위치에 삽입할 내용</p>"
-            }
-        )
-        result_text = result[0].text if result else ""
-
-        # 결과 검증
-        success = "success" in result_text.lower() or "액세스 토큰이 없습니다" in result_text
-        print_test_result("edit_page (insert)", success, result_text[:200])
-
-        return success
-
-    except Exception as e:
-        print_test_result("edit_page (insert)", False, f"Exception: {e}")
-        return False
-
-
-async def test_edit_page_replace():
-    """edit_page (replace) 핸들러 테스트"""
-    print("\n📝 [4/6] edit_page (replace) 핸들러 테스트...")
-
-    try:
-        handler = OneNoteHandlers()
-        result = await handler.handle_call_tool(
-            "edit_page",
-            {
-                "user_id": "kimghw",
-                "page_id": "1-test-page",
-                "action": "replace",
-                "target": "#p:test-guid",
-                "content": "<p>교체할 내용</p>"
-            }
-        )
-        result_text = result[0].text if result else ""
-
-        # 결과 검증
-        success = "success" in result_text.lower() or "액세스 토큰이 없습니다" in result_text
-        print_test_result("edit_page (replace)", success, result_text[:200])
-
-        return success
 
-    except Exception as e:
-        print_test_result("edit_page (replace)", False, f"Exception: {e}")
-        return False
+@functools.lru_cache(maxsize=1)
+def get_handler() -> OneNoteHandlers:
+    """공유 OneNoteHandlers 인스턴스 반환 (첫 호출 시 생성, 이후 재사용)"""
+    return OneNoteHandlers()
 
 
-async def test_edit_page_clean():
-    """edit_page (clean) 핸들러 테스트"""
-    print("\n🧹 [5/6] edit_page (clean) 핸들러 테스트...")
+def print_test_result(test_name: str, passed: bool, details: str = "", out=None):
+    """테스트 결과 출력 (out이 None이면 stdout)"""
+    status = "✅ PASS" if passed else "❌ FAIL"
+    print(f"{status} - {test_name}", file=out)
+    if details:
+        print(f"  {details}", file=out)
+
+
+# (이름, 아이콘, edit_page 인자) - user_id/page_id는 run_case에서 공통으로 채움
+CASES = [
+    ("append", "📝", {"action": "append", "content": "<p>끝에 추가할 내용</p>"}),
+    ("prepend", "📝", {"action": "prepend", "content": "<p>시작에 추가할 내용</p>"}),
+    ("insert", "📝", {
+        "action": "insert",
+        "target": "#p:test-guid",
+        "position": "after",
+        "content": "<p>특정 위치에 삽입할 내용</p>"
+    }),
+    ("replace", "📝", {"action": "replace", "target": "#p:test-guid", "content": "<p>교체할 내용</p>"}),
+    ("clean with title", "🧹", {"action": "clean", "keep_title": True}),
+    ("clean all", "🧹", {"action": "clean", "keep_title": False}),
+]
+
+
+async def run_case(index: int, label: str, icon: str, extra_args: dict, out=None) -> bool:
+    """edit_page 핸들러를 주어진 action 인자로 호출하고 결과 검증"""
+    test_name = f"edit_page ({label})"
+    print(f"\n{icon} [{index}/{len(CASES)}] {test_name} 핸들러 테스트...", file=out)
 
     try:
-        handler = OneNoteHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "edit_page",
-            {
-                "user_id": "kimghw",
-                "page_id": "1-test-page",
-                "action": "clean",
-                "keep_title": True
-            }
+            {"user_id": "kimghw", "page_id": "1-test-page", **extra_args}
         )
         result_text = result[0].text if result else ""
 
         # 결과 검증
         success = "success" in result_text.lower() or "액세스 토큰이 없습니다" in result_text
-        print_test_result("edit_page (clean with title)", success, result_text[:200])
+        print_test_result(test_name, success, result_text[:200], out)
 
         return success
 
     except Exception as e:
-        print_test_result("edit_page (clean with title)", False, f"Exception: {e}")
+        print_test_result(test_name, False, f"Exception: {e}", out)
         return False
 
 
-async def test_edit_page_clean_all():
-    """edit_page (clean all) 핸들러 테스트"""
-    print("\n🧹 [6/6] edit_page (clean all) 핸들러 테스트...")
-
-    try:
-        handler = OneNoteHandlers()
-        result = await handler.handle_call_tool(
-            "edit_page",
-            {
-                "user_id": "kimghw",
-                "page_id": "1-test-page",
-                "action": "clean",
-                "keep_title": False
-            }
-        )
-        result_text = result[0].text if result else ""
-
-        # 결과 검증
-        success = "success" in result_text.lower() or "액세스 토큰이 없습니다" in result_text
-        print_test_result("edit_page (clean all)", success, result_text[:200])
-
-        return success
-
-    except Exception as e:
-        print_test_result("edit_page (clean all)", False, f"Exception: {e}")
-        return False
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "index, label, icon, extra_args",
+    [(index, *case) for index, case in enumerate(CASES, 1)],
+    ids=[case[0] for case in CASES],
+)
+async def test_edit_page(index, label, icon, extra_args):
+    """edit_page action별 핸들러 테스트 (pytest)"""
+    assert await run_case(index, label, icon, extra_args)
 
 
 async def run_tests():
-    """비동기 테스트 실행"""
-    results = []
-
-    # 테스트 실행
-    results.append(await test_edit_page_append())
-    results.append(await test_edit_page_prepend())
-    results.append(await test_edit_page_insert())
-    results.append(await test_edit_page_replace())
-    results.append(await test_edit_page_clean())
-    results.append(await test_edit_page_clean_all())
-
-    return results
+    """비동기 테스트 실행 - 모든 action을 동시에 실행하고 출력은 순서대로 표시"""
+    return await gather_buffered(*(
+        functools.partial(run_case, index, *case) for index, case in enumerate(CASES, 1)
+    ))
 
 
 def main():
@@ -218,7 +100,7 @@ def main():
     print("=" * 80)
 
     # 비동기 테스트 실행
-    results = asyncio.run(run_tests())
+    results = run_async(run_tests())
 
     # 결과 요약
     print("\n" + "=" * 80)
@@ -7,7 +7,7 @@ Enrollment 모듈 핸들러 직접 테스트
 """
 
 import sys
-import asyncio
+import functools
 from pathlib import Path
 
 # 프로젝트 루트를 Python path에 추가
@@ -16,6 +16,14 @@ sys.path.insert(0, str(project_root))
 
 from modules.enrollment.mcp_server.handlers import AuthAccountHandlers
 
+from tests.handlers._runtime import run_async
+
+
+@functools.lru_cache(maxsize=1)
+def get_handler() -> AuthAccountHandlers:
+    """공유 AuthAccountHandlers 인스턴스 반환 (첫 호출 시 생성, 이후 재사용)"""
+    return AuthAccountHandlers()
+
 
 def print_test_result(test_name: str, passed: bool, details: str = ""):
     """테스트 결과 출력"""
@@ -30,7 +38,7 @@ async def test_register_account():
     print("\n🔐 [1/4] register_account 핸들러 테스트...")
 
     try:
-        handler = AuthAccountHandlers()
+        handler = get_handler()
 
         # handle_call_tool을 통해 호출
         result = await handler.handle_call_tool("register_account", {"use_env_vars": True})
@@ -52,7 +60,7 @@ async def test_list_active_accounts():
     print("\n📋 [2/4] list_active_accounts 핸들러 테스트...")
 
     try:
-        handler = AuthAccountHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool("list_active_accounts", {})
         result_text = result[0].text if result else ""
 
@@ -72,7 +80,7 @@ async def test_get_account_status():
     print("\n📊 [3/4] get_account_status 핸들러 테스트...")
 
     try:
-        handler = AuthAccountHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool("get_account_status", {"user_id": "kimghw"})
         result_text = result[0].text if result else ""
 
@@ -92,7 +100,7 @@ async def test_start_authentication():
     print("\n🔑 [4/4] start_authentication 핸들러 테스트...")
 
     try:
-        handler = AuthAccountHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool("start_authentication", {"user_id": "kimghw"})
         result_text = result[0].text if result else ""
 
@@ -127,7 +135,7 @@ def main():
     print("=" * 80)
 
     # 비동기 테스트 실행
-    results = asyncio.run(run_tests())
+    results = run_async(run_tests())
 
     # 결과 요약
     print("\n" + "=" * 80)
@@ -7,6 +7,7 @@ Mail Query 모듈 핸들러 직접 테스트
 """
 
 import sys
+import functools
 import os
 from pathlib import Path
 from datetime import timedelta
@@ -19,6 +20,12 @@ from modules.mail_query_MCP.mcp_server.handlers import MCPHandlers
 from infra.utils.datetime_utils import utc_now
 
 
+@functools.lru_cache(maxsize=1)
+def get_handler() -> MCPHandlers:
+    """공유 MCPHandlers 인스턴스 반환 (첫 호출 시 생성, 이후 재사용)"""
+    return MCPHandlers()
+
+
 def print_test_result(test_name: str, passed: bool, details: str = ""):
     """테스트 결과 출력"""
     status = "✅ PASS" if passed else "❌ FAIL"
@@ -32,7 +39,7 @@ def test_help():
     print("\n📖 [1/4] help 핸들러 테스트...")
 
     try:
-        handler = MCPHandlers()
+        handler = get_handler()
         result = handler.help()
 
         # 결과 검증
@@ -51,7 +58,7 @@ def test_query_email_help():
     print("\n📖 [2/4] query_email_help 핸들러 테스트...")
 
     try:
-        handler = MCPHandlers()
+        handler = get_handler()
         result = handler.query_email_help()
 
         # 결과 검증
@@ -70,7 +77,7 @@ def test_query_email():
     print("\n📧 [3/4] query_email 핸들러 테스트...")
 
     try:
-        handler = MCPHandlers()
+        handler = get_handler()
 
         # 최근 3일간 메일 조회 (UTC 기준)
         start_date = (utc_now() - timedelta(days=3)).strftime("%Y-%m-%d")
@@ -99,7 +106,7 @@ def test_attachment_manager():
     print("\n📎 [4/4] attachmentManager 핸들러 테스트...")
 
     try:
-        handler = MCPHandlers()
+        handler = get_handler()
 
         # 최근 3일간 PDF 첨부파일 검색 (UTC 기준)
         start_date = (utc_now() - timedelta(days=3)).strftime("%Y-%m-%d")
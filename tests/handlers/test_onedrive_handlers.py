@@ -7,7 +7,7 @@ OneDrive 모듈 핸들러 직접 테스트
 """
 
 import sys
-import asyncio
+import functools
 from pathlib import Path
 
 # 프로젝트 루트를 Python path에 추가
@@ -16,6 +16,14 @@ sys.path.insert(0, str(project_root))
 
 from modules.onedrive_mcp.handlers import OneDriveHandlers
 
+from tests.handlers._runtime import run_async
+
+
+@functools.lru_cache(maxsize=1)
+def get_handler() -> OneDriveHandlers:
+    """공유 OneDriveHandlers 인스턴스 반환 (첫 호출 시 생성, 이후 재사용)"""
+    return OneDriveHandlers()
+
 
 def print_test_result(test_name: str, passed: bool, details: str = ""):
     """테스트 결과 출력"""
@@ -30,7 +38,7 @@ async def test_list_files():
     print("\n📁 [1/5] list_files 핸들러 테스트...")
 
     try:
-        handler = OneDriveHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "list_files",
             {"user_id": "kimghw"}
@@ -58,7 +66,7 @@ async def test_list_files_with_folder():
     print("\n📁 [2/5] list_files (폴더 지정) 핸들러 테스트...")
 
     try:
-        handler = OneDriveHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "list_files",
             {
@@ -88,7 +96,7 @@ async def test_read_file():
     print("\n📄 [3/5] read_file 핸들러 테스트...")
 
     try:
-        handler = OneDriveHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "read_file",
             {
@@ -118,7 +126,7 @@ async def test_create_folder():
     print("\n📁 [4/5] create_folder 핸들러 테스트...")
 
     try:
-        handler = OneDriveHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "create_folder",
             {
@@ -148,7 +156,7 @@ async def test_write_file():
     print("\n✏️ [5/5] write_file 핸들러 테스트...")
 
     try:
-        handler = OneDriveHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "write_file",
             {
@@ -196,7 +204,7 @@ def main():
     print("=" * 80)
 
     # 비동기 테스트 실행
-    results = asyncio.run(run_tests())
+    results = run_async(run_tests())
 
     # 결과 요약
     print("\n" + "=" * 80)
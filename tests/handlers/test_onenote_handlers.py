@@ -7,7 +7,7 @@ OneNote 모듈 핸들러 직접 테스트
 """
 
 import sys
-import asyncio
+import functools
 from pathlib import Path
 
 # 프로젝트 루트를 Python path에 추가
@@ -16,21 +16,29 @@ sys.path.insert(0, str(project_root))
 
 from modules.onenote_mcp.handlers import OneNoteHandlers
 
+from tests.handlers._runtime import gather_buffered, run_async
 
-def print_test_result(test_name: str, passed: bool, details: str = ""):
-    """테스트 결과 출력"""
+
+@functools.lru_cache(maxsize=1)
+def get_handler() -> OneNoteHandlers:
+    """공유 OneNoteHandlers 인스턴스 반환 (첫 호출 시 생성, 이후 재사용)"""
+    return OneNoteHandlers()
+
+
+def print_test_result(test_name: str, passed: bool, details: str = "", out=None):
+    """테스트 결과 출력 (out이 None이면 stdout)"""
     status = "✅ PASS" if passed else "❌ FAIL"
-    print(f"{status} - {test_name}")
+    print(f"{status} - {test_name}", file=out)
     if details:
-        print(f"  {details}")
+        print(f"  {details}", file=out)
 
 
-async def test_list_sections():
+async def test_list_sections(out=None):
     """manage_sections_and_pages (list_sections) 핸들러 테스트"""
-    print("\n📁 [1/10] manage_sections_and_pages (list_sections) 핸들러 테스트...")
+    print("\n📁 [1/10] manage_sections_and_pages (list_sections) 핸들러 테스트...", file=out)
 
     try:
-        handler = OneNoteHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "manage_sections_and_pages",
             {"action": "list_sections", "user_id": "kimghw"}
@@ -39,21 +47,21 @@ async def test_list_sections():
 
         # 결과 검증
         success = "sections" in result_text.lower() or "액세스 토큰이 없습니다" in result_text
-        print_test_result("list_sections", success, result_text[:200])
+        print_test_result("list_sections", success, result_text[:200], out)
 
         return success
 
     except Exception as e:
-        print_test_result("list_sections", False, f"Exception: {e}")
+        print_test_result("list_sections", False, f"Exception: {e}", out)
         return False
 
 
-async def test_list_sections_with_filter():
+async def test_list_sections_with_filter(out=None):
     """manage_sections_and_pages (list_sections 필터링) 핸들러 테스트"""
-    print("\n📁 [2/10] manage_sections_and_pages (list_sections 필터) 핸들러 테스트...")
+    print("\n📁 [2/10] manage_sections_and_pages (list_sections 필터) 핸들러 테스트...", file=out)
 
     try:
-        handler = OneNoteHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "manage_sections_and_pages",
             {"action": "list_sections", "user_id": "kimghw", "section_name": "테스트"}
@@ -62,21 +70,21 @@ async def test_list_sections_with_filter():
 
         # 결과 검증
         success = "sections" in result_text.lower() or "액세스 토큰이 없습니다" in result_text
-        print_test_result("list_sections (필터)", success, result_text[:200])
+        print_test_result("list_sections (필터)", success, result_text[:200], out)
 
         return success
 
     except Exception as e:
-        print_test_result("list_sections (필터)", False, f"Exception: {e}")
+        print_test_result("list_sections (필터)", False, f"Exception: {e}", out)
         return False
 
 
-async def test_list_pages():
+async def test_list_pages(out=None):
     """manage_sections_and_pages (list_pages) 핸들러 테스트"""
-    print("\n📄 [3/10] manage_sections_and_pages (list_pages) 핸들러 테스트...")
+    print("\n📄 [3/10] manage_sections_and_pages (list_pages) 핸들러 테스트...", file=out)
 
     try:
-        handler = OneNoteHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "manage_sections_and_pages",
             {"action": "list_pages", "user_id": "kimghw"}
@@ -85,21 +93,21 @@ async def test_list_pages():
 
         # 결과 검증
         success = "pages" in result_text.lower() or "액세스 토큰이 없습니다" in result_text
-        print_test_result("list_pages (전체)", success, result_text[:200])
+        print_test_result("list_pages (전체)", success, result_text[:200], out)
 
         return success
 
     except Exception as e:
-        print_test_result("list_pages (전체)", False, f"Exception: {e}")
+        print_test_result("list_pages (전체)", False, f"Exception: {e}", out)
         return False
 
 
-async def test_list_pages_by_section():
+async def test_list_pages_by_section(out=None):
     """manage_sections_and_pages (list_pages 섹션 필터) 핸들러 테스트"""
-    print("\n📄 [4/10] manage_sections_and_pages (list_pages 섹션 필터) 핸들러 테스트...")
+    print("\n📄 [4/10] manage_sections_and_pages (list_pages 섹션 필터) 핸들러 테스트...", file=out)
 
     try:
-        handler = OneNoteHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "manage_sections_and_pages",
             {"action": "list_pages", "user_id": "kimghw", "section_id": "1-test-section"}
@@ -112,12 +120,12 @@ async def test_list_pages_by_section():
             "액세스 토큰이 없습니다" in result_text or
             "message" in result_text.lower()
         )
-        print_test_result("list_pages (섹션별)", success, result_text[:200])
+        print_test_result("list_pages (섹션별)", success, result_text[:200], out)
 
         return success
 
     except Exception as e:
-        print_test_result("list_pages (섹션별)", False, f"Exception: {e}")
+        print_test_result("list_pages (섹션별)", False, f"Exception: {e}", out)
         return False
 
 
@@ -126,7 +134,7 @@ async def test_create_section():
     print("\n📁 [5/10] manage_sections_and_pages (create_section) 핸들러 테스트...")
 
     try:
-        handler = OneNoteHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "manage_sections_and_pages",
             {
@@ -158,7 +166,7 @@ async def test_get_page_content():
     print("\n📄 [6/10] manage_page_content (get) 핸들러 테스트...")
 
     try:
-        handler = OneNoteHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "manage_page_content",
             {"action": "get", "user_id": "kimghw", "page_id": "1-test-page"}
@@ -185,7 +193,7 @@ async def test_create_page():
     print("\n📝 [7/10] manage_page_content (create) 핸들러 테스트...")
 
     try:
-        handler = OneNoteHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "manage_page_content",
             {
@@ -214,7 +222,7 @@ async def test_delete_page():
     print("\n🗑️ [8/10] manage_page_content (delete) 핸들러 테스트...")
 
     try:
-        handler = OneNoteHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "manage_page_content",
             {"action": "delete", "user_id": "kimghw", "page_id": "1-test-page"}
@@ -237,7 +245,7 @@ async def test_edit_page():
     print("\n✏️ [9/10] edit_page 핸들러 테스트...")
 
     try:
-        handler = OneNoteHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "edit_page",
             {
@@ -264,7 +272,7 @@ async def test_db_onenote_update():
     print("\n💾 [10/10] db_onenote_update 핸들러 테스트...")
 
     try:
-        handler = OneNoteHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "db_onenote_update",
             {
@@ -289,14 +297,17 @@ async def test_db_onenote_update():
 
 
 async def run_tests():
-    """비동기 테스트 실행"""
-    results = []
-
-    # 테스트 실행
-    results.append(await test_list_sections())
-    results.append(await test_list_sections_with_filter())
-    results.append(await test_list_pages())
-    results.append(await test_list_pages_by_section())
+    """비동기 테스트 실행 - 조회 테스트는 동시에, 생성/삭제/수정 테스트는 순서대로"""
+
+    # 서로 독립적인 조회(list) 테스트 [1]~[4]는 동시에 실행하고 출력은 순서대로 표시
+    results = await gather_buffered(
+        test_list_sections,
+        test_list_sections_with_filter,
+        test_list_pages,
+        test_list_pages_by_section,
+    )
+
+    # 상태를 바꾸는 테스트는 순서대로 실행
     results.append(await test_create_section())
     results.append(await test_get_page_content())
     results.append(await test_create_page())
@@ -314,7 +325,7 @@ def main():
     print("=" * 80)
 
     # 비동기 테스트 실행
-    results = asyncio.run(run_tests())
+    results = run_async(run_tests())
 
     # 결과 요약
     print("\n" + "=" * 80)
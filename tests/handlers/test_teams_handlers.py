@@ -7,7 +7,7 @@ Teams 모듈 핸들러 직접 테스트
 """
 
 import sys
-import asyncio
+import functools
 from pathlib import Path
 
 # 프로젝트 루트를 Python path에 추가
@@ -16,6 +16,14 @@ sys.path.insert(0, str(project_root))
 
 from modules.teams_mcp.handlers import TeamsHandlers
 
+from tests.handlers._runtime import run_async
+
+
+@functools.lru_cache(maxsize=1)
+def get_handler() -> TeamsHandlers:
+    """공유 TeamsHandlers 인스턴스 반환 (첫 호출 시 생성, 이후 재사용)"""
+    return TeamsHandlers()
+
 
 def print_test_result(test_name: str, passed: bool, details: str = ""):
     """테스트 결과 출력"""
@@ -30,7 +38,7 @@ async def test_list_chats():
     print("\n💬 [1/8] teams_list_chats 핸들러 테스트...")
 
     try:
-        handler = TeamsHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "teams_list_chats",
             {"user_id": "kimghw"}
@@ -53,7 +61,7 @@ async def test_get_chat_messages():
     print("\n📨 [2/8] teams_get_chat_messages 핸들러 테스트...")
 
     try:
-        handler = TeamsHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "teams_get_chat_messages",
             {
@@ -86,7 +94,7 @@ async def test_send_chat_message():
     print("\n✉️ [3/8] teams_send_chat_message 핸들러 테스트...")
 
     try:
-        handler = TeamsHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "teams_send_chat_message",
             {
@@ -119,7 +127,7 @@ async def test_help():
     print("\n📖 [4/8] teams_help 핸들러 테스트...")
 
     try:
-        handler = TeamsHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "teams_help",
             {}
@@ -147,7 +155,7 @@ async def test_list_chats_with_sorting():
     print("\n🔄 [5/8] teams_list_chats 정렬/필터링 테스트...")
 
     try:
-        handler = TeamsHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "teams_list_chats",
             {
@@ -178,7 +186,7 @@ async def test_get_messages_by_name():
     print("\n👤 [6/8] teams_get_chat_messages (이름 검색) 테스트...")
 
     try:
-        handler = TeamsHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "teams_get_chat_messages",
             {
@@ -210,7 +218,7 @@ async def test_send_message_by_name():
     print("\n📤 [7/8] teams_send_chat_message (이름 검색) 테스트...")
 
     try:
-        handler = TeamsHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "teams_send_chat_message",
             {
@@ -242,7 +250,7 @@ async def test_search_messages():
     print("\n🔍 [8/8] teams_search_messages 핸들러 테스트...")
 
     try:
-        handler = TeamsHandlers()
+        handler = get_handler()
         result = await handler.handle_call_tool(
             "teams_search_messages",
             {
@@ -294,7 +302,7 @@ def main():
     print("=" * 80)
 
     # 비동기 테스트 실행
-    results = asyncio.run(run_tests())
+    results = run_async(run_tests())
 
     # 결과 요약
     print("\n" + "=" * 80)
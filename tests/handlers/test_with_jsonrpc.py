@@ -21,7 +21,6 @@ JSON-RPC 형식으로 핸들러 직접 테스트
 
 import sys
 import json
-import asyncio
 from pathlib import Path
 
 # 프로젝트 루트를 Python path에 추가
@@ -32,6 +31,8 @@ from modules.enrollment.mcp_server.handlers import AuthAccountHandlers
 from modules.mail_query_MCP.mcp_server.handlers import MCPHandlers
 from modules.onenote_mcp.handlers import OneNoteHandlers
 
+from tests.handlers._runtime import run_async
+
 
 async def test_handler_with_jsonrpc(module: str, tool_name: str, arguments: dict):
     """JSON-RPC 형식으로 핸들러 테스트"""
@@ -178,7 +179,7 @@ def main():
         arguments = {}
 
     # 비동기 테스트 실행
-    exit_code = asyncio.run(test_handler_with_jsonrpc(module, tool_name, arguments))
+    exit_code = run_async(test_handler_with_jsonrpc(module, tool_name, arguments))
     return exit_code
 
 
@@ -1,212 +1,273 @@
 #!/usr/bin/env python3
-"""OAuth2 인증 플로우 테스트 - 완전 자동"""
+"""OAuth2 인증 플로우 테스트 - 완전 자동
+
+환경변수:
+    TEST_BASE_URL        테스트할 서버 (기본: http://localhost:8000)
+    TEST_MODE=mock       브라우저 로그인 없이 콜백에 mock authorization code를 바로 전달
+                         (서버가 해당 코드를 받아들이는 테스트 구성이어야 토큰 교환이 성공)
+    TEST_MOCK_AUTH_CODE  mock 모드에서 전달할 코드 (기본: mock-code-123)
+
+인가 서버 메타데이터(/.well-known/oauth-authorization-server)는 서버 URL별로
+~/.cache/kr365_oauth_test/ 에 1시간 동안 캐시됩니다.
+"""
 
 import os
 import sys
 import json
+import time
+import asyncio
+import contextlib
+import hashlib
 import httpx
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import threading
-import time
+from aiohttp import web
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from tests.handlers._runtime import run_async
+
 from dotenv import load_dotenv
 load_dotenv(PROJECT_ROOT / ".env", override=True)
 
 BASE_URL = os.getenv("TEST_BASE_URL", "http://localhost:8000")
-
-print("=" * 80)
-print("OAuth2 인증 플로우 테스트")
-print("=" * 80)
-print(f"서버: {BASE_URL}\n")
-
-# 콜백 받을 전역 변수
-callback_code = None
-callback_received = threading.Event()
-
-
-class CallbackHandler(BaseHTTPRequestHandler):
-    """OAuth 콜백을 받는 HTTP 핸들러"""
-
-    def do_GET(self):
-        global callback_code
-
-        # URL 파싱
-        parsed = urlparse(self.path)
-        query_params = parse_qs(parsed.query)
-
-        if parsed.path == "/oauth/callback":
-            callback_code = query_params.get("code", [None])[0]
-
-            # 응답
-            self.send_response(200)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            self.wfile.write(b"""
-                <html>
-                <body>
-                    <h1>Authentication Complete!</h1>
-                    <p>You can close this window.</p>
-                </body>
-                </html>
-            """)
-
-            # 이벤트 시그널
-            callback_received.set()
-        else:
-            self.send_response(404)
-            self.end_headers()
-
-    def log_message(self, format, *args):
-        # 로그 출력 비활성화
-        pass
-
-
-def start_callback_server():
-    """콜백 서버 시작"""
-    server = HTTPServer(("127.0.0.1", 6337), CallbackHandler)
-    server_thread = threading.Thread(target=server.serve_forever)
-    server_thread.daemon = True
-    server_thread.start()
-    return server
-
-
-# 1. 클라이언트 등록
-print("1️⃣  클라이언트 등록")
-print("-" * 80)
-
-response = httpx.post(
-    f"{BASE_URL}/oauth/register",
-    json={
-        "client_name": "Test Client",
-        "redirect_uris": ["http://localhost:6337/oauth/callback"],
-        "grant_types": ["authorization_code", "refresh_token"],
-        "scope": "offline_access User.Read Mail.ReadWrite"
-    },
-    timeout=30.0
-)
-
-print(f"← {response.status_code}")
-data = response.json()
-print(json.dumps(data, indent=2, ensure_ascii=False))
-
-client_id = data["client_id"]
-client_secret = data["client_secret"]
-redirect_uri = data["redirect_uris"][0]
-
-
-# 2. 인증 URL 생성
-print("\n2️⃣  인증 URL 생성")
-print("-" * 80)
-
-response = httpx.get(
-    f"{BASE_URL}/oauth/authorize",
-    params={
-        "client_id": client_id,
-        "redirect_uri": redirect_uri,
-        "response_type": "code",
-        "scope": "offline_access User.Read Mail.ReadWrite",
-        "state": "test123"
-    },
-    follow_redirects=False,
-    timeout=30.0
-)
-
-print(f"← {response.status_code}")
-azure_auth_url = response.headers.get("location")
-print(f"리다이렉트: {azure_auth_url[:150]}...")
-
-
-# 3. Azure 로그인 (콜백 대기)
-print("\n3️⃣  Azure 인증 플로우")
-print("-" * 80)
-
-# 로컬 콜백 서버 시작
-callback_server = start_callback_server()
-print("✅ 콜백 서버 시작: http://localhost:6337")
-
-# 브라우저에서 열기
-import webbrowser
-print(f"\n브라우저에서 Azure 로그인 페이지를 엽니다...")
-print(f"URL: {azure_auth_url[:100]}...")
-webbrowser.open(azure_auth_url)
-
-# 콜백 대기 (최대 60초)
-print("\n⏳ Azure 로그인 완료 및 콜백 대기 중...")
-if callback_received.wait(timeout=60):
-    print(f"✅ Authorization code 수신: {callback_code[:20] if callback_code else 'None'}...")
-    auth_code = callback_code
-else:
-    print("❌ 타임아웃: 콜백을 받지 못했습니다")
-    sys.exit(1)
-
-callback_server.shutdown()
-
-
-# 4. 토큰 교환
-print("\n4️⃣  토큰 교환")
-print("-" * 80)
-
-response = httpx.post(
-    f"{BASE_URL}/oauth/token",
-    data={
-        "grant_type": "authorization_code",
-        "client_id": client_id,
-        "client_secret": client_secret,
-        "code": auth_code,
-        "redirect_uri": redirect_uri
-    },
-    timeout=30.0
-)
-
-print(f"← {response.status_code}")
-data = response.json()
-print(json.dumps(data, indent=2, ensure_ascii=False))
-
-access_token = data["access_token"]
-refresh_token = data.get("refresh_token")
-
-
-# 5. 토큰 갱신
-if refresh_token:
-    print("\n5️⃣  토큰 갱신")
-    print("-" * 80)
-
-    response = httpx.post(
-        f"{BASE_URL}/oauth/token",
-        data={
-            "grant_type": "refresh_token",
-            "client_id": client_id,
-            "client_secret": client_secret,
-            "refresh_token": refresh_token
-        },
-        timeout=30.0
-    )
-
+MOCK_MODE = os.getenv("TEST_MODE") == "mock"
+
+# 모든 요청에 공통으로 쓰는 타임아웃 (연결은 짧게, 응답은 30초)
+TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+CALLBACK_TIMEOUT = 60
+MOCK_AUTH_CODE = os.getenv("TEST_MOCK_AUTH_CODE", "mock-code-123")
+
+# redirect_uri와 같은 호스트로 바인딩해야 브라우저 리다이렉트가 콜백 서버에 도달함
+CALLBACK_HOST = "localhost"
+CALLBACK_PORT = 6337
+
+# 인가 서버 메타데이터 디스크 캐시 (반복 실행 시 discovery 요청 생략)
+METADATA_CACHE_DIR = Path.home() / ".cache" / "kr365_oauth_test"
+METADATA_CACHE_TTL = 3600
+
+CALLBACK_HTML = """
+<html>
+<body>
+    <h1>Authentication Complete!</h1>
+    <p>You can close this window.</p>
+</body>
+</html>
+"""
+
+
+async def start_callback_server(port: int = CALLBACK_PORT):
+    """OAuth 콜백을 한 번 받는 aiohttp 서버 시작
+
+    Returns:
+        (runner, future) - future는 콜백으로 받은 authorization code로 완료됨
+    """
+    code_future = asyncio.get_running_loop().create_future()
+
+    async def oauth_callback(request: web.Request) -> web.Response:
+        if not code_future.done():
+            code_future.set_result(request.query.get("code"))
+        return web.Response(text=CALLBACK_HTML, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/oauth/callback", oauth_callback)
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, CALLBACK_HOST, port).start()
+    return runner, code_future
+
+
+async def discover_authorization_server(client: httpx.AsyncClient) -> dict:
+    """RFC 8414 인가 서버 메타데이터 조회 (서버 URL별로 METADATA_CACHE_TTL초 동안 디스크 캐시)"""
+    cache_path = METADATA_CACHE_DIR / f"{hashlib.sha1(BASE_URL.encode()).hexdigest()}.json"
+    try:
+        if time.time() - cache_path.stat().st_mtime < METADATA_CACHE_TTL:
+            print(f"💾 캐시 사용: {cache_path}")
+            return json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        pass  # 캐시 없음/손상 → 서버에서 다시 조회
+
+    response = await client.get("/.well-known/oauth-authorization-server")
     print(f"← {response.status_code}")
-    data = response.json()
-    print(json.dumps(data, indent=2, ensure_ascii=False))
-
-    access_token = data["access_token"]
-
-
-# 6. API 호출 테스트
-print("\n6️⃣  API 호출 (Bearer 토큰)")
-print("-" * 80)
-
-response = httpx.get(
-    f"{BASE_URL}/health",
-    headers={"Authorization": f"Bearer {access_token}"},
-    timeout=30.0
-)
-
-print(f"← {response.status_code}")
-print(json.dumps(response.json(), indent=2, ensure_ascii=False))
-
-print("\n" + "=" * 80)
-print("✅ OAuth2 플로우 테스트 완료!")
-print("=" * 80)
+    response.raise_for_status()
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(response.content)
+    return response.json()
+
+
+async def main():
+    """등록 → 인증 → 토큰 교환 → 갱신 → API 호출을 한 연결 풀로 실행"""
+    print("=" * 80)
+    print("OAuth2 인증 플로우 테스트")
+    print("=" * 80)
+    print(f"서버: {BASE_URL}\n")
+
+    # 모든 요청이 keep-alive 연결을 재사용하도록 클라이언트 하나를 공유
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+        transport=httpx.AsyncHTTPTransport(retries=1),
+    ) as client:
+        # 0. 인가 서버 메타데이터 조회
+        print("0️⃣  인가 서버 메타데이터")
+        print("-" * 80)
+
+        metadata = await discover_authorization_server(client)
+        print(f"issuer: {metadata.get('issuer')}\n")
+
+
+        # 1. 클라이언트 등록
+        print("1️⃣  클라이언트 등록")
+        print("-" * 80)
+
+        response = await client.post(
+            metadata["registration_endpoint"],
+            json={
+                "client_name": "Test Client",
+                "redirect_uris": [f"http://{CALLBACK_HOST}:{CALLBACK_PORT}/oauth/callback"],
+                "grant_types": ["authorization_code", "refresh_token"],
+                "scope": "offline_access User.Read Mail.ReadWrite"
+            }
+        )
+
+        print(f"← {response.status_code}")
+        data = response.json()
+        print(json.dumps(data, indent=2, ensure_ascii=False))
+
+        client_id = data["client_id"]
+        client_secret = data["client_secret"]
+        redirect_uri = data["redirect_uris"][0]
+
+
+        # 2. 인증 URL 생성
+        print("\n2️⃣  인증 URL 생성")
+        print("-" * 80)
+
+        response = await client.get(
+            metadata["authorization_endpoint"],
+            params={
+                "client_id": client_id,
+                "redirect_uri": redirect_uri,
+                "response_type": "code",
+                "scope": "offline_access User.Read Mail.ReadWrite",
+                "state": "test123"
+            },
+            follow_redirects=False
+        )
+
+        print(f"← {response.status_code}")
+        azure_auth_url = response.headers.get("location")
+        print(f"리다이렉트: {azure_auth_url[:150]}...")
+
+
+        # 3. Azure 로그인 (콜백 대기)
+        print("\n3️⃣  Azure 인증 플로우")
+        print("-" * 80)
+
+        # 로컬 콜백 서버 시작
+        callback_runner, code_future = await start_callback_server()
+        print(f"✅ 콜백 서버 시작: http://{CALLBACK_HOST}:{CALLBACK_PORT}")
+
+        if MOCK_MODE:
+            # 사람의 로그인 없이 콜백 서버에 mock 코드를 바로 전달
+            print(f"\n🤖 TEST_MODE=mock: mock authorization code로 콜백 호출")
+            callback_task = asyncio.create_task(
+                client.get(
+                    f"http://{CALLBACK_HOST}:{CALLBACK_PORT}/oauth/callback",
+                    params={"code": MOCK_AUTH_CODE, "state": "test123"},
+                )
+            )
+        else:
+            # 브라우저에서 열기
+            import webbrowser
+            print(f"\n브라우저에서 Azure 로그인 페이지를 엽니다...")
+            print(f"URL: {azure_auth_url[:100]}...")
+            # 브라우저 실행은 블로킹일 수 있으므로 스레드에서 실행 (콜백 서버는 계속 응답)
+            await asyncio.to_thread(webbrowser.open, azure_auth_url)
+
+        # 콜백 대기 (최대 CALLBACK_TIMEOUT초)
+        print("\n⏳ Azure 로그인 완료 및 콜백 대기 중...")
+        try:
+            auth_code = await asyncio.wait_for(code_future, timeout=CALLBACK_TIMEOUT)
+        except asyncio.TimeoutError:
+            print("❌ 타임아웃: 콜백을 받지 못했습니다")
+            sys.exit(1)
+        finally:
+            if MOCK_MODE:
+                # 타임아웃이면 아직 응답을 기다리는 mock 콜백 요청을 취소한 뒤 서버를 닫음
+                if not code_future.done():
+                    callback_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await callback_task
+            await callback_runner.cleanup()
+
+        print(f"✅ Authorization code 수신: {auth_code[:20] if auth_code else 'None'}...")
+
+
+        # 4. 토큰 교환
+        print("\n4️⃣  토큰 교환")
+        print("-" * 80)
+
+        response = await client.post(
+            metadata["token_endpoint"],
+            data={
+                "grant_type": "authorization_code",
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "code": auth_code,
+                "redirect_uri": redirect_uri
+            }
+        )
+
+        print(f"← {response.status_code}")
+        data = response.json()
+        print(json.dumps(data, indent=2, ensure_ascii=False))
+
+        access_token = data["access_token"]
+        refresh_token = data.get("refresh_token")
+
+
+        # 5. 토큰 갱신
+        if refresh_token:
+            print("\n5️⃣  토큰 갱신")
+            print("-" * 80)
+
+            response = await client.post(
+                metadata["token_endpoint"],
+                data={
+                    "grant_type": "refresh_token",
+                    "client_id": client_id,
+                    "client_secret": client_secret,
+                    "refresh_token": refresh_token
+                }
+            )
+
+            print(f"← {response.status_code}")
+            data = response.json()
+            print(json.dumps(data, indent=2, ensure_ascii=False))
+
+            access_token = data["access_token"]
+
+
+        # 6. API 호출 테스트
+        print("\n6️⃣  API 호출 (Bearer 토큰)")
+        print("-" * 80)
+
+        response = await client.get(
+            "/health",
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        print(f"← {response.status_code}")
+        print(json.dumps(response.json(), indent=2, ensure_ascii=False))
+
+    print("\n" + "=" * 80)
+    print("✅ OAuth2 플로우 테스트 완료!")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    run_async(main())
@@ -0,0 +1,147 @@
+"""
+DCR 토큰 해시 조회(dcr_token_hash) 테스트
+
+hash_token / _find_active_token / ensure_dcr_schema 동작을 임시 DB에서 확인합니다.
+
+사용법:
+    pytest tests/test_dcr_token_hash.py -v
+"""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+SCHEMA_PATH = (
+    Path(__file__).parent.parent / "modules/dcr_oauth/migrations/dcr_schema_v3.sql"
+)
+
+
+def _timestamp(delta: timedelta) -> str:
+    """CURRENT_TIMESTAMP와 비교 가능한 UTC 문자열"""
+    return (datetime.now(timezone.utc) + delta).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _insert_token(
+    dcr_service,
+    client_id: str,
+    token: str,
+    *,
+    hashed: bool,
+    status: str = "active",
+    expires_in: timedelta = timedelta(hours=1),
+) -> None:
+    dcr_service._execute_query(
+        """
+        INSERT INTO dcr_tokens (
+            dcr_token_value, dcr_client_id, dcr_token_type, azure_object_id, expires_at, dcr_status,
+            dcr_token_hash
+        ) VALUES (?, ?, 'Bearer', NULL, ?, ?, ?)
+        """,
+        (
+            dcr_service.crypto.account_encrypt_sensitive_data(token),
+            client_id,
+            _timestamp(expires_in),
+            status,
+            dcr_service.hash_token(token) if hashed else None,
+        ),
+    )
+
+
+def _stored_hashes(dcr_service, client_id: str) -> list:
+    rows = dcr_service._fetch_all(
+        "SELECT dcr_token_hash FROM dcr_tokens WHERE dcr_client_id = ?", (client_id,)
+    )
+    return [row[0] for row in rows]
+
+
+@pytest_asyncio.fixture
+async def client_id(dcr_service):
+    client = await dcr_service.register_client(
+        {
+            "client_name": "Token Hash Test Client",
+            "redirect_uris": ["http://localhost:6339/oauth/callback"],
+        }
+    )
+    return client["client_id"]
+
+
+def test_hash_token_is_sha256_hex():
+    from modules.dcr_oauth import DCRService
+
+    assert DCRService.hash_token("abc") == (
+        "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+    )
+
+
+@pytest.mark.asyncio
+async def test_hashed_lookup_hit(dcr_service, client_id):
+    _insert_token(dcr_service, client_id, "hashed-token", hashed=True)
+
+    row = dcr_service._find_active_token(
+        "hashed-token", "Bearer", ("dcr_client_id", "azure_object_id")
+    )
+    assert row == (client_id, None)
+
+
+@pytest.mark.asyncio
+async def test_legacy_row_found_and_backfilled(dcr_service, client_id):
+    _insert_token(dcr_service, client_id, "legacy-token", hashed=False)
+    assert _stored_hashes(dcr_service, client_id) == [None]
+
+    assert dcr_service.verify_bearer_token("legacy-token") == {
+        "dcr_client_id": client_id,
+        "azure_object_id": None,
+    }
+    assert _stored_hashes(dcr_service, client_id) == [
+        dcr_service.hash_token("legacy-token")
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status, expires_in",
+    [("revoked", timedelta(hours=1)), ("active", timedelta(hours=-1))],
+    ids=["revoked", "expired"],
+)
+async def test_fallback_skips_inactive_tokens(
+    dcr_service, client_id, status, expires_in
+):
+    _insert_token(
+        dcr_service,
+        client_id,
+        "stale-token",
+        hashed=False,
+        status=status,
+        expires_in=expires_in,
+    )
+
+    assert dcr_service.verify_bearer_token("stale-token") is None
+    assert _stored_hashes(dcr_service, client_id) == [None]
+
+
+def test_ensure_dcr_schema_adds_hash_column_to_existing_db(tmp_path):
+    from modules.dcr_oauth.azure_config import ensure_dcr_schema
+
+    db_path = tmp_path / "dcr.db"
+    legacy_schema = "\n".join(
+        line
+        for line in SCHEMA_PATH.read_text().splitlines()
+        if "dcr_token_hash" not in line
+    )
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(legacy_schema)
+
+    service = SimpleNamespace(config=SimpleNamespace(dcr_database_path=str(db_path)))
+    # 두 번째 호출은 duplicate column 경로를 타야 한다
+    ensure_dcr_schema(service)
+    ensure_dcr_schema(service)
+
+    with sqlite3.connect(db_path) as conn:
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(dcr_tokens)")]
+        indexes = [row[1] for row in conn.execute("PRAGMA index_list(dcr_tokens)")]
+    assert columns.count("dcr_token_hash") == 1
+    assert "idx_dcr_tokens_hash" in indexes
@@ -0,0 +1,62 @@
+"""
+enrollment YAML 파싱 캐시(account_read_enrollment_file_with_hash) 테스트
+
+사용법:
+    pytest tests/test_enrollment_file_cache.py -v
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def read_enrollment():
+    # 수집(collection) 단계에서 설정 모듈을 불러오지 않도록 지연 import
+    from modules.enrollment.account._account_helpers import AccountFileHelpers
+
+    return AccountFileHelpers.account_read_enrollment_file_with_hash
+
+
+def test_unchanged_file_is_not_reread(tmp_path, read_enrollment):
+    path = tmp_path / "user.yaml"
+    path.write_text("user_id: kimghw\n")
+
+    with patch.object(
+        Path, "read_bytes", autospec=True, side_effect=Path.read_bytes
+    ) as read_bytes:
+        first = read_enrollment(str(path))
+        second = read_enrollment(str(path))
+
+    assert read_bytes.call_count == 1
+    assert first == second == ({"user_id": "kimghw"}, first[1])
+
+
+def test_same_size_rewrite_is_detected(tmp_path, read_enrollment):
+    path = tmp_path / "user.yaml"
+    path.write_text("user_id: aaaa\n")
+    data, file_hash = read_enrollment(str(path))
+
+    # 같은 크기로 덮어쓰고 mtime만 달라지게 함 (파일시스템 시간 해상도와 무관하게)
+    mtime_ns = path.stat().st_mtime_ns
+    path.write_text("user_id: bbbb\n")
+    os.utime(path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+
+    new_data, new_hash = read_enrollment(str(path))
+
+    assert data == {"user_id": "aaaa"}
+    assert new_data == {"user_id": "bbbb"}
+    assert new_hash != file_hash
+
+
+def test_returned_data_is_a_deep_copy(tmp_path, read_enrollment):
+    path = tmp_path / "user.yaml"
+    path.write_text("oauth:\n  scopes:\n    - Mail.Read\n")
+
+    data, _ = read_enrollment(str(path))
+    data["oauth"]["scopes"].append("Mail.Send")
+
+    again, _ = read_enrollment(str(path))
+    assert again == {"oauth": {"scopes": ["Mail.Read"]}}
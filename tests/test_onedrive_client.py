@@ -0,0 +1,40 @@
+"""
+OneDrive Graph API HTTP 클라이언트 수명 주기 테스트
+
+사용법:
+    pytest tests/test_onedrive_client.py -v
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def handlers():
+    # 수집(collection) 단계에서 설정/DB 모듈을 불러오지 않도록 지연 import
+    from modules.onedrive_mcp.handlers import OneDriveHandlers
+
+    return OneDriveHandlers()
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused_and_closed(handlers):
+    handler = handlers.onedrive_handler
+    client = await handler._get_client()
+    assert await handler._get_client() is client
+
+    await handlers.aclose()
+
+    assert client.is_closed
+    assert handler._client is None
+
+
+def test_new_event_loop_gets_new_client(handlers):
+    handler = handlers.onedrive_handler
+    first = asyncio.run(handler._get_client())
+    second = asyncio.run(handler._get_client())
+
+    assert second is not first
+    assert not second.is_closed
+    asyncio.run(handlers.aclose())
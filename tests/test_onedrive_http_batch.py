@@ -0,0 +1,61 @@
+"""
+OneDrive MCP HTTP 서버 JSON-RPC batch 처리 테스트
+
+사용법:
+    pytest tests/test_onedrive_http_batch.py -v
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def client():
+    # 수집(collection) 단계에서 설정/DB 모듈을 불러오지 않도록 지연 import
+    from fastapi.testclient import TestClient
+    from modules.onedrive_mcp.mcp_server.http_server import FastAPIOneDriveServer
+
+    with TestClient(FastAPIOneDriveServer().app) as client:
+        yield client
+
+
+def test_mixed_batch_drops_notification(client):
+    response = client.post(
+        "/",
+        json=[
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "id": 2, "method": "prompts/list"},
+        ],
+    )
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == [1, 2]
+    assert response.json()[1]["result"] == {"prompts": []}
+
+
+def test_invalid_batch_item_returns_invalid_request(client):
+    response = client.post("/", json=[1])
+
+    assert response.status_code == 200
+    [error] = response.json()
+    assert error["id"] is None
+    assert error["error"]["code"] == -32600
+
+
+def test_empty_batch_returns_400(client):
+    response = client.post("/", json=[])
+
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == -32600
+
+
+def test_notification_only_batch_returns_202(client):
+    response = client.post(
+        "/",
+        json=[
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "method": "notifications/cancelled"},
+        ],
+    )
+
+    assert response.status_code == 202
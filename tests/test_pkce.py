@@ -0,0 +1,32 @@
+"""
+PKCE(RFC 7636) helper 테스트
+
+사용법:
+    pytest tests/test_pkce.py -v
+"""
+
+from modules.dcr_oauth.pkce import generate_pkce, verify_pkce
+
+# RFC 7636 Appendix B 예시 값
+RFC_VERIFIER = "dBjftJeZ4CVP-mB92K27uhbUJU1p1r_wW1gFWFOEjXk"
+RFC_CHALLENGE = "E9Melhoa2OwvFrEMTJguCHaoeK1t8URWbuGJSstw-cM"
+
+
+def test_s256_matches_rfc7636_vector():
+    assert verify_pkce(RFC_VERIFIER, RFC_CHALLENGE, "S256")
+    assert not verify_pkce(RFC_VERIFIER + "x", RFC_CHALLENGE, "S256")
+
+
+def test_generate_pkce_round_trip():
+    code_verifier, code_challenge = generate_pkce()
+
+    assert len(code_verifier) == 43
+    assert "=" not in code_challenge
+    assert verify_pkce(code_verifier, code_challenge, "S256")
+    assert not verify_pkce(generate_pkce()[0], code_challenge, "S256")
+
+
+def test_plain_and_unknown_methods():
+    assert verify_pkce("verifier", "verifier")
+    assert not verify_pkce("verifier", "other", "plain")
+    assert not verify_pkce(RFC_VERIFIER, RFC_CHALLENGE, "S512")
@@ -0,0 +1,88 @@
+"""
+DCR refresh_token grant 검증 테스트
+
+임시 DCR DB(conftest.py의 dcr_service)에서 클라이언트 등록 → 토큰 저장 →
+refresh/Bearer 토큰 검증 흐름을 확인합니다.
+
+사용법:
+    pytest tests/test_refresh_token_grant.py -v
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+
+AZURE_OBJECT_ID = "00000000-0000-0000-0000-000000000001"
+ACCESS_TOKEN = "test-access-token"
+REFRESH_TOKEN = "test-refresh-token"
+
+
+async def _register(dcr_service, name: str, port: int) -> str:
+    client = await dcr_service.register_client(
+        {
+            "client_name": name,
+            "redirect_uris": [f"http://localhost:{port}/oauth/callback"],
+            "scope": "offline_access User.Read",
+        }
+    )
+    return client["client_id"]
+
+
+@pytest_asyncio.fixture
+async def client_id(dcr_service):
+    """토큰이 저장된 DCR 클라이언트 ID"""
+    client_id = await _register(dcr_service, "Refresh Test Client", 6337)
+    dcr_service.store_tokens(
+        dcr_client_id=client_id,
+        dcr_access_token=ACCESS_TOKEN,
+        dcr_refresh_token=REFRESH_TOKEN,
+        expires_in=3600,
+        scope="offline_access User.Read",
+        azure_object_id=AZURE_OBJECT_ID,
+        azure_access_token="azure-access-token",
+        azure_refresh_token="azure-refresh-token",
+        azure_expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        user_email="tester@example.com",
+        user_name="Tester",
+    )
+    return client_id
+
+
+@pytest.mark.asyncio
+async def test_store_tokens_saves_lookup_hash(dcr_service, client_id):
+    stored = dcr_service._fetch_one(
+        "SELECT dcr_token_hash FROM dcr_tokens WHERE dcr_client_id = ? AND dcr_token_type = 'refresh'",
+        (client_id,),
+    )
+    assert stored[0] == dcr_service.hash_token(REFRESH_TOKEN)
+
+
+@pytest.mark.asyncio
+async def test_valid_refresh_token(dcr_service, client_id):
+    data = dcr_service.verify_refresh_token(REFRESH_TOKEN, client_id)
+    assert data is not None
+    assert data["azure_object_id"] == AZURE_OBJECT_ID
+    assert data["user_name"] == "Tester"
+
+
+@pytest.mark.asyncio
+async def test_invalid_refresh_token_rejected(dcr_service, client_id):
+    assert (
+        dcr_service.verify_refresh_token("invalid-refresh-token-xyz", client_id) is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_rejected_for_other_client(dcr_service, client_id):
+    other_client_id = await _register(dcr_service, "Other Test Client", 6338)
+    assert other_client_id != client_id
+    assert dcr_service.verify_refresh_token(REFRESH_TOKEN, other_client_id) is None
+
+
+@pytest.mark.asyncio
+async def test_bearer_token(dcr_service, client_id):
+    assert dcr_service.verify_bearer_token(ACCESS_TOKEN) == {
+        "dcr_client_id": client_id,
+        "azure_object_id": AZURE_OBJECT_ID,
+    }
@@ -0,0 +1,88 @@
+"""
+mail_query_MCP preprocess_arguments boolean 변환 테스트
+"""
+
+import pytest
+
+from modules.mail_query_MCP.mcp_server.utils import preprocess_arguments
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("true", True),
+        ("True", True),
+        ("TRUE", True),
+        ("tRuE", True),
+        ("yes", True),
+        ("Yes", True),
+        ("YES", True),
+        ("y", True),
+        ("Y", True),
+        ("1", True),
+        ("false", False),
+        ("False", False),
+        ("FALSE", False),
+        ("no", False),
+        ("NO", False),
+        ("n", False),
+        ("0", False),
+        ("", False),
+        ("maybe", False),
+        ("2", False),
+        (" true", False),
+        ("truee", False),
+        ("ＹＥＳ", False),
+    ],
+)
+def test_string_flags_are_coerced(value, expected):
+    """문자열 boolean 값 변환 (true/yes/y/1만 True, 대소문자 무시)"""
+    result = preprocess_arguments({"include_body": value})
+    assert result["include_body"] is expected
+
+
+@pytest.mark.parametrize("value", [True, False, 1, 0, None])
+def test_non_string_flags_are_left_alone(value):
+    """문자열이 아닌 값은 그대로 유지"""
+    assert preprocess_arguments({"save_csv": value})["save_csv"] is value
+
+
+def test_all_boolean_fields_are_coerced():
+    """모든 boolean 필드를 한 번의 호출로 변환하고 다른 필드는 유지"""
+    # 필드마다 다른 입력을 넣어 한 번의 preprocess_arguments 호출로 함께 검증
+    cases = {
+        "include_body": ("Yes", True),
+        "download_attachments": ("false", False),
+        "has_attachments_filter": ("TRUE", True),
+        "execute": ("n", False),
+        "use_defaults": ("1", True),
+        "save_emails": ("", False),
+        "save_csv": ("y", True),
+    }
+    result = preprocess_arguments(
+        {**{field: value for field, (value, _) in cases.items()}, "keyword": "yes"}
+    )
+
+    mismatches = {
+        field: result[field]
+        for field, (_, expected) in cases.items()
+        if result[field] is not expected
+    }
+    assert not mismatches
+    assert result["keyword"] == "yes"
+
+
+def test_input_arguments_are_not_mutated():
+    """입력 dict는 변경하지 않고 새 dict를 반환 (호출 측 .copy() 불필요)"""
+    arguments = {"include_body": "true", "days_back": "7", "keyword": "a\\b"}
+    snapshot = dict(arguments)
+
+    result = preprocess_arguments(arguments)
+
+    assert result is not arguments
+    assert arguments == snapshot
+    assert (result["include_body"], result["days_back"], result["keyword"]) == (
+        True,
+        7,
+        "ab",
+    )